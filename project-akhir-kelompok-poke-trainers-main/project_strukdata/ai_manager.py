@@ -1,7 +1,27 @@
 import random
 import json
 
-from components import get_pokemon_species_data, get_evolution_chain_names
+import numpy as np
+
+from components import (
+    get_dex_table,
+    get_evolution_chain_ids,
+    get_evolution_index,
+    get_pokemon_details_bulk,
+    get_pokemon_moves_bulk,
+    get_type_matrix,
+    is_known_resource,
+    peek_encyclopedia_index,
+    resolve_evolution_species_bulk,
+)
+from build_store import BuildTemplateStore
+from damage_calc import best_moves, damage_rolls, damage_summary
+from natures import STAT_LABELS, describe_nature
+from pokemon_record import STAT_NAMES
+from stat_calc import MAX_EV, compute_stats, nature_multipliers, spread_array
+from synergy_engine import SynergyRuleSet, coverage_heatmap, team_attributes
+from team_optimizer import optimize_team
+from type_chart import ATTACKING_TYPES, TYPE_INDEX, encode_type_combos
 
 POKEMON_LIST = [
     "Charmander", "Charmeleon", "Charizard", "Bulbasaur", "Ivysaur", "Venusaur", 
@@ -11,25 +31,35 @@ POKEMON_LIST = [
     "Meowscarada", "Skeledirge", "Quaquaval", "Pichu", "Raichu" 
 ]
 
-def get_banned_evolution_names(pokemon_list: list) -> list:
-    banned_names = set()
-    for name in pokemon_list:
-        species_data = get_pokemon_species_data(name.lower().strip())
-        if not species_data:
-            continue
-            
-        evolution_chain_url = species_data.get('evolution_chain', {}).get('url')
-        if evolution_chain_url:
-            chain_names = get_evolution_chain_names(evolution_chain_url)
-            
-            for c_name in chain_names:
-                banned_names.add(c_name)
-    
-    for name in pokemon_list:
-        if name.title() in banned_names:
-            banned_names.remove(name.title())
-            
-    return [name.title() for name in list(banned_names)]
+THREAT_COUNT = 100
+DEFAULT_MOVE_POWER = 90
+_ATK, _SPA = STAT_NAMES.index("attack"), STAT_NAMES.index("special-attack")
+
+_synergy_rules = None
+_build_store = None
+
+def get_synergy_rules():
+    """Aturan sinergi dari synergy_rules.json (dimuat sekali per proses)."""
+    global _synergy_rules
+    if _synergy_rules is None:
+        _synergy_rules = SynergyRuleSet.load()
+    return _synergy_rules
+
+def get_banned_evolution_names(pokemon_list: list) -> set:
+    """Semua anggota rantai evolusi dari Pokémon yang dimiliki, kecuali Pokémon itu sendiri.
+
+    Setiap rantai hanya diambil sekali walau dimiliki beberapa anggota, dan
+    species/rantai yang belum diindeks diambil paralel.
+    """
+    owned_names = {name.strip().title() for name in pokemon_list}
+    index = get_evolution_index()
+    chain_ids = {
+        index.chain_id_of(species)
+        for species in resolve_evolution_species_bulk(pokemon_list)
+        if species
+    }
+    banned_names = {name.title() for chain_id in chain_ids for name in index.chain_members(chain_id)}
+    return banned_names - owned_names
 
 
 def generate_optimized_team(theme: str = "", owned_pokemon: list = None) -> dict:
@@ -46,7 +76,7 @@ def generate_optimized_team(theme: str = "", owned_pokemon: list = None) -> dict
     theme_str = f"Tema/fokus tim yang diinginkan adalah: '{theme}'." if theme else "Tim harus seimbang (Balanced) dan kompetitif secara umum."
     
     if banned_evolution_names:
-        filter_str = f"PENTING: Jangan masukkan Pokémon berikut atau bentuk evolusinya: {', '.join(banned_evolution_names)}. Pokémon yang sudah dimiliki TIDAK BOLEH muncul lagi."
+        filter_str = f"PENTING: Jangan masukkan Pokémon berikut atau bentuk evolusinya: {', '.join(sorted(banned_evolution_names))}. Pokémon yang sudah dimiliki TIDAK BOLEH muncul lagi."
     else:
         filter_str = ""
     
@@ -62,17 +92,42 @@ def generate_optimized_team(theme: str = "", owned_pokemon: list = None) -> dict
     """
 
     try:
-        available_for_pick = [
-            p for p in POKEMON_LIST 
-            if p.title() not in owned_pokemon and p.title() not in banned_evolution_names
-        ]
-        
-        final_team = owned_pokemon
+        table = get_dex_table()
+        final_team = list(owned_pokemon)
         remaining_needed = 6 - len(owned_pokemon)
-        
-        if remaining_needed > 0:
-            complements = random.sample(available_for_pick, min(remaining_needed, len(available_for_pick)))
-            final_team.extend(complements)
+        score, breakdown = None, {}
+
+        if remaining_needed > 0 and len(table):
+            owned_details = [d for d in get_pokemon_details_bulk(owned_pokemon) if d]
+            dex_names = table.names.tolist()
+            candidate_names = [name.title() for name in dex_names]
+            allowed = np.array([
+                name not in owned_pokemon and name not in banned_evolution_names
+                for name in candidate_names
+            ], dtype=bool)
+            # Satu anggota per rantai evolusi; nama yang tidak ter-resolve menjadi grup sendiri.
+            chain_ids = get_evolution_chain_ids(dex_names)
+            groups = np.array([chain_id or -(i + 1) for i, chain_id in enumerate(chain_ids)])
+            # Rantai anggota yang sudah dimiliki dikunci lewat ID, bukan pencocokan nama.
+            owned_chain_ids = get_evolution_chain_ids([d.name for d in owned_details])
+            fixed_groups = [chain_id or -(len(dex_names) + j + 1) for j, chain_id in enumerate(owned_chain_ids)]
+
+            chosen, score, breakdown = optimize_team(
+                table.type_idx, table.stats,
+                encode_type_combos([d.types for d in owned_details]),
+                [d.stats for d in owned_details],
+                get_type_matrix(),
+                allowed=allowed, groups=groups, fixed_groups=fixed_groups, theme=theme,
+                team_size=len(owned_details) + remaining_needed,
+            )
+            final_team.extend(candidate_names[i] for i in chosen)
+        elif remaining_needed > 0:
+            # Tabel dex belum tersedia (mis. offline tanpa mirror): pilih dari daftar statis.
+            available_for_pick = [
+                p for p in POKEMON_LIST 
+                if p.title() not in owned_pokemon and p.title() not in banned_evolution_names
+            ]
+            final_team.extend(random.sample(available_for_pick, min(remaining_needed, len(available_for_pick))))
         
         if owned_pokemon:
             reason = (
@@ -83,12 +138,19 @@ def generate_optimized_team(theme: str = "", owned_pokemon: list = None) -> dict
             reason = (
                 f"Tim ini dirancang untuk {theme or 'keseimbangan umum'} dengan sinergi tipe yang baik dan cakupan serangan yang luas."
             )
+        if breakdown:
+            reason += (
+                f" Skor pertahanan tipe {breakdown['defensive']:.2f}, cakupan STAB {breakdown['offensive']:.2f}, "
+                f"rata-rata base stat {breakdown['stats'] * 600:.0f}."
+            )
             
         final_team = [p.title() for p in final_team][:6] 
 
         return {
             "team": final_team,
-            "reason": reason
+            "reason": reason,
+            "score": score,
+            "breakdown": breakdown
         }
 
     except Exception as e:
@@ -214,31 +276,18 @@ def generate_synergy_combo(team_list: list) -> str:
     if not team_list:
         return "Tim kosong. Tambahkan Pokémon ke Deck Tersimpan Anda untuk menganalisis sinergi."
 
-    team_names = [p.title() for p in team_list]
-    
     synergy_report = "### 💡 Analisis Sinergi Tim (AI)"
-    
-    found_synergy = False
-    
-    if "Whimsicott" in team_names and any(p in team_names for p in ["Garchomp", "Dragapult", "Cinderace"]):
-        synergy_report += (
-            "\n\n**🎯 Kombo Tailwind + Wallbreaker:** Kehadiran **Whimsicott** (dengan **Tailwind** - diasumsikan) dapat menggandakan kecepatan tim Anda. Ini memungkinkan **Garchomp** atau **Dragapult** untuk menyerang pertama dan menghancurkan lawan sebelum mereka bergerak. *(Sinergi Speed Control)*"
-        )
-        found_synergy = True
-        
-    if "Venusaur" in team_names and "Charizard" in team_names:
-        synergy_report += (
-            "\n\n**☀️ Kombo Weather (Sun) - Growth:** Sinergi tipe Fire/Grass yang kuat! Jika **Charizard** (dengan Ability Drought atau dukungan Weather) memanggil Matahari, **Venusaur** dapat memanfaatkan Ability **Chlorophyll** untuk peningkatan Speed drastis atau Move **Growth** yang lebih kuat. *(Sinergi Weather)*"
-        )
-        found_synergy = True
-        
-    if "Arcanine" in team_names and "Milotic" in team_names:
-        synergy_report += (
-            "\n\n**🛡️ Kombo Anti-Intimidate:** Walaupun keduanya ada dalam tim, jika lawan mencoba menggunakan **Intimidate** (misalnya pada Arcanine Anda), **Milotic** dapat mengaktifkan Ability **Competitive**-nya untuk meningkatkan Special Attack secara drastis! *(Sinergi Ability Counter)*"
-        )
-        found_synergy = True
-        
-    if not found_synergy:
+
+    rules = get_synergy_rules()
+    details = [d for d in get_pokemon_details_bulk(team_list) if d]
+    # Learnset hanya diambil jika ada aturan berbasis move.
+    moves_by_name = get_pokemon_moves_bulk([d.name for d in details]) if rules.uses_moves else None
+    fired = rules.evaluate(team_attributes(details, moves_by_name))
+
+    for rule in fired:
+        synergy_report += f"\n\n**{rule['title']}:** {rule['text']}"
+
+    if not fired:
         if len(team_list) >= 3:
             synergy_report += (
                 "\n\n**📝 Saran Umum:** Tidak ada kombo sinergi yang jelas ditemukan. AI merekomendasikan: "
@@ -251,54 +300,123 @@ def generate_synergy_combo(team_list: list) -> str:
 
     return synergy_report
 
+def get_team_coverage(team_list: list):
+    """Heatmap cakupan deck: (nama anggota, defensive (T, 18), offensive (T, 18))."""
+    details = [d for d in get_pokemon_details_bulk(team_list) if d]
+    defensive, offensive = coverage_heatmap(get_type_matrix(), details)
+    return [d.name for d in details], defensive, offensive
+
+def _template_moves(build_set, moves_table):
+    """Move penyerang dari set template: daftar (nama, power, indeks tipe, fisik?); move status dilewati."""
+    moves = []
+    for slug in build_set.get("moves", []):
+        row = moves_table.row_of(slug)
+        if row is None:
+            continue
+        power = moves_table.columns["power"][row]
+        damage_class = str(moves_table.columns["damage_class"][row])
+        move_type = TYPE_INDEX.get(str(moves_table.columns["type"][row]), len(ATTACKING_TYPES))
+        if np.isnan(power) or damage_class not in ("physical", "special") or move_type >= len(ATTACKING_TYPES):
+            continue
+        moves.append((_pretty(slug), int(power), move_type, damage_class == "physical"))
+    return moves
+
+def _attacker_setup(detail, moves_table):
+    """(moves, EV (6,), multiplier nature) penyerang: set template pertama bila ada,
+    jika tidak move STAB generik 90 BP pada stat serang tertinggi dengan 252 EV."""
+    sets = get_build_store().get(detail.name)
+    if sets and moves_table is not None:
+        moves = _template_moves(sets[0], moves_table)
+        if moves:
+            return moves, spread_array(sets[0].get("evs", {})), nature_multipliers(sets[0].get("nature", ""))
+
+    physical = detail.stats[_ATK] >= detail.stats[_SPA]
+    evs = spread_array({"attack" if physical else "special-attack": MAX_EV, "speed": MAX_EV})
+    moves = [
+        (f"STAB {t.title()} ({DEFAULT_MOVE_POWER} BP)", DEFAULT_MOVE_POWER, TYPE_INDEX[t], physical)
+        for t in detail.types if t in ATTACKING_TYPES
+    ]
+    return moves, evs, nature_multipliers("")
+
+def get_damage_matchups(team_list: list, threat_count: int = THREAT_COUNT, level: int = 50, threat_evs: dict = None):
+    """Matriks damage deck vs ancaman teratas (BST tertinggi di dex) dalam satu pass NumPy.
+
+    Ancaman diasumsikan IV 31, nature netral, dan `threat_evs` (default 252 HP).
+    Mengembalikan dict members/threats dan array (T, K) move terbaik, min_pct,
+    max_pct, ohko; atau None jika deck atau dex kosong.
+    """
+    details = [d for d in get_pokemon_details_bulk(team_list) if d]
+    table = get_dex_table()
+    if not details or not len(table):
+        return None
+
+    # Move template hanya dipakai bila ensiklopedia sudah tersedia; halaman ini tidak membangunnya.
+    index = peek_encyclopedia_index()
+    setups = [_attacker_setup(d, index.tables.get("move") if index else None) for d in details]
+    width = max(1, max(len(moves) for moves, _, _ in setups))
+    power = np.zeros((len(details), width), dtype=np.int64)
+    move_type = np.zeros((len(details), width), dtype=np.intp)
+    physical = np.zeros((len(details), width), dtype=bool)
+    move_names = np.full((len(details), width), "-", dtype=object)
+    for i, (moves, _, _) in enumerate(setups):
+        for j, (name, move_power, type_idx, is_physical) in enumerate(moves):
+            move_names[i, j], power[i, j], move_type[i, j], physical[i, j] = name, move_power, type_idx, is_physical
+
+    atk_stats = compute_stats(
+        np.array([d.stats for d in details], dtype=np.int64), level,
+        evs=np.stack([evs for _, evs, _ in setups]),
+        nature_mult=np.stack([nature for _, _, nature in setups]),
+    )
+    threats = np.argsort(-table.stats.sum(axis=1, dtype=np.int64), kind="stable")[:threat_count]
+    def_stats = compute_stats(table.stats[threats], level, evs=spread_array(threat_evs or {"hp": MAX_EV}))
+
+    damage = damage_rolls(
+        level, power, move_type, physical, atk_stats, encode_type_combos([d.types for d in details]),
+        def_stats, table.type_idx[threats], get_type_matrix(),
+    )
+    summary = damage_summary(damage, def_stats)
+    best = best_moves(summary)[:, None, :]
+    result = {key: np.take_along_axis(values, best, axis=1)[:, 0, :] for key, values in summary.items()}
+    result["moves"] = np.take_along_axis(move_names, best[:, 0, :], axis=1)
+    result["members"] = [d.name for d in details]
+    result["threats"] = table.names[threats].tolist()
+    return result
+
+def get_build_store():
+    """Store template build per species (direktori didaftar sekali per proses)."""
+    global _build_store
+    if _build_store is None:
+        _build_store = BuildTemplateStore(validator=is_known_resource)
+    return _build_store
+
+def _pretty(slug):
+    return slug.replace('-', ' ').title()
+
+def _format_build_set(name_title, build_set):
+    """Set template (slug) -> dict tampilan yang dipakai halaman Build."""
+    evs = build_set.get("evs", {})
+    return {
+        "name": name_title,
+        "Set": build_set.get("name", "Standard"),
+        "Role": build_set.get("role", "-"),
+        "Item": _pretty(build_set.get("item", "-")),
+        "Ability": _pretty(build_set.get("ability", "-")),
+        "Moveset": [_pretty(m) for m in build_set.get("moves", [])],
+        "EV_Spread": " / ".join(f"{evs[s]} {STAT_LABELS[s]}" for s in STAT_NAMES if evs.get(s)),
+        "Nature": describe_nature(build_set.get("nature", "hardy")),
+        "Strategy": build_set.get("strategy", ""),
+        "Errors": build_set.get("errors", []),
+        "Validated": build_set.get("validated", False),
+        "template": build_set,
+    }
+
 def generate_pokemon_build(pokemon_name: str) -> dict:
     name_title = pokemon_name.title()
+    sets = get_build_store().get(pokemon_name.strip().lower().replace(' ', '-'))
 
-    if name_title == "Garchomp":
-        build_info = {
-            "name": name_title,
-            "Role": "Physical Sweeper / Late-Game Cleaner",
-            "Item": "Choice Scarf (Pilihan 1) atau Life Orb (Pilihan 2)",
-            "Ability": "Rough Skin (Paling Populer)",
-            "Moveset": ["Earthquake", "Outrage", "Stone Edge", "Swords Dance"],
-            "EV_Spread": "252 Atk / 4 Def / 252 Spe",
-            "Nature": "Jolly (+Spe, -Sp. Atk)",
-            "Strategy": (
-                "Garchomp adalah salah satu Pokémon ofensif terbaik. Build Choice Scarf memungkinkannya "
-                "mengungguli banyak Pokémon cepat lainnya dan berfungsi sebagai 'revenge killer'. "
-                "Life Orb digunakan jika Anda ingin menggunakan Swords Dance untuk 'set up' dan menyapu tim lawan."
-            )
-        }
-    elif name_title == "Flutter Mane":
-        build_info = {
-            "name": name_title,
-            "Role": "Special Attacker / Booster Energy Sweeper",
-            "Item": "Booster Energy (Wajib untuk mengaktifkan Protosynthesis)",
-            "Ability": "Protosynthesis",
-            "Moveset": ["Moonblast", "Shadow Ball", "Thunderbolt", "Protect"],
-            "EV_Spread": "252 Sp. Atk / 4 Def / 252 Spe",
-            "Nature": "Timid (+Spe, -Atk)",
-            "Strategy": (
-                "Flutter Mane adalah Pokémon tercepat dan terkuat di metagame saat ini. Booster Energy secara "
-                "otomatis meningkatkan Speed-nya. 'Protect' penting untuk memblokir serangan dan memenangkan duel 1v1. "
-                "Fokuskan pada menyerang dengan kuat menggunakan Moonblast dan Shadow Ball."
-            )
-        }
-    elif name_title == "Pikachu":
-        build_info = {
-            "name": name_title,
-            "Role": "Light Ball Attacker / Mascot",
-            "Item": "Light Ball (Wajib, menggandakan Attack dan Sp. Atk)",
-            "Ability": "Lightning Rod (Untuk Doubles Battles)",
-            "Moveset": ["Volt Tackle", "Surf", "Nuzzle", "Fake Out"],
-            "EV_Spread": "252 Atk / 4 Def / 252 Spe",
-            "Nature": "Hasty (+Spe, -Def)",
-            "Strategy": (
-                "Pikachu hanya bisa digunakan secara kompetitif dengan Light Ball. Item ini memberikan output damage yang gila-gilaan. "
-                "Gunakan Nuzzle untuk melumpuhkan lawan yang lebih cepat, dan Volt Tackle untuk kerusakan maksimum. "
-                "Dalam tim VGC/Doubles, Fake Out dan Lightning Rod sangat bernilai."
-            )
-        }
+    if sets:
+        formatted = [_format_build_set(name_title, s) for s in sets]
+        build_info = dict(formatted[0], sets=formatted)
     else:
         build_info = {
             "name": name_title,
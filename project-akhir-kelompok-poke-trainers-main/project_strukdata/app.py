@@ -1,13 +1,23 @@
 import streamlit as st
-import random
+import numpy as np
+import pandas as pd
 from components import (
     set_page_config_and_style, 
     get_pokemon_detail, 
-    get_generation_range_from_api, 
+    get_pokemon_details_bulk,
+    get_generation_index,
     pokemon_card_html,
+    pokemon_grid_html,
+    thumbnail_src,
+    thumbnail_file,
+    get_encounter_index,
+    is_encounter_index_partial,
+    get_speed_tiers,
     fetch, API_BASE,
     remove_evolutionary_duplicates
 )
+from shuffle_cursor import ShuffledBatchCursor
+from search_index import SearchIndex, normalize
 from login import show_login_page, handle_login_success 
 from user_profile import show_user_account 
 from encyclopedia import show_move_item_ability, show_catching_probability
@@ -16,11 +26,25 @@ from ai_manager import (
     generate_optimized_team, 
     generate_strategy_guide, 
     generate_synergy_combo, 
-    generate_pokemon_build
+    generate_pokemon_build,
+    get_team_coverage,
+    get_damage_matchups
 )
+from natures import NATURES, describe_nature, normalize_nature
+from pokemon_record import STAT_NAMES
+from stat_calc import LEVELS, MAX_IV, MAX_EV, SPEED_SPREADS, SPREAD_NAMES, compute_stats, nature_multipliers, spread_array
+from type_chart import ATTACKING_TYPES
 
 set_page_config_and_style()
 
+# Asumsi EV ancaman untuk matriks damage (IV 31, nature netral).
+THREAT_SPREADS = {
+    "252 HP": {"hp": MAX_EV},
+    "252 HP / 252 Def": {"hp": MAX_EV, "defense": MAX_EV},
+    "252 HP / 252 SpD": {"hp": MAX_EV, "special-defense": MAX_EV},
+    "Tanpa Investasi": {},
+}
+
 @st.cache_data(ttl=86400)
 def get_all_pokemon_names():
     
@@ -29,6 +53,38 @@ def get_all_pokemon_names():
         return [item['name'].title() for item in data['results']]
     return []
 
+@st.cache_resource
+def _build_search_index(names):
+    return SearchIndex(names)
+
+def get_search_index():
+    """Indeks pencarian nama Pokémon (dibangun sekali, dipakai bersama semua sesi)."""
+    return _build_search_index(tuple(get_all_pokemon_names()))
+
+def resolve_search_target(search_query):
+    """Menentukan nama/ID Pokémon untuk query pencarian tanpa request ke API.
+
+    Mengembalikan None jika tidak ada nama yang cocok sama sekali.
+    """
+    query = search_query.strip()
+    if query.isdigit():
+        return query
+
+    index = get_search_index()
+    if not len(index):
+        # Daftar nama belum tersedia (mis. offline): coba langsung ke API.
+        return query.lower()
+
+    exact = index.exact(query)
+    if exact:
+        return exact.lower()
+
+    matches = index.search(query)
+    if not matches:
+        return None
+    choice = st.selectbox("Maksud Anda:", matches, key=f"search_suggestion_{normalize(query)}")
+    return choice.lower()
+
 def clear_user_state():
     
     st.session_state.logged_in = False
@@ -134,6 +190,15 @@ def save_history_to_db():
              
              pass
 
+TEAM_SCORE_LABELS = {
+    "defensive": "Pertahanan Tipe",
+    "offensive": "Cakupan STAB",
+    "stats": "Base Stat",
+    "balance": "Fisik/Spesial",
+    "speed": "Speed",
+    "theme_type": "Tipe Tema",
+}
+
 def show_auto_team_builder():
     
     st.title("🤖 Auto Team Builder (AI Powered)")
@@ -150,6 +215,12 @@ def show_auto_team_builder():
     )
     st.session_state.owned_pokemon_input = owned_pokemon_input
 
+    st.text_input(
+        "Tema / Fokus Tim (Opsional)",
+        placeholder="Contoh: Hyper Offense, Trick Room, Defensive, tim Fire...",
+        key="team_builder_theme"
+    )
+
   
     if st.button("Generate Team Terbaik", type="primary", use_container_width=True):
         st.session_state.loading_team = True
@@ -168,7 +239,7 @@ def show_auto_team_builder():
                 final_team = remove_evolutionary_duplicates(team_result_raw['team']) 
             
                 if len(final_team) < len(team_result_raw['team']):
-                    st.warning("⚠️ Perhatian: Beberapa Pokémon (evolusi dan pra-evolusi) telah difilter untuk memastikan hanya ada satu per garis evolusi. Hanya **evolusi tertinggi** yang dipertahankan.")
+                    st.warning("⚠️ Perhatian: Beberapa Pokémon (evolusi, pra-evolusi, atau cabang lain dari rantai yang sama) telah difilter untuk memastikan hanya ada satu per rantai evolusi. Hanya **evolusi tertinggi** yang dipertahankan.")
 
                 team_result_raw['team'] = final_team 
                 st.session_state.team_result = team_result_raw
@@ -183,12 +254,19 @@ def show_auto_team_builder():
         st.subheader("🎉 Tim Rekomendasi AI")
         
         st.markdown(f"**Alasan Rekomendasi:** *{result['reason']}*")
+
+        if result.get("breakdown"):
+            breakdown = result["breakdown"]
+            score_cols = st.columns(len(breakdown) + 1)
+            score_cols[0].metric("Skor Total", f"{result['score']:.2f}")
+            for col, (component, value) in zip(score_cols[1:], breakdown.items()):
+                col.metric(TEAM_SCORE_LABELS.get(component, component.title()), f"{value:.2f}")
         
         cols = st.columns(3)
         ai_team_names = [name.title() for name in result['team']] 
+        team_details = get_pokemon_details_bulk(ai_team_names)
         
-        for i, name in enumerate(ai_team_names):
-            detail = get_pokemon_detail(name.lower().strip())
+        for i, (name, detail) in enumerate(zip(ai_team_names, team_details)):
             if not detail:
                 st.warning(f"Detail untuk Pokémon **{name}** tidak ditemukan. Pastikan nama Pokémon benar.")
                 continue
@@ -197,9 +275,9 @@ def show_auto_team_builder():
                 st.markdown(pokemon_card_html(detail), unsafe_allow_html=True)
                 
                 if st.session_state.get("logged_in"):
-                    name_to_save = detail['name'].title()
+                    name_to_save = detail.name.title()
                     
-                    if st.button(f"Add to Deck", key=f"save_ai_{detail['id']}_deck", use_container_width=True):
+                    if st.button(f"Add to Deck", key=f"save_ai_{detail.id}_deck", use_container_width=True):
                         if name_to_save not in st.session_state.saved_deck:
                             st.session_state.saved_deck.append(name_to_save)
                             st.session_state.undo_stack.append(name_to_save)
@@ -207,6 +285,9 @@ def show_auto_team_builder():
                         else:
                             st.toast(f"{name_to_save} sudah ada di deck Anda.", icon='⚠️')
 
+        show_team_speed_tiers(team_details)
+        show_damage_matrix(ai_team_names, "team_builder")
+
         if st.session_state.get("logged_in"):
             st.markdown("---")
             st.subheader("Simpan Tim Lengkap (6 Pokémon)")
@@ -286,6 +367,20 @@ def show_strategy_guides():
         st.markdown("---")
         st.caption("Panduan ini dibuat oleh AI Gemini. Informasi mungkin tidak 100% akurat dan harus digunakan sebagai referensi strategis.")
 
+HEATMAP_COLORS = {0.0: "#555555", 0.25: "#1b7f3b", 0.5: "#4caf50", 1.0: "#f1f1f1", 2.0: "#ff9800", 4.0: "#d32f2f"}
+
+def coverage_heatmap_html(member_names, multipliers):
+    """Tabel HTML berwarna: baris = anggota tim, kolom = 18 tipe."""
+    header = "".join(f"<th style='padding:2px 4px; font-size:11px;'>{t[:3].title()}</th>" for t in ATTACKING_TYPES)
+    rows = []
+    for name, row in zip(member_names, multipliers):
+        cells = "".join(
+            f"<td style='background:{HEATMAP_COLORS.get(float(m), '#f1f1f1')}; text-align:center; font-size:11px;'>{float(m):g}</td>"
+            for m in row
+        )
+        rows.append(f"<tr><td style='font-size:12px; padding-right:6px;'><strong>{name.title()}</strong></td>{cells}</tr>")
+    return f"<table style='border-collapse:collapse;'><tr><th></th>{header}</tr>{''.join(rows)}</table>"
+
 def show_synergy_highlighter():
     
     st.title("✨ Synergy / Combo Highlighter (AI)")
@@ -301,17 +396,17 @@ def show_synergy_highlighter():
     
     if team_list:
         cols = st.columns(min(len(team_list), 6))
-        for i, pokemon_name in enumerate(team_list):
+        team_details = get_pokemon_details_bulk(team_list)
+        for i, (pokemon_name, detail) in enumerate(zip(team_list, team_details)):
             with cols[i % 6]:
                 
-                detail = get_pokemon_detail(pokemon_name.lower())
                 if detail:
                     
                     st.markdown(f"""
                         <div style="text-align:center; padding:10px; border:1px solid #ddd; border-radius:8px; margin-bottom:10px;">
-                            <strong>{detail['name'].title()}</strong>
-                            <img src='{detail['sprites'].get('front_default') or detail['sprites'].get('other', {}).get('official-artwork', {}).get('front_default')}' width='50'/>
-                            <span class='type-badge'>{detail['types'][0]['type']['name'].title()}</span>
+                            <strong>{detail.name.title()}</strong>
+                            <img src='{thumbnail_src(detail, 50)}' width='50'/>
+                            <span class='type-badge'>{detail.types[0].title()}</span>
                         </div>
                     """, unsafe_allow_html=True)
                 else:
@@ -319,6 +414,18 @@ def show_synergy_highlighter():
 
     st.markdown("---")
 
+    member_names, defensive, offensive = get_team_coverage(team_list)
+    if member_names:
+        st.subheader("🗺️ Heatmap Cakupan Tipe")
+        tab_def, tab_off = st.tabs(["Defensif (damage diterima)", "Ofensif (STAB terbaik)"])
+        with tab_def:
+            st.markdown(coverage_heatmap_html(member_names, defensive), unsafe_allow_html=True)
+        with tab_off:
+            st.markdown(coverage_heatmap_html(member_names, offensive), unsafe_allow_html=True)
+        st.markdown("---")
+        show_damage_matrix(team_list, "synergy")
+        st.markdown("---")
+
     if st.button("Analisis Sinergi Tim dengan AI", type="primary", use_container_width=True):
         if not team_list:
              st.error("Deck Tersimpan Anda kosong. Harap tambahkan Pokémon terlebih dahulu.")
@@ -334,6 +441,207 @@ def show_synergy_highlighter():
         st.markdown("---")
         st.caption("Analisis ini disimulasikan oleh AI. Kombo dan saran mungkin memerlukan penyesuaian Move/Ability.")
 
+STAT_INPUT_LABELS = ("HP", "Atk", "Def", "Sp. Atk", "Sp. Def", "Spe")
+
+def speed_tiers_or_prompt(level, key_prefix):
+    """Speed tier dari dex table yang sudah ada; jika belum, tawarkan tombol untuk membangunnya (None)."""
+    tiers = get_speed_tiers(level, build=False)
+    if tiers is None:
+        st.info(
+            "Speed tier membutuhkan tabel dex yang belum tersedia. Bangun sekali dengan "
+            "`python -c \"import components; components.prebuild_dex_table()\"`, "
+            "atau bangun sekarang (±1.000 request ke PokeAPI)."
+        )
+        if st.button("Bangun Tabel Dex", key=f"{key_prefix}_build_dex"):
+            with st.spinner("Membangun tabel dex..."):
+                tiers = get_speed_tiers(level)
+    return tiers
+
+def show_stat_calculator(detail, template, key_prefix):
+    """Stat akhir (level 50/100, IV/EV/nature) dan posisi speed tier terhadap seluruh dex."""
+    st.markdown("### 📊 Kalkulator Stat & Speed Tier")
+    template = template or {}
+    evs_default = template.get("evs", {})
+
+    col_level, col_nature, col_iv = st.columns(3)
+    with col_level:
+        level = st.radio("Level", LEVELS, horizontal=True, key=f"{key_prefix}_level")
+    with col_nature:
+        nature_options = list(NATURES)
+        # Nature template yang tidak dikenal (typo, dsb.) jatuh ke opsi pertama, bukan crash.
+        template_nature = normalize_nature(template.get("nature"))
+        nature = st.selectbox("Nature", nature_options, format_func=describe_nature, key=f"{key_prefix}_nature",
+                              index=nature_options.index(template_nature) if template_nature else 0)
+    with col_iv:
+        iv = st.number_input("IV (semua stat)", min_value=0, max_value=MAX_IV, value=MAX_IV, key=f"{key_prefix}_iv")
+
+    ev_cols = st.columns(len(STAT_NAMES))
+    evs = {}
+    for col, stat, label in zip(ev_cols, STAT_NAMES, STAT_INPUT_LABELS):
+        with col:
+            evs[stat] = st.number_input(f"EV {label}", min_value=0, max_value=MAX_EV, step=4,
+                                        value=int(evs_default.get(stat, 0)), key=f"{key_prefix}_ev_{stat}")
+    if sum(evs.values()) > 510:
+        st.warning(f"Total EV {sum(evs.values())} melebihi batas 510.")
+
+    final = compute_stats(np.array([detail.stats]), level, iv, spread_array(evs), nature_multipliers(nature))[0]
+    st.dataframe(pd.DataFrame({"Stat": STAT_INPUT_LABELS, "Base": detail.stats, f"Lv. {level}": final}).set_index("Stat").T,
+                 use_container_width=True)
+
+    tiers = speed_tiers_or_prompt(level, key_prefix)
+    if tiers is None:
+        return
+    my_speed = int(final[STAT_NAMES.index("speed")])
+    spread = st.selectbox("Asumsi spread Speed lawan", SPREAD_NAMES, key=f"{key_prefix}_spread")
+    slower, tied, faster = tiers.outspeed_counts(my_speed, spread)
+    total = max(slower + tied + faster, 1)
+    st.markdown(f"**Speed {my_speed}** lebih cepat dari **{slower}** Pokémon ({slower / total:.0%} dex), "
+                f"sama cepat dengan **{tied}**, dan lebih lambat dari **{faster}**.")
+
+    speeds, result = tiers.compare(my_speed, spread)
+    nearby = np.flatnonzero(np.abs(speeds - my_speed) <= 10)
+    nearby = nearby[np.argsort(-speeds[nearby], kind="stable")]
+    st.dataframe(pd.DataFrame({
+        "Pokémon": np.char.title(tiers.names[nearby]),
+        "Speed": speeds[nearby],
+        "Hasil": np.array(["Lebih cepat dari Anda", "Speed tie", "Anda lebih cepat"])[1 - result[nearby]],
+    }), hide_index=True, use_container_width=True, height=250)
+
+def show_team_speed_tiers(team_details, level=50):
+    """Speed tiap anggota tim (Max+ dan Max Netral) dan persentase dex yang dilampaui."""
+    tiers = speed_tiers_or_prompt(level, "team_speed")
+    if tiers is None:
+        return
+    rows = []
+    for detail in team_details:
+        if not detail:
+            continue
+        base_speed = detail.stats[STAT_NAMES.index("speed")]
+        row = {"Pokémon": detail.name.title(), "Base Spe": base_speed}
+        for label, (iv, ev, nature) in list(SPEED_SPREADS.items())[:2]:
+            speed = tiers.speed_of(base_speed, iv, ev, nature)
+            slower, _, _ = tiers.outspeed_counts(speed, SPREAD_NAMES[1])
+            row[f"{label}"] = speed
+            row[f"Melampaui (%) - {label}"] = round(100 * slower / max(len(tiers.names), 1), 1)
+        rows.append(row)
+    if rows:
+        st.markdown(f"**⚡ Speed Tier Tim (Lv. {level}, lawan diasumsikan Max Netral)**")
+        st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
+def show_damage_matrix(team_list, key_prefix):
+    """Matriks % damage dan peluang OHKO deck vs 100 ancaman ber-BST tertinggi."""
+    st.subheader("🎯 Matriks Damage vs Ancaman Teratas")
+    col_level, col_spread = st.columns(2)
+    with col_level:
+        level = st.radio("Level", LEVELS, horizontal=True, key=f"{key_prefix}_damage_level")
+    with col_spread:
+        spread = st.selectbox("Asumsi EV ancaman", list(THREAT_SPREADS), key=f"{key_prefix}_damage_spread")
+
+    # Hasil disimpan per (tim, level, asumsi EV) agar rerun halaman tidak menghitung ulang;
+    # perhitungan pertama bisa memuat dex table, jadi hanya dijalankan lewat tombol.
+    results = st.session_state.setdefault("damage_matrix_results", {})
+    cache_key = (tuple(name.lower() for name in team_list), level, spread)
+    if cache_key not in results:
+        if not st.button("Hitung Damage Matrix", key=f"{key_prefix}_damage_compute", use_container_width=True):
+            return
+        with st.spinner("Menghitung damage matrix..."):
+            result = get_damage_matchups(team_list, level=level, threat_evs=THREAT_SPREADS[spread])
+        if result:
+            results[cache_key] = result
+    else:
+        result = results[cache_key]
+    if not result:
+        st.info("Matriks damage belum tersedia (deck kosong atau data dex gagal dimuat).")
+        return
+
+    members = [name.title() for name in result["members"]]
+    threats = [name.title() for name in result["threats"]]
+    ohko = result["ohko"] * 100
+    st.caption(
+        "Move terbaik tiap anggota (template build, atau STAB generik 90 BP), 16 roll damage, "
+        "STAB, dan efektivitas tipe; tanpa item, ability, cuaca, maupun kritikal."
+    )
+    st.dataframe(pd.DataFrame({
+        "Pokémon": members,
+        "Ancaman di-OHKO (≥50%)": (ohko >= 50).sum(axis=1),
+        "Rata-rata damage maks (%)": result["max_pct"].mean(axis=1).round(1),
+    }), hide_index=True, use_container_width=True)
+
+    uncovered = [t for t, covered in zip(threats, (ohko >= 50).any(axis=0)) if not covered]
+    if uncovered:
+        st.warning(f"{len(uncovered)} ancaman tidak bisa di-OHKO siapa pun: " + ", ".join(uncovered[:15])
+                   + (" ..." if len(uncovered) > 15 else ""))
+
+    damage_text = np.char.add(np.char.add(result["min_pct"].round().astype(int).astype(str), "–"),
+                              np.char.add(result["max_pct"].round().astype(int).astype(str), "%"))
+    tab_damage, tab_ohko, tab_moves = st.tabs(["% Damage (min–maks)", "Peluang OHKO (%)", "Move Terbaik"])
+    with tab_damage:
+        st.dataframe(pd.DataFrame(damage_text.T, index=threats, columns=members), use_container_width=True, height=400)
+    with tab_ohko:
+        st.dataframe(pd.DataFrame(ohko.T.round(1), index=threats, columns=members), use_container_width=True, height=400)
+    with tab_moves:
+        st.dataframe(pd.DataFrame(result["moves"].T, index=threats, columns=members), use_container_width=True, height=400)
+
+def show_build_set(result, detail):
+    """Menampilkan satu set build (role, EV, item, ability, nature, moveset, strategi)."""
+    if result.get("Errors"):
+        st.warning("Template ini memuat data yang tidak dikenal ensiklopedia: " + ", ".join(result["Errors"]))
+    elif "Validated" in result and not result["Validated"]:
+        st.caption("Template belum divalidasi: indeks ensiklopedia lokal belum tersedia.")
+
+    st.markdown("---")
+    st.subheader("Statistik Inti & Fokus")
+    
+    col_core_stats_1, col_core_stats_2 = st.columns(2)
+    
+    with col_core_stats_1:
+        st.markdown("### Role & EV")
+        
+        st.info(
+            f"**Peran / Role:**\n\n**{result['Role']}**",
+        )
+        st.info(
+            f"**EV Spread:**\n\n**{result['EV_Spread']}**",
+        )
+
+    with col_core_stats_2:
+        st.markdown("### Item & Ability")
+        
+        st.info(
+            f"**Item Kunci:**\n\n**{result['Item']}**",
+        )
+        st.info(
+            f"**Ability Wajib:**\n\n**{result['Ability']}**",
+        )
+        
+    st.markdown("---")
+    
+    if detail:
+         type_name = detail.types[0].title()
+         st.markdown(f"**Nature Terbaik:** **{result['Nature']}** | **Tipe Utama:** **{type_name}**")
+    else:
+         st.markdown(f"**Nature Terbaik:** **{result['Nature']}**")
+
+    st.divider()
+
+    col_moveset, col_strategy = st.columns([1.5, 2.5])
+    
+    with col_moveset:
+        st.markdown("### Moveset (4 Jurusan)")
+        moveset_list_md = ""
+        for move in result['Moveset']:
+             moveset_list_md += f"* **{move}**\n"
+        st.markdown(moveset_list_md)
+        
+    with col_strategy:
+        st.markdown("### Strategi & Penggunaan")
+        st.info(result['Strategy'])
+
+    if detail:
+        st.divider()
+        show_stat_calculator(detail, result.get("template"), key_prefix=f"stat_{detail.id}_{result.get('Set', 'default')}")
+        
+
 def show_build_template_library():
     
     st.title("🧱 Build / Template Library (AI Powered)")
@@ -383,63 +691,23 @@ def show_build_template_library():
         
         pokemon_name = result['name'].lower()
         detail = get_pokemon_detail(pokemon_name)
-        image_url = detail['sprites'].get('other', {}).get('official-artwork', {}).get('front_default') or detail['sprites'].get('front_default')
+        image_url = thumbnail_file(detail, 220)
 
         
         col_header, col_img = st.columns([4, 1])
         with col_header:
-            st.markdown(f"## 🏆 Build Kompetitif untuk {result['name']} #{detail['id']:04d}")
+            st.markdown(f"## 🏆 Build Kompetitif untuk {result['name']} #{detail.id:04d}")
         with col_img:
             if image_url:
                  st.image(image_url, width=120)
 
-        st.markdown("---")
-        st.subheader("Statistik Inti & Fokus")
-        
-        col_core_stats_1, col_core_stats_2 = st.columns(2)
-        
-        with col_core_stats_1:
-            st.markdown("### Role & EV")
-            
-            st.info(
-                f"**Peran / Role:**\n\n**{result['Role']}**",
-            )
-            st.info(
-                f"**EV Spread:**\n\n**{result['EV_Spread']}**",
-            )
-
-        with col_core_stats_2:
-            st.markdown("### Item & Ability")
-            
-            st.info(
-                f"**Item Kunci:**\n\n**{result['Item']}**",
-            )
-            st.info(
-                f"**Ability Wajib:**\n\n**{result['Ability']}**",
-            )
-            
-        st.markdown("---")
-        
-        if detail:
-             type_name = detail['types'][0]['type']['name'].title()
-             st.markdown(f"**Nature Terbaik:** **{result['Nature']}** | **Tipe Utama:** **{type_name}**")
+        build_sets = result.get("sets") or [result]
+        if len(build_sets) > 1:
+            for tab, build_set in zip(st.tabs([b["Set"] for b in build_sets]), build_sets):
+                with tab:
+                    show_build_set(build_set, detail)
         else:
-             st.markdown(f"**Nature Terbaik:** **{result['Nature']}**")
-
-        st.divider()
-
-        col_moveset, col_strategy = st.columns([1.5, 2.5])
-        
-        with col_moveset:
-            st.markdown("### Moveset (4 Jurusan)")
-            moveset_list_md = ""
-            for move in result['Moveset']:
-                 moveset_list_md += f"* **{move}**\n"
-            st.markdown(moveset_list_md)
-            
-        with col_strategy:
-            st.markdown("### Strategi & Penggunaan")
-            st.info(result['Strategy'])
+            show_build_set(build_sets[0], detail)
             
         st.divider()
         st.caption("Saran ini didasarkan pada data metagame kompetitif populer (simulasi AI).")
@@ -470,58 +738,102 @@ def show_map_location_display():
     else:
         st.session_state.location_pokemon_input = ""
 
+    encounter_index = get_encounter_index(build=False)
+    if encounter_index is None:
+        st.warning(
+            "Indeks lokasi kemunculan belum tersedia. Bangun sekali dengan "
+            "`python -c \"import components; components.prebuild_encounter_index()\"`, "
+            "atau bangun sekarang (±1.000 request ke PokeAPI)."
+        )
+        if not st.button("Bangun Indeks Lokasi", use_container_width=True):
+            return
+        with st.spinner("Membangun indeks lokasi kemunculan..."):
+            encounter_index = get_encounter_index()
+    elif is_encounter_index_partial():
+        st.caption("Indeks lokasi belum lengkap (sebagian data gagal diambil).")
+        if st.button("Lengkapi Indeks Lokasi"):
+            # Dibangun ulang hanya jika jeda INDEX_RETRY_INTERVAL sudah lewat.
+            with st.spinner("Melengkapi indeks lokasi kemunculan..."):
+                encounter_index = get_encounter_index()
+    version_filter = st.multiselect("Filter Versi Game", encounter_index.versions.tolist(), key="location_versions")
+
     if st.button("Cari Lokasi Kemunculan", type="primary", use_container_width=True):
         if not st.session_state.location_pokemon_input:
             st.error("Harap pilih nama Pokémon terlebih dahulu.")
             return
-            
-        st.session_state.loading_location = True
-        st.session_state.location_result = None
-        st.rerun() 
-        
-    if st.session_state.get("loading_location"):
+
         pokemon_name = st.session_state.location_pokemon_input.lower()
-        with st.spinner(f"🔍 Mencari lokasi kemunculan untuk {st.session_state.location_pokemon_input}..."):
-            
-            url = f"{API_BASE}/pokemon/{pokemon_name}/encounters"
-            location_data = fetch(url)
-            
-            locations = []
-            if location_data:
-                
-                locations = [item['location_area']['name'].replace('-', ' ').title() for item in location_data]
-            
-            st.session_state.location_result = locations
-            st.session_state.loading_location = False
-            st.rerun()
+        rows = encounter_index.filter(encounter_index.rows_for_pokemon(pokemon_name), versions=version_filter)
+        st.session_state.location_result = encounter_table(encounter_index, rows, include_pokemon=False)
 
     if st.session_state.get("location_result") is not None:
         locations = st.session_state.location_result
         st.markdown("---")
         st.subheader(f"📍 Lokasi Kemunculan {st.session_state.location_pokemon_input}")
         
-        if locations:
-            st.success(f"Ditemukan **{len(locations)}** area lokasi kemunculan.")
-               
-            cols_per_row = 3
-            cols = st.columns(cols_per_row)
-            for i, location in enumerate(locations):
-                with cols[i % cols_per_row]:
-                    st.markdown(f"**{i+1}.** {location}")
-                    
+        if len(locations):
+            st.success(f"Ditemukan **{locations['Area'].nunique()}** area lokasi kemunculan.")
+            st.dataframe(locations, hide_index=True, use_container_width=True)
         else:
             st.warning("Data lokasi kemunculan untuk Pokémon ini tidak tersedia (atau tidak muncul di alam liar).")
 
+    st.markdown("---")
+    st.subheader("🔎 Apa yang Bisa Ditangkap di Sini?")
+    area_query = st.text_input("Nama Area/Lokasi", placeholder="Contoh: Viridian Forest", key="location_area_query")
+    if area_query:
+        area_matches = encounter_index.find_areas(area_query)
+        if not area_matches:
+            st.warning(f"Area '{area_query}' tidak ditemukan.")
+        else:
+            col_area, col_method, col_level = st.columns([2, 2, 1])
+            with col_area:
+                area = st.selectbox("Area", area_matches, format_func=lambda a: a.replace('-', ' ').title())
+            with col_method:
+                method_filter = st.multiselect("Metode", encounter_index.methods.tolist(), key="location_methods")
+            with col_level:
+                level = st.number_input("Level (0 = semua)", min_value=0, max_value=100, value=0)
+            rows = encounter_index.filter(encounter_index.rows_for_area(area), versions=version_filter,
+                                          methods=method_filter, level=level or None)
+            area_table = encounter_table(encounter_index, rows, include_pokemon=True)
+            st.caption(f"{area_table['Pokémon'].nunique() if len(area_table) else 0} Pokémon, {len(area_table)} entri encounter.")
+            st.dataframe(area_table, hide_index=True, use_container_width=True)
+
     st.markdown("---")
     st.caption("Data lokasi diambil dari API PokeAPI. Mungkin tidak mencakup semua game atau metode penangkapan.")
 
-def show_default_home_content(search_query, GEN_START, GEN_END, selected_gen_label): 
+def encounter_table(encounter_index, rows, include_pokemon):
+    """DataFrame encounter (versi, metode, rentang level, peluang) untuk baris indeks terpilih."""
+    records = encounter_index.records(rows)
+    frame = pd.DataFrame({
+        "Pokémon": np.char.title(records["pokemon"]),
+        "Area": [a.replace('-', ' ').title() for a in records["area"]],
+        "Versi": np.char.title(records["version"]),
+        "Metode": records["method"],
+        "Level": [f"{lo}-{hi}" if lo != hi else str(lo) for lo, hi in zip(records["min_level"], records["max_level"])],
+        "Peluang (%)": records["chance"],
+    })
+    if not include_pokemon:
+        frame = frame.drop(columns=["Pokémon"])
+    return frame.sort_values(["Peluang (%)"], ascending=False, kind="stable")
+
+FEATURED_BATCH_SIZE = 12
+
+def get_featured_cursor(gen_label, ids):
+    """Cursor acak per sesi & per generasi untuk grid Featured (bertahan antar rerun)."""
+    cursors = st.session_state.setdefault("featured_cursors", {})
+    cursor = cursors.get(gen_label)
+    if cursor is None or cursor.total != len(ids):
+        cursor = ShuffledBatchCursor(ids, batch_size=FEATURED_BATCH_SIZE)
+        cursors[gen_label] = cursor
+    return cursor
+
+def show_default_home_content(search_query, gen_ids, selected_gen_label): 
     
     if search_query:
-        normalized_query = search_query.lower().strip()
         st.subheader(f"Hasil Pencarian: {search_query}")
 
-        detail = get_pokemon_detail(normalized_query)
+        target = resolve_search_target(search_query)
+        detail = get_pokemon_detail(target) if target else None
         
         if detail and search_query not in st.session_state.search_history:
                st.session_state.search_history.append(search_query)
@@ -535,7 +847,7 @@ def show_default_home_content(search_query, GEN_START, GEN_END, selected_gen_lab
         st.markdown(pokemon_card_html(detail), unsafe_allow_html=True)
         
         if st.session_state.get("logged_in"):
-             name = detail['name'].title()
+             name = detail.name.title()
              if st.button(f"Save {name} to Deck"):
                  if name not in st.session_state.saved_deck:
                     st.session_state.saved_deck.append(name)
@@ -550,53 +862,46 @@ def show_default_home_content(search_query, GEN_START, GEN_END, selected_gen_lab
         st.markdown("<div class='header-title'>Featured Pokémon</div>", unsafe_allow_html=True)
         st.write(f"Menampilkan Pokémon acak dari **{selected_gen_label}**. Tekan **Load More**.")
 
-        batch_size = 12
-        all_ids = list(range(GEN_START, GEN_END + 1))
-        
-        available_ids = [x for x in all_ids if x not in st.session_state.loaded_ids]
+        cursor = get_featured_cursor(selected_gen_label, gen_ids)
 
         batch_needed = False
         
         if not st.session_state.loaded_ids:
             batch_needed = True
+            cursor.reseed()
       
         if st.session_state.batch > 0:
             batch_needed = True
             st.session_state.batch = 0
             
-        if batch_needed and available_ids:
-            n_to_pick = min(batch_size, len(available_ids))
-            
-            try:
-                new_ids = random.sample(available_ids, n_to_pick)
-            except ValueError:
-                new_ids = available_ids[:n_to_pick] 
-
-            st.session_state.loaded_ids.extend(new_ids)
+        if batch_needed and not cursor.exhausted:
+            st.session_state.loaded_ids.extend(cursor.next_batch())
 
         if st.session_state.loaded_ids:
-            cols = st.columns(3)
-            for idx, pid in enumerate(st.session_state.loaded_ids):
-                detail = get_pokemon_detail(pid)
-                if not detail:
-                    continue
-
-                with cols[idx % 3]:
-                    st.markdown(pokemon_card_html(detail), unsafe_allow_html=True)
-                    
-                    if st.session_state.get("logged_in"):
-                          name = detail['name'].title()
-                          if st.button(f"Save #{detail['id']}", key=f"save_{detail['id']}", use_container_width=True):
-                              if name not in st.session_state.saved_deck:
+            grid_details = [d for d in get_pokemon_details_bulk(st.session_state.loaded_ids) if d]
+            st.markdown(pokemon_grid_html(grid_details), unsafe_allow_html=True)
+
+            if st.session_state.get("logged_in"):
+                # Satu kontrol simpan untuk seluruh grid, bukan satu tombol per kartu.
+                options = {f"#{d.id} {d.name.title()}": d.name.title() for d in grid_details}
+                sc1, sc2 = st.columns([4, 1])
+                with sc1:
+                    picked = st.multiselect("Simpan ke Deck", list(options), key="featured_save_pick",
+                                            label_visibility="collapsed", placeholder="Pilih Pokémon untuk disimpan ke deck...")
+                with sc2:
+                    if st.button("Save to Deck", key="featured_save_button", use_container_width=True) and picked:
+                        for label in picked:
+                            name = options[label]
+                            if name not in st.session_state.saved_deck:
                                 st.session_state.saved_deck.append(name)
                                 st.session_state.undo_stack.append(name)
-                                save_deck_to_db() 
-                              else:
-                                 st.toast(f"{name} sudah ada di deck Anda.", icon='⚠️')
+                            else:
+                                st.toast(f"{name} sudah ada di deck Anda.", icon='⚠️')
+                        save_deck_to_db()
         
         st.markdown("---")
         total_featured = len(st.session_state.loaded_ids)
-        total_available = len(all_ids)
+        total_available = cursor.total
 
         c1, c2, c3 = st.columns([1, 1, 1])
         with c1:
@@ -682,33 +987,12 @@ def show_main_app():
     
     
     st.sidebar.markdown("### Filter by Generation")
-    gen_static = {
-        "All Generations": (1, 1025), 
-        "Generation 1": (1, 151),
-        "Generation 2": (152, 251),
-        "Generation 3": (252, 386),
-        "Generation 4": (387, 493),
-        "Generation 5": (494, 649),
-        "Generation 6": (650, 721),
-        "Generation 7": (722, 809),
-        "Generation 8": (810, 898),
-    }
-
-    gen_options = gen_static.copy()
-    gen9_label = "Generation 9"
-    
-    try:
-        gen9_info = get_generation_range_from_api(9)
-        if gen9_info:
-            gen9_start, gen9_end, _, _ = gen9_info
-            gen_options[gen9_label] = (gen9_start, gen9_end)
-        else:
-            gen_options[gen9_label] = (899, 1025)
-    except Exception:
-        gen_options[gen9_label] = (899, 1025)
+    gen_index = get_generation_index()
+    gen_options = {"All Generations": None}
+    gen_options.update({f"Generation {gen}": gen for gen in gen_index.generations})
 
     selected_gen_label = st.sidebar.selectbox("Select Generation", list(gen_options.keys()))
-    GEN_START, GEN_END = gen_options[selected_gen_label]
+    gen_ids = gen_index.ids(gen_options[selected_gen_label])
 
     if st.session_state.current_gen != selected_gen_label:
         st.session_state.current_gen = selected_gen_label
@@ -737,7 +1021,7 @@ def show_main_app():
             st.warning("Fitur ini belum diimplementasikan.")
     else:
         
-        show_default_home_content(search_query, GEN_START, GEN_END, selected_gen_label)
+        show_default_home_content(search_query, gen_ids, selected_gen_label)
 
 def main():
     init_session_state()
@@ -0,0 +1,200 @@
+"""Skrip benchmark untuk lapisan data Pokédex.
+
+Jalankan: python benchmarks.py <nama-benchmark>
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Server pengganti PokeAPI dengan latensi dan kegagalan yang disimulasikan."""
+
+    latency = 0.05
+    failure_rate = 0.2
+
+    def do_GET(self):
+        time.sleep(random.uniform(0, 2 * self.latency))
+        if random.random() < self.failure_rate:
+            self.send_response(random.choice([429, 500, 503]))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def bench_transport(n_requests=200, latency=0.05, failure_rate=0.2):
+    """Menguji http_transport terhadap server lokal dengan latensi & error acak."""
+    import http_transport
+
+    _StandInHandler.latency = latency
+    _StandInHandler.failure_rate = failure_rate
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def one(i):
+        try:
+            return http_transport.get(f"{base}/api/v2/pokemon/{i}").status_code
+        except http_transport.TransportError:
+            return "gagal"
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(one, range(n_requests)))
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+
+    print(f"{n_requests} request dalam {elapsed:.2f}s "
+          f"(latensi simulasi ~{latency * 1000:.0f}ms, failure rate {failure_rate:.0%})")
+    print("Status akhir:", {s: results.count(s) for s in set(results)})
+    for host, hist in http_transport.get_latency_histogram().items():
+        print(f"Histogram latensi {host}:")
+        for bucket, count in hist.items():
+            print(f"  {bucket:>10}: {count}")
+
+
+def bench_user_store(max_users=1_000_000, lookups=2000):
+    """Latensi get/find-by-username/update SqliteUserStore dari 100 s.d. `max_users` pengguna."""
+    from user_store import SqliteUserStore
+
+    tmp_dir = tempfile.mkdtemp()
+    store = SqliteUserStore(os.path.join(tmp_dir, "bench_users.db"))
+    conn = store._connection()
+    record = {"password": "$2b$12$" + "x" * 53, "profile": {}, "saved_deck": ["Pikachu"] * 6}
+
+    size, filled = 100, 0
+    print(f"{'users':>10} {'get (us)':>10} {'by-name (us)':>13} {'update (us)':>12}")
+    while size <= max_users:
+        with conn:
+            conn.executemany(
+                "INSERT INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (store._to_row(f"user{i}@gmail.com", dict(record, username=f"User{i}")) for i in range(filled, size)),
+            )
+        filled = size
+        sample = [random.randrange(size) for _ in range(lookups)]
+
+        start = time.perf_counter()
+        for i in sample:
+            store.get(f"user{i}@gmail.com")
+        t_get = (time.perf_counter() - start) / lookups * 1e6
+
+        start = time.perf_counter()
+        for i in sample:
+            store.find_email_by_username(f"user{i}")
+        t_name = (time.perf_counter() - start) / lookups * 1e6
+
+        start = time.perf_counter()
+        for i in sample[:200]:
+            store.update(f"user{i}@gmail.com", {"saved_deck": ["Garchomp"]})
+        t_update = (time.perf_counter() - start) / 200 * 1e6
+
+        print(f"{size:>10} {t_get:>10.1f} {t_name:>13.1f} {t_update:>12.1f}")
+        size *= 10
+
+
+def bench_login(n_logins=16, rounds=12):
+    """Throughput login bcrypt: inline vs process pool, plus stall pada 'sesi lain'.
+
+    Sesi lain disimulasikan oleh thread yang menjalankan pekerjaan Python ringan;
+    latensi maksimumnya menunjukkan seberapa lama ia tertahan oleh hashing.
+    """
+    import password_hasher
+
+    stored = password_hasher._hash(b"secret123", rounds).decode()
+
+    def other_session(stop, stalls):
+        while not stop.is_set():
+            start = time.perf_counter()
+            sum(range(20000))
+            stalls.append(time.perf_counter() - start)
+
+    for label, workers in (("inline", 0), ("process pool", password_hasher.HASH_WORKERS or 2)):
+        password_hasher.HASH_WORKERS = workers
+        password_hasher._pool = None
+        password_hasher.verify_password("warmup", stored)
+
+        stop, stalls = threading.Event(), []
+        watcher = threading.Thread(target=other_session, args=(stop, stalls))
+        watcher.start()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=n_logins) as pool:
+            list(pool.map(lambda _: password_hasher.verify_password("secret123", stored), range(n_logins)))
+        elapsed = time.perf_counter() - start
+        stop.set()
+        watcher.join()
+
+        print(f"{label:>12}: {n_logins / elapsed:6.1f} login/s, "
+              f"sesi lain p50={sorted(stalls)[len(stalls) // 2] * 1000:.2f}ms max={max(stalls) * 1000:.1f}ms")
+
+
+ARTWORK_URL = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/{}.png"
+
+
+def bench_thumbnails(page_size=12, first_id=1):
+    """Bytes per halaman grid: artwork asli vs thumbnail 220px (file statis dan data URI)."""
+    import http_transport
+    import thumbnails
+
+    thumbnails.THUMB_DIR = tempfile.mkdtemp()
+    original_bytes = thumb_bytes = 0
+    start = time.perf_counter()
+    for pokemon_id in range(first_id, first_id + page_size):
+        r = http_transport.get(ARTWORK_URL.format(pokemon_id), headers={"Accept": "image/*"})
+        if r.status_code != 200:
+            print(f"#{pokemon_id}: HTTP {r.status_code}, dilewati")
+            continue
+        original_bytes += len(r.content)
+        thumbnails.render_variants(pokemon_id, r.content)
+        thumb_bytes += os.path.getsize(thumbnails._existing_variant(pokemon_id, 220))
+    elapsed = time.perf_counter() - start
+
+    print(f"Halaman {page_size} kartu (#{first_id}-#{first_id + page_size - 1}), diproses dalam {elapsed:.2f}s")
+    print(f"  artwork asli     : {original_bytes / 1024:8.1f} KiB")
+    print(f"  thumbnail 220px  : {thumb_bytes / 1024:8.1f} KiB ({thumb_bytes / max(original_bytes, 1):.1%})")
+    print(f"  sebagai data URI : {thumb_bytes * 4 / 3 / 1024:8.1f} KiB")
+
+
+def bench_capture_sim(trials=1_000_000, capture_rate=45):
+    """Waktu simulasi Monte Carlo strategi tangkap untuk `trials` percobaan per strategi."""
+    from capture_sim import PRESET_STRATEGIES, simulate_strategy, summarize
+    from type_chart import encode_type_combos
+
+    type_idx = encode_type_combos([("electric",)])[0]
+    costs = {"Poké Ball": 200, "Great Ball": 600, "Ultra Ball": 800, "Quick Ball (Turn 1)": 1000}
+    for name, plan in PRESET_STRATEGIES.items():
+        start = time.perf_counter()
+        summary = summarize(simulate_strategy(plan, capture_rate, type_idx, trials=trials, costs=costs, seed=0))
+        elapsed = time.perf_counter() - start
+        print(f"{name:>50}: {elapsed * 1000:7.1f}ms, tertangkap {summary['capture_rate']:.1%}, "
+              f"ball rata-rata {summary['balls']['mean']:.2f}, biaya rata-rata {summary['cost']['mean']:.0f}₽")
+
+
+BENCHMARKS = {
+    "transport": bench_transport,
+    "user-store": bench_user_store,
+    "login": bench_login,
+    "thumbnails": bench_thumbnails,
+    "capture-sim": bench_capture_sim,
+}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] not in BENCHMARKS:
+        print(f"Usage: python benchmarks.py [{'|'.join(BENCHMARKS)}]")
+        sys.exit(1)
+    BENCHMARKS[sys.argv[1]](*(int(arg) for arg in sys.argv[2:]))
@@ -0,0 +1,100 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+
+TEMPLATES_DIR = os.environ.get(
+    "POKEDEX_BUILD_TEMPLATES_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "build_templates"),
+)
+CACHE_SIZE = 256
+ENCODING = 'utf-8'
+
+# Field set -> jenis resource ensiklopedia untuk validasi.
+_VALIDATED_FIELDS = (("item", "item"), ("ability", "ability"), ("moves", "move"))
+
+
+class BuildTemplateStore:
+    """Template build per species: satu file JSON per species, berisi beberapa set.
+
+    Saat dibuat hanya direktori yang didaftar (species -> path); file di-parse dan
+    divalidasi saat species itu pertama kali diminta, lalu disimpan di cache LRU.
+    `validator(kind, slug)` mengembalikan False untuk move/item/ability yang
+    tidak dikenal ensiklopedia lokal, atau None jika belum bisa memeriksa
+    (indeks belum tersedia). Set yang belum tervalidasi divalidasi ulang pada
+    permintaan berikutnya, sehingga error tidak pernah dihitung dari indeks parsial.
+    """
+
+    def __init__(self, root=TEMPLATES_DIR, validator=None, cache_size=CACHE_SIZE):
+        self.root = root
+        self.validator = validator
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._paths = {}
+        if os.path.isdir(root):
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith(".json"):
+                        self._paths[entry.name[:-len(".json")]] = entry.path
+
+    def __contains__(self, species):
+        return species in self._paths
+
+    def __len__(self):
+        return len(self._paths)
+
+    def species(self):
+        return sorted(self._paths)
+
+    def get(self, species):
+        """Daftar set untuk species (slug), atau [] jika tidak ada template."""
+        with self._lock:
+            entry = self._cache.get(species)
+            if entry is not None:
+                self._cache.move_to_end(species)
+        if entry is None:
+            path = self._paths.get(species)
+            entry = [self._load(path) if path else [], False]
+            with self._lock:
+                self._cache[species] = entry
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        sets, validated = entry
+        if not validated:
+            entry[1] = self._validate_sets(sets)
+        return sets
+
+    def _load(self, path):
+        try:
+            with open(path, 'r', encoding=ENCODING) as f:
+                return json.load(f).get("sets", [])
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Build Template Error: {e}")
+            return []
+
+    def _validate_sets(self, sets):
+        """Mengisi `errors` dan `validated` tiap set; True jika semua set sudah tervalidasi."""
+        validated = True
+        for build_set in sets:
+            errors = self._validate(build_set)
+            build_set["validated"] = errors is not None
+            build_set["errors"] = errors or []
+            validated &= errors is not None
+        return validated
+
+    def _validate(self, build_set):
+        """Daftar error, atau None jika validator belum bisa memeriksa."""
+        if self.validator is None:
+            return []
+        errors = []
+        for field, kind in _VALIDATED_FIELDS:
+            values = build_set.get(field) or []
+            for slug in [values] if isinstance(values, str) else values:
+                known = self.validator(kind, slug)
+                if known is None:
+                    return None
+                if not known:
+                    errors.append(f"{kind} '{slug}' tidak dikenal")
+        return errors
@@ -0,0 +1,154 @@
+import numpy as np
+
+from catch_engine import BALL_NAMES, STATUSES, ball_multipliers, capture_probability
+
+# Move pendukung: efek HP (False Swipe -> sisa 1 HP) atau status beserta akurasinya.
+MOVES = {
+    "False Swipe": {"hp_to_one": True},
+    "Spore": {"status": "Asleep, Frozen", "accuracy": 1.0},
+    "Hypnosis": {"status": "Asleep, Frozen", "accuracy": 0.6},
+    "Thunder Wave": {"status": "Paralyzed, Poisoned, Burned", "accuracy": 0.9},
+}
+ACTIONS = BALL_NAMES + tuple(MOVES)
+QUICK_BALL = "Quick Ball (Turn 1)"
+
+# Kode status per trial: indeks ke STATUSES (0 = tanpa status).
+_STATUS_CODES = {name: i for i, name in enumerate(STATUSES)}
+_SLEEP = _STATUS_CODES["Asleep, Frozen"]
+SLEEP_TURNS = (1, 3)
+
+PRESET_STRATEGIES = {
+    "Quick Ball turn 1, lalu False Swipe + Ultra Ball": ["Quick Ball (Turn 1)", "False Swipe", "Ultra Ball"],
+    "Tidurkan dulu (Spore), lalu Great Ball": ["Spore", "Great Ball"],
+    "Thunder Wave, lalu Ultra Ball": ["Thunder Wave", "Ultra Ball"],
+    "Hanya Poké Ball": ["Poké Ball"],
+}
+
+
+def simulate_strategy(plan, capture_rate, type_idx, start_hp=1.0, max_hp=100, trials=1_000_000,
+                      max_turns=50, costs=None, reapply_status=True, caught_count=0, seed=None):
+    """Menjalankan strategi tangkap multi-turn untuk banyak trial sekaligus.
+
+    plan: daftar aksi per turn (nama ball dari BALLS atau move dari MOVES); aksi
+    terakhir diulang sampai tertangkap atau `max_turns`. Dengan `reapply_status`,
+    trial tanpa status (move status meleset atau target sudah bangun) memakai
+    ulang move status terakhir alih-alih melempar ball. Semua trial aktif diproses per turn dengan satu
+    panggilan RNG ber-batch.
+
+    Mengembalikan dict array per trial: caught, turns, balls, cost (₽ dari `costs`,
+    {nama ball: harga}).
+    """
+    rng = np.random.default_rng(seed)
+    costs = costs or {}
+    ball_mult = ball_multipliers(np.asarray(type_idx).reshape(1, 2))[0]
+    status_mult = np.array(list(STATUSES.values()))
+    hp_levels = np.array([start_hp, min(start_hp, 1.0 / max_hp)])
+
+    # HP hanya punya dua keadaan (awal / 1 HP) sehingga peluang tangkap tiap ball
+    # cukup dihitung sekali per (HP, status) lalu diambil lewat indeks: (2, B, K).
+    def p_table(mult):
+        a = capture_rate * ((3.0 - 2.0 * hp_levels) / 3.0)[:, None, None] * mult[None, :, None] * status_mult
+        return capture_probability(a, caught_count)
+
+    p_first = p_table(ball_mult)
+    later_mult = ball_mult.copy()
+    later_mult[BALL_NAMES.index(QUICK_BALL)] = 1.0    # Quick Ball hanya kuat di turn pertama
+    p_later = p_table(later_mult)
+
+    turns = np.full(trials, max_turns, dtype=np.int16)
+    balls = np.zeros(trials, dtype=np.int16)
+    cost = np.zeros(trials, dtype=np.float64)
+    caught = np.zeros(trials, dtype=bool)
+
+    # State trial aktif. Trial yang tertangkap hanya ditandai `live=False`; array
+    # baru dipadatkan setelah separuhnya selesai agar tidak menyalin tiap turn.
+    state = {
+        "idx": np.arange(trials),
+        "live": np.ones(trials, dtype=bool),
+        "hp": np.zeros(trials, dtype=np.int8),
+        "status": np.zeros(trials, dtype=np.int8),
+        "sleep_left": np.zeros(trials, dtype=np.int8),
+        "balls": np.zeros(trials, dtype=np.int16),
+        "cost": np.zeros(trials, dtype=np.float64),
+    }
+    n_live = trials
+    n_status = len(STATUSES)
+    uses_sleep = any(MOVES.get(action, {}).get("status") == "Asleep, Frozen" for action in plan)
+    status_move = None
+
+    for turn in range(max_turns):
+        if not n_live:
+            break
+        if n_live < len(state["idx"]) // 2:
+            state = {key: values[state["live"]] for key, values in state.items()}
+        n = len(state["idx"])
+        live = state["live"]
+        action = plan[min(turn, len(plan) - 1)]
+
+        if action in MOVES:
+            _apply_move(action, live, rng, state)
+            if "status" in MOVES[action]:
+                status_move = action
+        else:
+            throw = live
+            if reapply_status and status_move:
+                retry = live & (state["status"] == 0)
+                _apply_move(status_move, retry, rng, state)
+                throw = live & ~retry
+
+            col = BALL_NAMES.index(action)
+            table = p_first if turn == 0 else p_later
+            # Peluang per trial lewat satu take dari tabel (HP, status) milik ball ini.
+            p = table[:, col, :].astype(np.float32).ravel().take(state["hp"] * n_status + state["status"])
+            success = throw & (rng.random(n, dtype=np.float32) < p)
+            state["balls"] += throw
+            price = costs.get(action, 0)
+            if price:
+                state["cost"] += throw * price
+
+            done = state["idx"][success]
+            caught[done] = True
+            turns[done] = turn + 1
+            balls[done] = state["balls"][success]
+            cost[done] = state["cost"][success]
+            live &= ~success
+            n_live -= len(done)
+
+        # Tidur berkurang satu turn; yang bangun kembali tanpa status.
+        if uses_sleep:
+            sleeping = state["status"] == _SLEEP
+            state["sleep_left"] -= sleeping
+            state["status"][sleeping & (state["sleep_left"] <= 0)] = 0
+
+    # Trial yang tidak tertangkap sampai max_turns tetap dicatat ball & biayanya.
+    left = state["idx"][state["live"]]
+    balls[left] = state["balls"][state["live"]]
+    cost[left] = state["cost"][state["live"]]
+    return {"caught": caught, "turns": turns, "balls": balls, "cost": cost}
+
+
+def _apply_move(action, mask, rng, state):
+    spec = MOVES[action]
+    if spec.get("hp_to_one"):
+        state["hp"][mask] = 1
+    if "status" in spec:
+        # Status baru hanya bisa diberikan pada target tanpa status.
+        hit = mask & (state["status"] == 0) & (rng.random(len(mask)) < spec["accuracy"])
+        code = _STATUS_CODES[spec["status"]]
+        state["status"][hit] = code
+        if code == _SLEEP:
+            state["sleep_left"][hit] = rng.integers(SLEEP_TURNS[0], SLEEP_TURNS[1] + 1, size=int(hit.sum()))
+
+
+def summarize(result):
+    """Ringkasan distribusi: peluang tertangkap, rata-rata/persentil turn, ball, dan biaya."""
+    caught = result["caught"]
+    summary = {"capture_rate": float(caught.mean()) if len(caught) else 0.0}
+    for key in ("turns", "balls", "cost"):
+        values = result[key][caught]
+        if len(values):
+            p50, p90 = np.percentile(values, [50, 90])
+            summary[key] = {"mean": float(values.mean()), "p50": float(p50), "p90": float(p90)}
+        else:
+            summary[key] = {"mean": float("nan"), "p50": float("nan"), "p90": float("nan")}
+    return summary
@@ -0,0 +1,112 @@
+import numpy as np
+
+from type_chart import TYPE_INDEX
+
+# Nama tampilan -> (multiplier, tipe target yang disyaratkan atau None, slug item PokeAPI).
+BALLS = {
+    "Poké Ball": (1.0, None, "poke-ball"),
+    "Great Ball": (1.5, None, "great-ball"),
+    "Ultra Ball": (2.0, None, "ultra-ball"),
+    "Master Ball": (np.inf, None, "master-ball"),
+    "Quick Ball (Turn 1)": (5.0, None, "quick-ball"),
+    "Net Ball (Water/Bug)": (3.5, ("water", "bug"), "net-ball"),
+    "Dusk Ball (Malam/Gua)": (3.0, None, "dusk-ball"),
+}
+BALL_NAMES = tuple(BALLS)
+
+STATUSES = {
+    "None": 1.0,
+    "Paralyzed, Poisoned, Burned": 1.5,
+    "Asleep, Frozen": 2.5,
+}
+STATUS_NAMES = tuple(STATUSES)
+
+# Jumlah Pokémon tertangkap di Pokédex -> multiplier peluang critical capture.
+CRITICAL_THRESHOLDS = ((600, 2.5), (450, 2.0), (300, 1.5), (150, 1.0), (30, 0.5))
+
+SHAKE_CHECKS = 4
+
+
+def ball_multipliers(type_idx, balls=BALLS):
+    """Multiplier tiap ball untuk tiap species: (S, B); syarat tipe (Net Ball) dicek per baris.
+
+    type_idx: (S, 2) dari `encode_type_combos`/DexTable.
+    """
+    mult = np.ones((len(type_idx), len(balls)), dtype=np.float64)
+    for col, (value, required_types, _) in enumerate(balls.values()):
+        if required_types is None:
+            mult[:, col] = value
+        else:
+            required = [TYPE_INDEX[t] for t in required_types]
+            mult[:, col] = np.where(np.isin(type_idx, required).any(1), value, 1.0)
+    return mult
+
+
+def modified_catch_rate(rates, hp_fractions, ball_mult, status_mult):
+    """Nilai "a" generasi modern untuk seluruh kombinasi: (S, H, B, K).
+
+    a = (3M - 2H) / 3M * capture_rate * ball * status, dengan H/M = hp_fractions.
+    """
+    rates = np.asarray(rates, dtype=np.float64)[:, None, None, None]
+    hp = (3.0 - 2.0 * np.asarray(hp_fractions, dtype=np.float64)) / 3.0
+    ball = np.broadcast_to(np.asarray(ball_mult, dtype=np.float64), (rates.shape[0], np.shape(ball_mult)[-1]))
+    status = np.asarray(status_mult, dtype=np.float64)
+    with np.errstate(invalid="ignore"):
+        a = rates * hp[None, :, None, None] * ball[:, None, :, None] * status[None, None, None, :]
+    # 0 * inf (Master Ball pada capture_rate 0) -> 0: species itu memang tidak bisa ditangkap.
+    return np.nan_to_num(a, nan=0.0)
+
+
+def shake_probability(a):
+    """Peluang lolos satu shake check: b / 65536 dengan b = 65536 / (255 / a)^(3/16)."""
+    a = np.clip(a, 0.0, 255.0)
+    with np.errstate(divide="ignore"):
+        b = np.floor(65536.0 / np.power(255.0 / a, 3.0 / 16.0))
+    return np.minimum(b, 65536.0) / 65536.0
+
+
+def critical_chance(a, caught_count=0):
+    """Peluang critical capture (hanya satu shake check) berdasarkan jumlah tertangkap.
+
+    c = floor(min(255, a) * multiplier / 6); critical terjadi jika rand(0..255) < c.
+    """
+    multiplier = next((m for threshold, m in CRITICAL_THRESHOLDS if caught_count > threshold), 0.0)
+    return np.floor(np.clip(a, 0.0, 255.0) * multiplier / 6.0) / 256.0
+
+
+def capture_probability(a, caught_count=0):
+    """Peluang tertangkap per lemparan termasuk shake check dan critical capture.
+
+    a >= 255 selalu tertangkap; selain itu perlu lolos 4 shake check (1 jika critical).
+    """
+    shake = shake_probability(a)
+    crit = critical_chance(a, caught_count)
+    p = crit * shake + (1.0 - crit) * shake ** SHAKE_CHECKS
+    return np.where(a >= 255.0, 1.0, p)
+
+
+def expected_balls(p):
+    """Rata-rata jumlah lemparan sampai tertangkap (geometrik): 1/p, tak hingga jika p = 0."""
+    with np.errstate(divide="ignore"):
+        return np.where(p > 0, 1.0 / p, np.inf)
+
+
+def capture_table(rates, type_idx, hp_fractions, statuses=STATUS_NAMES, balls=BALLS, caught_count=0):
+    """Peluang tangkap (S, H, B, K) untuk semua species × HP × ball × status dalam satu pass."""
+    a = modified_catch_rate(rates, hp_fractions, ball_multipliers(type_idx, balls),
+                            [STATUSES[s] for s in statuses])
+    return capture_probability(a, caught_count)
+
+
+def best_ball(p, ball_names=BALL_NAMES, costs=None, exclude=("Master Ball",)):
+    """Indeks ball terbaik di sumbu ball (sumbu terakhir `p`, mis. (S, B)).
+
+    Tanpa `costs`: peluang tertinggi. Dengan `costs` (₽ per ball, urutan `ball_names`):
+    biaya harapan terendah = harga / p. Ball di `exclude` tidak dipertimbangkan.
+    """
+    allowed = np.array([name not in exclude for name in ball_names])
+    if costs is None:
+        score = np.where(allowed, p, -1.0)
+        return np.argmax(score, axis=-1)
+    expected_cost = np.asarray(costs, dtype=np.float64) * expected_balls(p)
+    return np.argmin(np.where(allowed, expected_cost, np.inf), axis=-1)
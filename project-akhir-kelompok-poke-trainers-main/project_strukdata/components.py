@@ -1,9 +1,60 @@
-import requests
+import os
 import re
+import threading
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st 
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+import http_cache
+import http_transport
+import thumbnails
+from dex_table import DexTable
+from encounter_index import EncounterIndex
+from encyclopedia_index import KINDS, ROW_BUILDERS, EncyclopediaIndex, ResourceTable
+from evolution_index import EvolutionIndex
+from generation_index import GENERATION_COUNT, GenerationIndex
+from pokeapi_store import fetch_from_store
+from pokemon_record import PokemonRecord
+from stat_calc import SpeedTiers
+from type_chart import (
+    ATTACKING_TYPES,
+    build_type_matrix,
+    defensive_multipliers,
+    summarize_matchups,
+)
 
 API_BASE = "https://pokeapi.co/api/v2"
 
+# Mode pengambilan data:
+#   "online"  - langsung ke pokeapi.co (default)
+#   "hybrid"  - coba store lokal dulu, lalu network jika tidak ada
+#   "offline" - hanya dari store lokal, tanpa network sama sekali
+FETCH_MODE = os.environ.get("POKEDEX_FETCH_MODE", "online").lower()
+
+# Pool thread bersama untuk memuat banyak detail Pokémon sekaligus.
+BULK_MAX_WORKERS = 8
+_bulk_pool = ThreadPoolExecutor(max_workers=BULK_MAX_WORKERS, thread_name_prefix="pokedex-bulk")
+
+# Jeda (detik) sebelum indeks yang belum lengkap (encounter/ensiklopedia) dicoba dibangun ulang.
+INDEX_RETRY_INTERVAL = 600
+
+_type_matrix = None
+_generation_index = None
+_evolution_index = None
+_dex_table = None
+_dex_partial = None             # (tabel parsial, waktu dibangun) saat sebagian request gagal
+_dex_lock = threading.Lock()
+_encyclopedia_index = None
+_encyclopedia_partial = None    # (indeks parsial, waktu dibangun) saat sebagian request gagal
+_encyclopedia_lock = threading.Lock()
+_encounter_index = None
+_encounter_partial = None       # (indeks parsial, waktu dibangun) saat sebagian request gagal
+_encounter_lock = threading.Lock()
+_speed_tiers = {}
+_card_html_cache = {}
+
 def set_page_config_and_style():
     """Mengatur konfigurasi halaman Streamlit dan injeksi CSS kustom."""
     st.set_page_config(page_title="Pokédex", layout="wide", page_icon="🧭")
@@ -13,6 +64,8 @@ def set_page_config_and_style():
 /* Header & Kartu */
 .header-title {font-size:36px; font-weight:800; color:#2b6cb0;}
 .card {border:2px solid #2b6cb0; border-radius:12px; padding:14px; background:white;}
+.card-dark {background:#1e2330; color:#f1f1f1;}
+.card-grid {display:grid; grid-template-columns:repeat(3, minmax(0, 1fr)); gap:16px; margin-bottom:16px;}
 .type-badge {
     display:inline-block; padding:6px 10px; 
     border-radius:999px; margin-right:6px;
@@ -48,45 +101,106 @@ section[data-testid="stSidebar"] {
 </style>
 """, unsafe_allow_html=True)
 
+def _fetch_uncached(url):
+    """GET ke URL lewat store lokal / cache disk / network, tanpa memoisasi di memori."""
+    if FETCH_MODE in ("offline", "hybrid"):
+        data = fetch_from_store(url)
+        if data is not None or FETCH_MODE == "offline":
+            return data
+
+    cached = http_cache.lookup(url)
+    if cached and cached[1]:
+        return cached[0]
+    headers = cached[2] if cached else {}
+    try:
+        r = http_transport.get(url, headers=headers)
+        if r.status_code == 304 and cached:
+            http_cache.refresh(url)
+            return cached[0]
+        if r.status_code == 200:
+            data = r.json()
+            http_cache.store(url, data, r.headers.get("ETag"), r.headers.get("Last-Modified"))
+            return data
+    except (http_transport.TransportError, ValueError) as e:
+        print(f"PokeAPI Error: {e}")
+        # Network gagal: sajikan salinan lama (stale) jika ada.
+        return cached[0] if cached else None
+    # Status lain (mis. 5xx/403 yang tidak diulang): sama, pakai salinan lama jika ada.
+    return cached[0] if cached else None
+
 @st.cache_data(ttl=3600) 
 def fetch(url):
     """Melakukan GET request ke URL yang diberikan."""
-    try:
-        r = requests.get(url, timeout=8)
-        if r.status_code == 200:
-            return r.json()
-    except Exception:
-        return None
-    return None
+    return _fetch_uncached(url)
 
 @st.cache_data(ttl=3600) 
 def get_pokemon_detail(name_or_id):
-    """Mengambil detail Pokémon dari endpoint /pokemon/{id or name}."""
-    return fetch(f"{API_BASE}/pokemon/{name_or_id}")
+    """Mengambil detail ringkas (PokemonRecord) dari endpoint /pokemon/{id or name}.
+
+    Payload penuh tidak ikut di-cache di memori; hanya proyeksinya.
+    """
+    data = _fetch_uncached(f"{API_BASE}/pokemon/{name_or_id}")
+    return PokemonRecord.from_api(data) if data else None
+
+def get_pokemon_full(name_or_id):
+    """Payload /pokemon lengkap (termasuk moves) untuk halaman yang membutuhkannya."""
+    return _fetch_uncached(f"{API_BASE}/pokemon/{name_or_id}")
+
+def _map_in_pool(fn, items):
+    """Menjalankan fn untuk setiap item di thread pool bersama; urutan hasil mengikuti input."""
+    ctx = get_script_run_ctx()
+
+    def run(item):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(item)
+
+    return list(_bulk_pool.map(run, items))
+
+def get_pokemon_details_bulk(names_or_ids):
+    """Mengambil detail banyak Pokémon secara paralel; urutan hasil mengikuti input.
+
+    Entri yang tidak ditemukan bernilai None. ID/nama duplikat hanya diambil sekali.
+    """
+    keys = [str(k).lower().strip() for k in names_or_ids]
+    unique_keys = list(dict.fromkeys(keys))
+    if not unique_keys:
+        return []
+
+    loaded = _map_in_pool(lambda key: get_pokemon_detail(int(key) if key.isdigit() else key), unique_keys)
+    results = dict(zip(unique_keys, loaded))
+    return [results[k] for k in keys]
+
+@st.cache_data(ttl=3600)
+def get_pokemon_move_names(name_or_id):
+    """Nama semua move yang bisa dipelajari Pokémon (tanpa menyimpan payload penuh)."""
+    data = get_pokemon_full(name_or_id)
+    if not data:
+        return ()
+    return tuple(m['move']['name'] for m in data.get('moves', []))
+
+def get_pokemon_moves_bulk(names):
+    """Learnset banyak Pokémon secara paralel: {nama: tuple nama move}."""
+    keys = list(dict.fromkeys(str(n).lower().strip() for n in names))
+    return dict(zip(keys, _map_in_pool(get_pokemon_move_names, keys)))
 
 @st.cache_data(ttl=3600)
 def get_pokemon_species_data(name_or_id):
     """Mengambil data species untuk menemukan rantai evolusi."""
     return fetch(f"{API_BASE}/pokemon-species/{name_or_id}")
 
-@st.cache_data(ttl=3600)
 def get_evolution_chain_names(chain_url):
     """Mengambil semua nama Pokémon dalam satu rantai evolusi."""
+    index = get_evolution_index()
+    m = re.search(r"/evolution-chain/(\d+)/?$", chain_url or "")
+    if m and int(m.group(1)) in index.chains:
+        return [name.title() for name in index.chain_members(int(m.group(1)))]
+
     data = fetch(chain_url)
-    if not data:
+    if not data or not data.get('chain'):
         return []
-    
-    names = []
-    def extract_names_recursive(chain):
-        species_name = chain['species']['name']
-        names.append(species_name.title())
-        for evolution in chain['evolves_to']:
-            extract_names_recursive(evolution)
-
-    if data.get('chain'):
-        extract_names_recursive(data['chain'])
-        
-    return names
+    chain_id = index.add_chain(data)
+    index.save()
+    return [name.title() for name in index.chain_members(chain_id)]
 
 @st.cache_data(ttl=3600)
 def get_type_damage_relations(type_name):
@@ -120,39 +234,305 @@ def get_generation_range_from_api(gen_number):
         return None
     return (min(ids), max(ids), len(ids), None)
 
-@st.cache_data(ttl=3600)
-def compute_weaknesses(types_list):
+def get_generation_index():
+    """Indeks generasi (dimuat dari disk, atau dibangun sekali dari /generation/{n})."""
+    global _generation_index
+    if _generation_index is None:
+        index = GenerationIndex.load()
+        if index is None:
+            ids_by_gen = {}
+            for gen in range(1, GENERATION_COUNT + 1):
+                data = fetch(f"{API_BASE}/generation/{gen}")
+                if not data:
+                    break
+                ids_by_gen[gen] = [
+                    sid for sid in (_extract_id_from_species_url(s.get("url", "")) for s in data.get("pokemon_species", []))
+                    if sid
+                ]
+            if len(ids_by_gen) < GENERATION_COUNT:
+                # API belum bisa diakses: pakai rentang statis tanpa menyimpannya.
+                return GenerationIndex.from_ranges()
+            index = GenerationIndex(ids_by_gen)
+            index.save()
+        _generation_index = index
+    return _generation_index
+
+def _build_dex_table():
+    """Mengambil /pokemon seluruh dex (paralel); mengembalikan (tabel, lengkap?)."""
+    records = get_pokemon_details_bulk(get_generation_index().ids().tolist())
+    return DexTable.from_records(records), all(records)
+
+def peek_dex_table():
+    """Dex table lengkap jika sudah ada di memori atau di disk, tanpa membangunnya (None jika belum)."""
+    global _dex_table
+    if _dex_table is None:
+        _dex_table = DexTable.load()
+    return _dex_table
+
+def get_dex_table(build=True):
+    """Tabel kolumnar tipe & base stat seluruh dex (dimuat dari disk atau dibangun sekali).
+
+    Tabel parsial disimpan di memori dan baru dibangun ulang setelah
+    INDEX_RETRY_INTERVAL detik. Dengan build=False hanya tabel yang sudah ada
+    (lengkap atau parsial) yang dikembalikan (None jika belum ada).
+    """
+    global _dex_table, _dex_partial
+    if peek_dex_table() is not None:
+        return _dex_table
+    if not build:
+        return _dex_partial[0] if _dex_partial else None
+    with _dex_lock:
+        if _dex_table is not None:
+            return _dex_table
+        if _dex_partial and time.time() - _dex_partial[1] < INDEX_RETRY_INTERVAL:
+            return _dex_partial[0]
+
+        table, complete = _build_dex_table()
+        if not complete:
+            # Sebagian data gagal diambil: pakai sementara tanpa menyimpan.
+            _dex_partial = (table, time.time())
+            return table
+        table.save()
+        _dex_partial = None
+        _dex_table = table
+    return _dex_table
+
+def prebuild_dex_table():
+    """Membangun dex table lalu menyimpannya; mengembalikan jumlah species."""
+    global _dex_table, _dex_partial
+    with _dex_lock:
+        table, complete = _build_dex_table()
+        if not complete:
+            print("Dex Table Error: sebagian data Pokémon gagal diambil, tabel tidak disimpan.")
+            _dex_partial = (table, time.time())
+        else:
+            table.save()
+            _dex_partial = None
+            _dex_table = table
+    return len(table)
+
+def get_capture_rates():
+    """capture_rate tiap baris dex table (diambil sekali dari /pokemon-species lalu disimpan bersama tabel)."""
+    table = get_dex_table()
+    if table.capture_rate is None:
+        species = _map_in_pool(
+            lambda pid: _fetch_uncached(f"{API_BASE}/pokemon-species/{pid}"), table.ids.tolist()
+        )
+        rates = np.array([s.get('capture_rate') or 0 if s else 0 for s in species], dtype=np.int16)
+        if not all(species):
+            # Sebagian species gagal diambil: nilai 0 (tidak tertangkap) dan tidak disimpan.
+            return rates
+        table.capture_rate = rates
+        if table is _dex_table:
+            table.save()
+    return table.capture_rate
+
+def get_item_costs(slugs):
+    """Harga (₽) item dari data /item/{slug}: {slug: cost}; item yang gagal diambil bernilai 0."""
+    slugs = list(dict.fromkeys(slugs))
+    items = _map_in_pool(lambda slug: fetch(f"{API_BASE}/item/{slug}"), slugs)
+    return {slug: (item.get('cost') or 0) if item else 0 for slug, item in zip(slugs, items)}
+
+def _build_resource_table(kind):
+    """Mengambil seluruh move/item/ability secara paralel; (tabel, lengkap?)."""
+    listing = fetch(f"{API_BASE}/{kind}?limit=5000")
+    urls = [r['url'] for r in listing.get('results', [])] if listing else []
+    payloads = _map_in_pool(_fetch_uncached, urls)
+    rows = [ROW_BUILDERS[kind](p) for p in payloads if p]
+    return ResourceTable.from_rows(kind, rows), bool(urls) and all(payloads)
+
+def _build_encyclopedia_index():
+    """Membangun ketiga tabel ensiklopedia; mengembalikan (indeks, lengkap?)."""
+    built = {kind: _build_resource_table(kind) for kind in KINDS}
+    index = EncyclopediaIndex({kind: table for kind, (table, _) in built.items()})
+    return index, all(complete for _, complete in built.values())
+
+def get_encyclopedia_index(build=True):
+    """Indeks kolumnar move/item/ability bersama untuk semua sesi.
+
+    Dimuat dari disk, atau dibangun sekali (satu builder per proses). Indeks
+    parsial disimpan di memori dan baru dibangun ulang setelah
+    INDEX_RETRY_INTERVAL detik. Dengan build=False hanya indeks yang sudah ada
+    (lengkap atau parsial) yang dikembalikan (None jika belum ada).
+    """
+    global _encyclopedia_index, _encyclopedia_partial
+    if peek_encyclopedia_index() is not None:
+        return _encyclopedia_index
+    if not build:
+        # Tanpa lock: halaman tidak ikut menunggu builder yang sedang berjalan.
+        return _encyclopedia_partial[0] if _encyclopedia_partial else None
+    with _encyclopedia_lock:
+        if _encyclopedia_index is not None:
+            return _encyclopedia_index
+        if _encyclopedia_partial and time.time() - _encyclopedia_partial[1] < INDEX_RETRY_INTERVAL:
+            return _encyclopedia_partial[0]
+
+        index, complete = _build_encyclopedia_index()
+        if not complete:
+            # Sebagian data gagal diambil: pakai sementara tanpa menyimpan.
+            _encyclopedia_partial = (index, time.time())
+            return index
+        index.save()
+        _encyclopedia_partial = None
+        _encyclopedia_index = index
+    return _encyclopedia_index
+
+def prebuild_encyclopedia_index():
+    """Membangun indeks move/item/ability lalu menyimpannya; mengembalikan jumlah baris per jenis."""
+    global _encyclopedia_index, _encyclopedia_partial
+    with _encyclopedia_lock:
+        index, complete = _build_encyclopedia_index()
+        if not complete:
+            print("Encyclopedia Index Error: sebagian data gagal diambil, indeks tidak disimpan.")
+            _encyclopedia_partial = (index, time.time())
+        else:
+            index.save()
+            _encyclopedia_partial = None
+            _encyclopedia_index = index
+    return {kind: len(table) for kind, table in index.tables.items()}
+
+def peek_encyclopedia_index():
+    """Indeks ensiklopedia lengkap jika sudah ada di memori atau di disk, tanpa membangunnya (None jika belum)."""
+    global _encyclopedia_index
+    if _encyclopedia_index is None:
+        _encyclopedia_index = EncyclopediaIndex.load()
+    return _encyclopedia_index
+
+def is_known_resource(kind, slug):
+    """True/False jika move/item/ability `slug` ada di ensiklopedia lokal; None jika indeks lengkap belum tersedia.
+
+    Tidak pernah membangun indeks, agar lookup template build tidak menunggu ribuan request.
+    """
+    index = peek_encyclopedia_index()
+    table = index.tables.get(kind) if index else None
+    if table is None or not len(table):
+        return None
+    return slug in table
+
+def _build_encounter_index():
+    """Mengambil /encounters seluruh dex (paralel); mengembalikan (indeks, lengkap?)."""
+    table = get_dex_table()
+    payloads = _map_in_pool(
+        lambda pid: _fetch_uncached(f"{API_BASE}/pokemon/{pid}/encounters"), table.ids.tolist()
+    )
+    index = EncounterIndex.from_encounters(dict(zip(table.names.tolist(), payloads)))
+    return index, bool(len(table)) and all(p is not None for p in payloads)
+
+def get_encounter_index(build=True):
+    """Indeks encounter Pokémon <-> area bersama untuk semua sesi.
+
+    Dimuat dari disk, atau dibangun sekali (satu builder per proses). Indeks
+    parsial disimpan di memori dan baru dibangun ulang setelah
+    INDEX_RETRY_INTERVAL detik. Dengan build=False hanya indeks yang sudah
+    ada (lengkap atau parsial) yang dikembalikan (None jika belum ada).
+    """
+    global _encounter_index, _encounter_partial
+    if _encounter_index is None:
+        _encounter_index = EncounterIndex.load()
+    if _encounter_index is not None:
+        return _encounter_index
+    if not build:
+        # Tanpa lock: halaman tidak ikut menunggu builder yang sedang berjalan.
+        return _encounter_partial[0] if _encounter_partial else None
+    with _encounter_lock:
+        if _encounter_index is not None:
+            return _encounter_index
+        if _encounter_partial and time.time() - _encounter_partial[1] < INDEX_RETRY_INTERVAL:
+            return _encounter_partial[0]
+
+        index, complete = _build_encounter_index()
+        if not complete:
+            # Sebagian data gagal diambil: pakai sementara tanpa menyimpan.
+            _encounter_partial = (index, time.time())
+            return index
+        index.save()
+        _encounter_partial = None
+        _encounter_index = index
+    return _encounter_index
+
+def is_encounter_index_partial():
+    """True jika indeks encounter yang dipakai saat ini belum lengkap (belum disimpan ke disk)."""
+    return _encounter_index is None and _encounter_partial is not None
+
+def prebuild_encounter_index():
+    """Membangun indeks encounter seluruh dex lalu menyimpannya; mengembalikan jumlah baris."""
+    global _encounter_index, _encounter_partial
+    with _encounter_lock:
+        index, complete = _build_encounter_index()
+        if not complete:
+            print("Encounter Index Error: sebagian data encounter gagal diambil, indeks tidak disimpan.")
+            _encounter_partial = (index, time.time())
+            return len(index)
+        index.save()
+        _encounter_partial = None
+        _encounter_index = index
+    return len(index)
+
+def get_speed_tiers(level=50, build=True):
+    """Tabel speed tier seluruh dex untuk satu level (dibangun sekali per proses dari dex table).
+
+    Dengan build=False mengembalikan None jika dex table belum tersedia.
+    """
+    tiers = _speed_tiers.get(level)
+    if tiers is None:
+        table = get_dex_table(build)
+        if table is None:
+            return None
+        tiers = SpeedTiers(table.names, table.stats, level)
+        if table is _dex_table:
+            _speed_tiers[level] = tiers
+    return tiers
+
+def get_type_matrix():
+    """Matriks efektivitas tipe (dibangun sekali per proses dari endpoint /type)."""
+    global _type_matrix
+    if _type_matrix is None:
+        relations = {t: get_type_damage_relations(t) for t in ATTACKING_TYPES}
+        matrix = build_type_matrix(relations)
+        if not all(relations.values()):
+            # Jangan simpan matriks yang tidak lengkap; coba lagi di panggilan berikutnya.
+            return matrix
+        _type_matrix = matrix
+    return _type_matrix
+
+def get_type_matchups(type_combos):
+    """Weakness/resistance/immunity lengkap untuk banyak kombinasi tipe dalam satu panggilan."""
+    return summarize_matchups(defensive_multipliers(get_type_matrix(), type_combos))
 
-    multiplier = {}
-    for t in types_list:
-        rel = get_type_damage_relations(t)
-        if not rel:
-            continue
-        for a in rel.get('double_damage_from', []):
-            multiplier[a['name']] = multiplier.get(a['name'], 1) * 2
-        for a in rel.get('half_damage_from', []):
-            multiplier[a['name']] = multiplier.get(a['name'], 1) * 0.5
-        for a in rel.get('no_damage_from', []):
-            multiplier[a['name']] = 0
-    return [k for k, v in multiplier.items() if v > 1]
+def compute_weaknesses(types_list):
+    """Daftar tipe penyerang yang super efektif (>1x) terhadap kombinasi tipe ini."""
+    multipliers = defensive_multipliers(get_type_matrix(), [tuple(types_list)])[0]
+    return [ATTACKING_TYPES[i] for i in np.flatnonzero(multipliers > 1)]
 
 def is_gmail(email: str) -> bool:
     """Validasi sederhana untuk memastikan email memakai domain @gmail.com."""
     return re.fullmatch(r'[a-zA-Z0-9._%+-]+@gmail\.com', email) is not None
 
-def pokemon_card_html(detail, include_id=True):
-    """Membangun potongan HTML untuk menampilkan kartu Pokémon."""
-    name = detail['name'].title()
-    num = detail['id']
-    types = [t['type']['name'] for t in detail['types']]
-    abilities = [a['ability']['name'] for a in detail['abilities']]
-    artwork = detail['sprites'].get('other', {}).get('official-artwork', {}).get('front_default') \
-              or detail['sprites'].get('front_default')
-    weakness = compute_weaknesses(tuple(types)) 
+def _card_theme():
+    """Tema aktif Streamlit ("light"/"dark"); menjadi bagian kunci cache kartu."""
+    return st.get_option("theme.base") or "light"
+
+def thumbnail_src(detail, size):
+    """Thumbnail lokal artwork Pokémon pada ukuran tampilan (220 kartu, 50 ikon)."""
+    return thumbnails.thumbnail_src(detail.id, detail.image, size, st.get_option("server.enableStaticServing"))
+
+def thumbnail_file(detail, size):
+    """Path file thumbnail lokal untuk st.image, atau URL asli jika gagal dibuat."""
+    if not detail.image:
+        return None
+    return thumbnails.ensure_thumbnail(detail.id, detail.image, size) or detail.image
+
+def _build_card_html(detail, include_id, theme):
+    name = detail.name.title()
+    num = detail.id
+    types = detail.types
+    abilities = detail.abilities
+    artwork = thumbnail_src(detail, 220)
+    weakness = compute_weaknesses(types) 
 
     id_tag = f"<span class='small'>#{num:04d}</span>" if include_id else ""
 
-    html = f"<div class='card'>"
+    html = f"<div class='card{' card-dark' if theme == 'dark' else ''}'>"
     if artwork:
         html += f"<img src='{artwork}' width='220' style='display:block;margin:auto'/>"
     html += f"<div style='text-align:center;margin-top:8px'><strong>{name}</strong> {id_tag}</div>"
@@ -162,76 +542,150 @@ def pokemon_card_html(detail, include_id=True):
     html += "</div>"
     return html
 
+def pokemon_card_html(detail, include_id=True):
+    """Membangun potongan HTML untuk menampilkan kartu Pokémon.
 
-@st.cache_data(ttl=86400)
-def _get_evolution_chain_names(chain_data, names):
-    """Menganalisis struktur rantai evolusi secara rekursif."""
-    names.append(chain_data['species']['name'].title())
-    
-    for evo in chain_data['evolves_to']:
-        _get_evolution_chain_names(evo, names)
-    return names
+    Hasil di-cache per (id, include_id, tema) sehingga rerun tidak membangun
+    ulang string maupun menghitung ulang weakness.
+    """
+    key = (detail.id, include_id, _card_theme())
+    html = _card_html_cache.get(key)
+    if html is None:
+        html = _build_card_html(detail, include_id, key[2])
+        # Weakness dari matriks tipe yang belum lengkap, atau artwork asli karena
+        # thumbnail gagal dibuat (sementara), tidak di-cache.
+        if _type_matrix is not None and (not detail.image or thumbnails.has_thumbnail(detail.id, 220)):
+            _card_html_cache[key] = html
+    return html
+
+def pokemon_grid_html(details, include_id=True):
+    """Seluruh grid kartu sebagai satu potongan HTML (satu st.markdown per grid)."""
+    # Kartu yang belum di-cache (dan thumbnail-nya) dibangun paralel.
+    cards = "".join(_map_in_pool(lambda d: pokemon_card_html(d, include_id), [d for d in details if d]))
+    return f"<div class='card-grid'>{cards}</div>"
+
+
+def get_evolution_index():
+    """Indeks graf evolusi bersama (dimuat dari disk sekali per proses)."""
+    global _evolution_index
+    if _evolution_index is None:
+        _evolution_index = EvolutionIndex.load()
+    return _evolution_index
+
+def _species_slug(pokemon_name):
+    """"Flutter Mane" -> "flutter-mane"."""
+    return pokemon_name.strip().lower().replace(' ', '-')
+
+def _fetch_species_data(slug):
+    """Data /pokemon-species untuk nama species atau nama form Pokémon."""
+    species_data = fetch(f"{API_BASE}/pokemon-species/{slug}")
+    if not species_data:
+        # Nama form (mis. "charizard-mega-x"): cari species lewat endpoint /pokemon.
+        detail = get_pokemon_detail(slug)
+        species_data = fetch(detail.species_url) if detail and detail.species_url else None
+    return species_data
+
+def resolve_evolution_species_bulk(pokemon_names):
+    """Nama species (slug) per Pokémon, memastikan rantainya ada di indeks evolusi.
+
+    Species yang belum diindeks diambil paralel, lalu setiap rantai yang
+    berbeda diambil tepat sekali (juga paralel). None untuk nama tidak dikenal.
+    """
+    index = get_evolution_index()
+    slugs = [_species_slug(name) for name in pokemon_names]
+    missing = [slug for slug in dict.fromkeys(slugs) if slug not in index]
+
+    resolved = {}
+    if missing:
+        chain_urls = set()
+        for slug, species_data in zip(missing, _map_in_pool(_fetch_species_data, missing)):
+            if not species_data:
+                continue
+            resolved[slug] = species_data['name']
+            chain_url = (species_data.get('evolution_chain') or {}).get('url')
+            if chain_url and species_data['name'] not in index:
+                chain_urls.add(chain_url)
+        if chain_urls:
+            for data in _map_in_pool(fetch, sorted(chain_urls)):
+                if data and data.get('chain'):
+                    index.add_chain(data)
+            index.save()
+
+    results = []
+    for slug in slugs:
+        species = resolved.get(slug, slug)
+        results.append(species if species in index else None)
+    return results
+
+def _species_from_form(index, slug):
+    """Nama species di indeks untuk nama form dex ("deoxys-normal" -> "deoxys"), tanpa network."""
+    while slug not in index and '-' in slug:
+        slug = slug.rsplit('-', 1)[0]
+    return slug if slug in index else None
+
+def get_evolution_chain_ids(pokemon_names):
+    """Chain ID evolusi per Pokémon (None jika tidak dikenal).
+
+    Nama dicocokkan dulu ke indeks evolusi (termasuk nama form dex seperti
+    "giratina-altered"); hanya sisanya yang di-resolve lewat API.
+    """
+    index = get_evolution_index()
+    species = [_species_from_form(index, _species_slug(name)) for name in pokemon_names]
+    unresolved = [name for name, sp in zip(pokemon_names, species) if sp is None]
+    if unresolved:
+        resolved = dict(zip(unresolved, resolve_evolution_species_bulk(unresolved)))
+        species = [sp or resolved.get(name) for name, sp in zip(pokemon_names, species)]
+    return [index.chain_id_of(sp) if sp else None for sp in species]
+
+def resolve_evolution_species(pokemon_name):
+    """Nama species (slug) untuk satu Pokémon/form; lihat `resolve_evolution_species_bulk`."""
+    return resolve_evolution_species_bulk([pokemon_name])[0]
+
+def prebuild_evolution_index():
+    """Mengisi indeks evolusi dengan semua rantai dari API (paralel) lalu menyimpannya."""
+    index = get_evolution_index()
+    listing = fetch(f"{API_BASE}/evolution-chain?limit=10000")
+    urls = [item['url'] for item in (listing or {}).get('results', [])]
+    for data in _map_in_pool(_fetch_uncached, urls):
+        if data and data.get('chain'):
+            index.add_chain(data)
+    index.save()
+    return len(index.chains)
 
-@st.cache_data(ttl=86400)
 def get_evolution_line_from_pokemon(pokemon_name):
     """Mengambil seluruh garis evolusi (semua nama) untuk nama Pokémon yang diberikan."""
-
-    name_lower = pokemon_name.lower().split('-')[0]
-    
-    species_url = f"{API_BASE}/pokemon-species/{name_lower}"
-    species_data = fetch(species_url)
-
-    if not species_data or 'evolution_chain' not in species_data or not species_data.get('evolution_chain'):
-        return [pokemon_name.title()] 
-    
-    chain_url = species_data['evolution_chain']['url']
-    chain_data = fetch(chain_url)
-    
-    if not chain_data or 'chain' not in chain_data:
+    species = resolve_evolution_species(pokemon_name)
+    if not species:
         return [pokemon_name.title()]
-    
-    names = []
-    return _get_evolution_chain_names(chain_data['chain'], names)
+    return [name.title() for name in get_evolution_index().family(species)]
 
 def remove_evolutionary_duplicates(team_list):
     """
-    Memfilter daftar Pokémon untuk memastikan hanya ada satu Pokémon per garis evolusi.
-    Prioritas: Memilih evolusi tertinggi yang ada dalam daftar.
+    Memfilter daftar Pokémon untuk memastikan hanya ada satu Pokémon per rantai evolusi.
+    Prioritas: Memilih evolusi tertinggi yang ada dalam daftar. Aturannya sama dengan
+    optimizer (satu anggota per chain ID), jadi cabang berbeda dalam satu rantai
+    (mis. Vaporeon & Jolteon) juga dianggap duplikat; yang pertama di daftar dipertahankan.
     """
     if not team_list:
         return []
-    
-    evo_groups = {}
-    
-    for pokemon_name in team_list:
-        clean_name = pokemon_name.split('-')[0]
-
-        ordered_evo_line = get_evolution_line_from_pokemon(clean_name)
 
-        evo_line_identifier = tuple(ordered_evo_line) if ordered_evo_line else (pokemon_name,)
-        
-        if evo_line_identifier not in evo_groups:
-            evo_groups[evo_line_identifier] = []
+    index = get_evolution_index()
+    species = dict(zip(team_list, resolve_evolution_species_bulk(team_list)))
+    species = {name: sp or _species_slug(name) for name, sp in species.items()}
 
-        if pokemon_name not in evo_groups[evo_line_identifier]:
-            evo_groups[evo_line_identifier].append(pokemon_name)
+    # Rantai -> (stage, nama) terbaik; species yang tidak dikenal menjadi rantai sendiri.
+    best = {}
+    for pokemon_name in team_list:
+        sp = species[pokemon_name]
+        chain = index.chain_id_of(sp) or sp
+        stage = index.stage(sp)
+        if chain not in best or stage > best[chain][0]:
+            best[chain] = (stage, pokemon_name)
 
+    kept_names = {name for _, name in best.values()}
     final_team = []
-    
-    for ordered_evo_line, pokemon_names_in_group in evo_groups.items():
-        best_pokemon = None
-
-        for evo_name_in_line in reversed(ordered_evo_line):
-
-            matching_pokemon = [
-                name 
-                for name in pokemon_names_in_group 
-                if name.split('-')[0].title() == evo_name_in_line 
-            ]
-
-            if matching_pokemon: 
-                best_pokemon = matching_pokemon[0] 
-                final_team.append(best_pokemon)
-                break
-        
+    for pokemon_name in team_list:
+        if pokemon_name in kept_names and pokemon_name not in final_team:
+            final_team.append(pokemon_name)
+
     return final_team
@@ -0,0 +1,56 @@
+import numpy as np
+
+from pokemon_record import STAT_NAMES
+
+ROLLS = np.arange(85, 101)          # 16 random roll: 85%..100%
+STAB = 1.5
+
+_ATK, _DEF, _SPA, _SPD, _HP = (STAT_NAMES.index(s) for s in
+                               ("attack", "defense", "special-attack", "special-defense", "hp"))
+
+
+def damage_rolls(level, power, move_type, physical, atk_stats, atk_type_idx, def_stats, def_type_idx, matrix):
+    """Damage setiap roll untuk (tim × move × ancaman) dalam satu broadcast: (T, M, K, 16).
+
+    power/move_type/physical: (T, M) (power 0 = slot kosong atau move status);
+    atk_stats (T, 6), atk_type_idx (T, 2); def_stats (K, 6), def_type_idx (K, 2);
+    matrix: matriks tipe dari `build_type_matrix`.
+    Rumus: floor(floor(floor(2L/5 + 2) * P * A / D) / 50) + 2, lalu roll, STAB, dan
+    efektivitas tipe.
+    """
+    power = np.asarray(power, dtype=np.int64)
+    move_type = np.asarray(move_type, dtype=np.intp)
+    physical = np.asarray(physical, dtype=bool)
+    atk_stats = np.asarray(atk_stats, dtype=np.int64)
+    def_stats = np.asarray(def_stats, dtype=np.int64)
+
+    attack = np.where(physical, atk_stats[:, _ATK, None], atk_stats[:, _SPA, None])[:, :, None]       # (T, M, 1)
+    defense = np.where(physical[:, :, None], def_stats[:, _DEF], def_stats[:, _SPD])                  # (T, M, K)
+    base = (2 * level // 5 + 2) * power[:, :, None] * attack // defense // 50 + 2                     # (T, M, K)
+
+    damage = base[..., None] * ROLLS // 100                                                           # (T, M, K, R)
+    stab = (move_type[:, :, None] == np.asarray(atk_type_idx)[:, None, :]).any(-1)                   # (T, M)
+    damage = np.where(stab[:, :, None, None], np.floor(damage * STAB), damage)
+
+    by_move = matrix[move_type]                                                                       # (T, M, n_type+1)
+    def_type_idx = np.asarray(def_type_idx, dtype=np.intp)
+    effectiveness = by_move[..., def_type_idx[:, 0]] * by_move[..., def_type_idx[:, 1]]               # (T, M, K)
+    damage = np.floor(damage * effectiveness[..., None])
+    return np.where(power[:, :, None, None] > 0, damage, 0).astype(np.int64)
+
+
+def damage_summary(damage, def_stats):
+    """Ringkasan per (tim, move, ancaman): % HP minimum/maksimum dan peluang OHKO (rasio roll)."""
+    hp = np.asarray(def_stats, dtype=np.int64)[:, _HP][None, None, :, None]
+    percent = damage * 100.0 / hp
+    return {
+        "min_pct": percent.min(-1),
+        "max_pct": percent.max(-1),
+        "ohko": (damage >= hp).mean(-1),
+    }
+
+
+def best_moves(summary):
+    """Move terbaik tiap (anggota, ancaman) berdasarkan peluang OHKO lalu damage maksimum: (T, K)."""
+    score = summary["ohko"] * 1000.0 + summary["max_pct"]
+    return np.argmax(score, axis=1)
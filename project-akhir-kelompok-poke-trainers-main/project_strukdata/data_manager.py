@@ -1,68 +1,92 @@
-import json
 import os
-import bcrypt 
+import threading
+
+from password_hasher import hash_password, needs_rehash, verify_password
+from user_store import create_user_store
+from write_behind import WriteBehindQueue
 
 USER_FILE = 'users.json'
-ENCODING = 'utf-8'
+USER_DB_FILE = os.environ.get("POKEDEX_USER_DB", 'users.db')
+USER_STORE_BACKEND = os.environ.get("POKEDEX_USER_STORE", "sqlite")
+USER_DURABILITY = os.environ.get("POKEDEX_USER_DURABILITY", "normal")
+# Interval flush write-behind dalam detik; 0 = tulis langsung (sinkron).
+WRITE_BEHIND_INTERVAL = float(os.environ.get("POKEDEX_WRITE_BEHIND_INTERVAL", 1.0))
+WRITE_BEHIND_BATCH = int(os.environ.get("POKEDEX_WRITE_BEHIND_BATCH", 64))
+
+_store = None
+_write_queue = None
+_store_lock = threading.Lock()
+
+def _get_store():
+    global _store, _write_queue
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                store = create_user_store(USER_STORE_BACKEND, USER_DB_FILE, USER_FILE, USER_DURABILITY)
+                conflicts = store.username_conflicts()
+                if conflicts:
+                    print(f"User store: {len(conflicts)} akun migrasi dengan username ganda (login via email): "
+                          + ", ".join(f"{c['email']} ({c['username']})" for c in conflicts))
+                if WRITE_BEHIND_INTERVAL > 0:
+                    _write_queue = WriteBehindQueue(store, WRITE_BEHIND_INTERVAL, WRITE_BEHIND_BATCH)
+                _store = store
+    return _store
 
-def _load_users():
-    if not os.path.exists(USER_FILE):
-        return {}
-    try:
-        with open(USER_FILE, 'r', encoding=ENCODING) as f:
-            return json.load(f)
-    except json.JSONDecodeError:
-        return {}
+def _get_user(email):
+    """Data pengguna dari store, digabung dengan perubahan yang masih di antrian write-behind."""
+    store = _get_store()
+    if _write_queue:
+        return _write_queue.read(email, store.get)
+    return store.get(email)
 
-def _save_users(users_data):
-    with open(USER_FILE, 'w', encoding=ENCODING) as f:
-        json.dump(users_data, f, indent=4)
+def flush_pending_writes():
+    """Memaksa semua perubahan tertunda ditulis ke disk."""
+    if _write_queue:
+        _write_queue.flush()
 
 def register_user(email, password, username):
-    users = _load_users()
+    """Mendaftarkan pengguna baru; mengembalikan data pengguna atau None jika gagal."""
+    store = _get_store()
     
-    if email in users:
-        return False
+    if store.get(email) is not None:
+        return None
         
-    password_bytes = password.encode(ENCODING)
-    hashed_password = bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=12))
-    
-    users[email] = {
+    user_data = {
         "username": username,
-        "password": hashed_password.decode(ENCODING), 
+        "password": hash_password(password), 
         "profile": {"Nama": username, "Email": email, "Deskripsi": ""},
         "saved_deck": [],
         "saved_teams": {},
         "search_history": [] 
     }
-    
-    _save_users(users)
-    return True
+    return user_data if store.create(email, user_data) else None
 
 def authenticate_user(email, password):
-    users = _load_users()
-    user_data = users.get(email)
+    user_data = _get_user(email)
     
     if not user_data:
         return None
     
-    stored_hash = user_data.get("password", "").encode(ENCODING)
+    stored_hash = user_data.get("password", "")
     
-    if bcrypt.checkpw(password.encode(ENCODING), stored_hash):
-        return user_data
-    else:
+    if not verify_password(password, stored_hash):
         return None
 
+    if needs_rehash(stored_hash):
+        # Work factor berubah: perbarui hash selagi password asli tersedia.
+        user_data["password"] = hash_password(password)
+        _get_store().update(email, {"password": user_data["password"]})
+    return user_data
+
 def get_user_email_by_username(username):
-    users = _load_users()
-    for email, user_data in users.items():
-        if user_data.get("username", "").lower() == username.lower():
-            return email
-    return None
+    return _get_store().find_email_by_username(username)
+
+def get_username_conflicts():
+    """Akun migrasi users.json yang username-nya ganda (hanya bisa login via email), untuk admin."""
+    return _get_store().username_conflicts()
 
 def get_user_data(email):
-    users = _load_users()
-    user_data = users.get(email)
+    user_data = _get_user(email)
     if user_data:
         if 'saved_deck' not in user_data:
             user_data['saved_deck'] = []
@@ -74,27 +98,33 @@ def get_user_data(email):
 
 
 def save_user_profile(email, data_to_save):
-    users = _load_users()
-    if email in users:
-        current_profile = users[email].get("profile", {})
-        
-        if 'profile' in data_to_save:
-             users[email]["profile"] = {
-                "Nama": data_to_save["profile"].get("Nama", current_profile.get("Nama")),
-                "Email": data_to_save["profile"].get("Email", current_profile.get("Email")),
-                "Deskripsi": data_to_save["profile"].get("Deskripsi", current_profile.get("Deskripsi"))
-            }
-             users[email]["username"] = users[email]["profile"]["Nama"]
-
-        if 'saved_deck' in data_to_save:
-            users[email]["saved_deck"] = data_to_save['saved_deck']
-
-        if 'saved_teams' in data_to_save:
-            users[email]["saved_teams"] = data_to_save['saved_teams']
-        
-        if 'search_history' in data_to_save: 
-            users[email]["search_history"] = data_to_save['search_history']
+    user_data = _get_user(email)
+    if not user_data:
+        return False
+    changes = {}
 
-        _save_users(users)
+    if 'profile' in data_to_save:
+        current_profile = user_data.get("profile", {})
+        new_profile = {
+            "Nama": data_to_save["profile"].get("Nama", current_profile.get("Nama")),
+            "Email": data_to_save["profile"].get("Email", current_profile.get("Email")),
+            "Deskripsi": data_to_save["profile"].get("Deskripsi", current_profile.get("Deskripsi"))
+        }
+        if new_profile != current_profile or new_profile["Nama"] != user_data.get("username"):
+            changes["profile"] = new_profile
+            changes["username"] = new_profile["Nama"]
+
+    for field in ('saved_deck', 'saved_teams', 'search_history'):
+        if field in data_to_save:
+            changes[field] = data_to_save[field]
+
+    if not changes:
         return True
-    return False
+
+    if "username" in changes or not _write_queue:
+        # Ganti username harus langsung dicek terhadap indeks unik.
+        flush_pending_writes()
+        return _get_store().update(email, changes)
+
+    _write_queue.submit(email, changes)
+    return True
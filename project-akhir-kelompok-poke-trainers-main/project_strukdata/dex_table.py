@@ -0,0 +1,58 @@
+import os
+
+import numpy as np
+
+from pokemon_record import STAT_NAMES
+from type_chart import encode_type_combos
+
+TABLE_PATH = os.environ.get("POKEDEX_DEX_TABLE_PATH", "dex_table.npz")
+
+
+class DexTable:
+    """Tabel kolumnar seluruh dex: ID, nama, indeks tipe (n, 2) dan base stat (n, 6).
+
+    Dipakai untuk perhitungan tervektorisasi (team builder, stat, damage) tanpa
+    membuka satu per satu PokemonRecord. Kolom `capture_rate` opsional dan
+    diisi terpisah dari data species.
+    """
+
+    def __init__(self, ids, names, type_idx, stats, capture_rate=None):
+        self.ids = np.asarray(ids, dtype=np.int32)
+        self.names = np.asarray(names, dtype=str)
+        self.type_idx = np.asarray(type_idx, dtype=np.intp)
+        self.stats = np.asarray(stats, dtype=np.int16)
+        self.capture_rate = None if capture_rate is None else np.asarray(capture_rate, dtype=np.int16)
+        self._row_of = {name: i for i, name in enumerate(self.names.tolist())}
+
+    @classmethod
+    def from_records(cls, records):
+        records = [r for r in records if r]
+        return cls(
+            ids=[r.id for r in records],
+            names=[r.name for r in records],
+            type_idx=encode_type_combos([r.types for r in records]),
+            stats=np.array([r.stats for r in records], dtype=np.int16).reshape(-1, len(STAT_NAMES)),
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    def row_of(self, name):
+        """Indeks baris untuk nama Pokémon (slug), atau None."""
+        return self._row_of.get(name)
+
+    def save(self, path=TABLE_PATH):
+        extra = {} if self.capture_rate is None else {"capture_rate": self.capture_rate}
+        np.savez_compressed(path, ids=self.ids, names=self.names, type_idx=self.type_idx, stats=self.stats, **extra)
+
+    @classmethod
+    def load(cls, path=TABLE_PATH):
+        """Memuat tabel dari disk, atau None jika file belum ada/rusak."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                capture_rate = data['capture_rate'] if 'capture_rate' in data.files else None
+                return cls(data['ids'], data['names'], data['type_idx'], data['stats'], capture_rate)
+        except (OSError, ValueError, KeyError):
+            return None
@@ -0,0 +1,130 @@
+import os
+
+import numpy as np
+
+from search_index import SearchIndex
+
+INDEX_PATH = os.environ.get("POKEDEX_ENCOUNTER_INDEX_PATH", "encounter_index.npz")
+
+_VOCABS = ("pokemon_names", "area_names", "versions", "methods")
+_COLUMNS = ("pokemon", "area", "version", "method", "min_level", "max_level", "chance")
+
+
+def _csr(codes, size):
+    """Urutan baris dan offset per kode sehingga baris kode k = order[offsets[k]:offsets[k+1]]."""
+    order = np.argsort(codes, kind="stable")
+    offsets = np.searchsorted(codes[order], np.arange(size + 1))
+    return order, offsets
+
+
+class EncounterIndex:
+    """Indeks encounter dua arah: Pokémon -> area dan area -> Pokémon.
+
+    Satu baris per (Pokémon, area, versi, metode) dengan rentang level dan total
+    peluang. Kolom teks disimpan sebagai kode ke kosakata; lookup per Pokémon atau
+    per area berupa irisan array (CSR), filter berupa mask NumPy.
+    """
+
+    def __init__(self, pokemon_names, area_names, versions, methods,
+                 pokemon, area, version, method, min_level, max_level, chance):
+        self.pokemon_names = np.asarray(pokemon_names, dtype=str)
+        self.area_names = np.asarray(area_names, dtype=str)
+        self.versions = np.asarray(versions, dtype=str)
+        self.methods = np.asarray(methods, dtype=str)
+        self.pokemon = np.asarray(pokemon, dtype=np.int32)
+        self.area = np.asarray(area, dtype=np.int32)
+        self.version = np.asarray(version, dtype=np.int16)
+        self.method = np.asarray(method, dtype=np.int16)
+        self.min_level = np.asarray(min_level, dtype=np.int16)
+        self.max_level = np.asarray(max_level, dtype=np.int16)
+        self.chance = np.asarray(chance, dtype=np.int16)
+
+        self._pokemon_code = {n: i for i, n in enumerate(self.pokemon_names.tolist())}
+        self._area_code = {n: i for i, n in enumerate(self.area_names.tolist())}
+        self._by_pokemon = _csr(self.pokemon, len(self.pokemon_names))
+        self._by_area = _csr(self.area, len(self.area_names))
+        self.area_search = SearchIndex(self.area_names.tolist())
+
+    @classmethod
+    def from_encounters(cls, encounters_by_pokemon):
+        """Membangun indeks dari {nama Pokémon: respons /pokemon/{nama}/encounters}."""
+        vocabs = {name: {} for name in _VOCABS}
+        merged = {}
+
+        def code(vocab, value):
+            return vocabs[vocab].setdefault(value, len(vocabs[vocab]))
+
+        for pokemon_name, payload in encounters_by_pokemon.items():
+            p = code("pokemon_names", pokemon_name)
+            for entry in payload or []:
+                a = code("area_names", entry['location_area']['name'])
+                for version_detail in entry.get('version_details', []):
+                    v = code("versions", version_detail['version']['name'])
+                    for detail in version_detail.get('encounter_details', []):
+                        m = code("methods", detail['method']['name'])
+                        key = (p, a, v, m)
+                        lo, hi, chance = merged.get(key, (detail['min_level'], detail['max_level'], 0))
+                        merged[key] = (min(lo, detail['min_level']), max(hi, detail['max_level']),
+                                       min(100, chance + detail.get('chance', 0)))
+
+        rows = [key + value for key, value in merged.items()]
+        columns = np.array(rows, dtype=np.int32).reshape(-1, len(_COLUMNS)).T
+        return cls(*(list(vocabs[v]) for v in _VOCABS), *columns)
+
+    def __len__(self):
+        return len(self.pokemon)
+
+    def rows_for_pokemon(self, pokemon_name):
+        code = self._pokemon_code.get(pokemon_name)
+        if code is None:
+            return np.empty(0, dtype=np.intp)
+        order, offsets = self._by_pokemon
+        return order[offsets[code]:offsets[code + 1]]
+
+    def rows_for_area(self, area_name):
+        code = self._area_code.get(area_name)
+        if code is None:
+            return np.empty(0, dtype=np.intp)
+        order, offsets = self._by_area
+        return order[offsets[code]:offsets[code + 1]]
+
+    def find_areas(self, query, limit=10):
+        """Nama area yang cocok dengan teks bebas ("Viridian Forest" -> "viridian-forest-area")."""
+        return self.area_search.search(query, limit=limit)
+
+    def filter(self, rows, versions=None, methods=None, level=None):
+        """Menyaring baris berdasarkan versi/metode (daftar nama) dan level yang bisa ditemui."""
+        mask = np.ones(len(rows), dtype=bool)
+        if versions:
+            mask &= np.isin(self.version[rows], [i for i, v in enumerate(self.versions) if v in versions])
+        if methods:
+            mask &= np.isin(self.method[rows], [i for i, m in enumerate(self.methods) if m in methods])
+        if level is not None:
+            mask &= (self.min_level[rows] <= level) & (self.max_level[rows] >= level)
+        return rows[mask]
+
+    def records(self, rows):
+        """Kolom hasil (sudah didekode ke teks) untuk baris terpilih, siap untuk DataFrame."""
+        return {
+            "pokemon": self.pokemon_names[self.pokemon[rows]],
+            "area": self.area_names[self.area[rows]],
+            "version": self.versions[self.version[rows]],
+            "method": self.methods[self.method[rows]],
+            "min_level": self.min_level[rows],
+            "max_level": self.max_level[rows],
+            "chance": self.chance[rows],
+        }
+
+    def save(self, path=INDEX_PATH):
+        np.savez_compressed(path, **{name: getattr(self, name) for name in _VOCABS + _COLUMNS})
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        """Memuat indeks dari disk, atau None jika file belum ada/rusak."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                return cls(*(data[name] for name in _VOCABS + _COLUMNS))
+        except (OSError, ValueError, KeyError):
+            return None
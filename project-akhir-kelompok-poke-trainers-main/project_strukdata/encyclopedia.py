@@ -1,148 +1,245 @@
 import streamlit as st
 import pandas as pd
-from components import fetch, API_BASE, get_pokemon_detail
+import numpy as np
+from components import (
+    fetch, API_BASE, get_pokemon_detail, get_encyclopedia_index, peek_encyclopedia_index, get_dex_table, get_capture_rates,
+    get_item_costs
+)
+from capture_sim import ACTIONS, PRESET_STRATEGIES, simulate_strategy, summarize
+from catch_engine import (
+    BALLS, BALL_NAMES, STATUSES, STATUS_NAMES,
+    ball_multipliers, best_ball, capture_probability, capture_table, expected_balls, modified_catch_rate,
+)
+from encyclopedia_index import COLUMNS
+from type_chart import encode_type_combos
+
+TABLE_LABELS = {
+    "name": "Nama", "type": "Tipe", "damage_class": "Kategori", "power": "Power",
+    "accuracy": "Accuracy", "pp": "PP", "priority": "Prioritas", "category": "Kategori",
+    "cost": "Harga (₽)", "generation": "Generasi", "pokemon_count": "Jumlah Pokémon", "effect": "Efek",
+}
+
+def _resource_filters(kind, table):
+    """Widget filter untuk satu jenis resource; mengembalikan (equals, ranges)."""
+    equals, ranges = {}, {}
+    if kind == "move":
+        c1, c2, c3, c4 = st.columns(4)
+        with c1:
+            equals["type"] = st.multiselect("Tipe", table.distinct("type"))
+        with c2:
+            equals["damage_class"] = st.multiselect("Kategori", table.distinct("damage_class"))
+        with c3:
+            min_power = st.number_input("Power minimum", min_value=0, max_value=250, value=0, step=10)
+        with c4:
+            min_accuracy = st.number_input("Accuracy minimum", min_value=0, max_value=100, value=0, step=5)
+        # Batas 0 berarti tanpa filter, agar move tanpa power/accuracy tetap tampil.
+        if min_power:
+            ranges["power"] = (min_power, None)
+        if min_accuracy:
+            ranges["accuracy"] = (min_accuracy, None)
+        pp_range = st.slider("PP", min_value=0, max_value=40, value=(0, 40))
+        if pp_range != (0, 40):
+            ranges["pp"] = pp_range
+    elif kind == "item":
+        c1, c2 = st.columns(2)
+        with c1:
+            equals["category"] = st.multiselect("Kategori", table.distinct("category"))
+        with c2:
+            max_cost = st.number_input("Harga maksimum (₽, 0 = semua)", min_value=0, value=0, step=100)
+        if max_cost:
+            ranges["cost"] = (None, max_cost)
+    else:
+        equals["generation"] = st.multiselect("Generasi", table.distinct("generation"))
+    return equals, ranges
 
 def show_move_item_ability():
     st.title("📘 Move / Item / Ability Encyclopedia")
 
     mode = st.radio("Pilih kategori:", ["Move", "Item", "Ability"])
-    query = st.text_input(f"Cari {mode}...", placeholder=f"Masukkan nama {mode.lower()}")
+    kind = mode.lower()
+    query = st.text_input(f"Cari {mode}...", placeholder=f"Masukkan nama {mode.lower()} (boleh sebagian)")
 
-    if st.button("Cari"):
-        if not query:
-            st.error("Silakan masukkan nama yang ingin dicari.")
-            return
+    index = get_encyclopedia_index(build=False)
+    if index is None:
+        st.warning(
+            "Indeks ensiklopedia belum tersedia. Bangun sekali dengan "
+            "`python -c \"import components; components.prebuild_encyclopedia_index()\"`, "
+            "atau bangun sekarang (±3.000 request ke PokeAPI). Sementara itu, cari dengan nama persis."
+        )
+        if st.button("Bangun Indeks Ensiklopedia"):
+            with st.spinner("Membangun indeks ensiklopedia..."):
+                index = get_encyclopedia_index()
+    elif peek_encyclopedia_index() is None:
+        st.caption("Indeks ensiklopedia belum lengkap (sebagian data gagal diambil).")
+        if st.button("Lengkapi Indeks Ensiklopedia"):
+            # Dibangun ulang hanya jika jeda INDEX_RETRY_INTERVAL sudah lewat.
+            with st.spinner("Melengkapi indeks ensiklopedia..."):
+                index = get_encyclopedia_index()
+    table = index.tables.get(kind) if index else None
 
-        name = query.lower().replace(" ", "-") 
-        data = fetch(f"{API_BASE}/{mode.lower()}/{name}")
+    if table is None or not len(table):
+        # Indeks belum tersedia (mis. offline tanpa mirror): cari slug langsung.
+        if st.button("Cari"):
+            if not query:
+                st.error("Silakan masukkan nama yang ingin dicari.")
+                return
 
-        if not data:
-            st.error(f"{mode} '{query}' tidak ditemukan.")
-            return
+            name = query.lower().replace(" ", "-") 
+            data = fetch(f"{API_BASE}/{kind}/{name}")
 
-        if mode == "Move":
-            damage_class = data['damage_class']['name'].title()
-            
-            if damage_class == 'Physical':
-                st.subheader(f"⚔️ {data['name'].title()} (Fisik)")
-            elif damage_class == 'Special':
-                st.subheader(f"✨ {data['name'].title()} (Spesial)")
-            else: 
-                st.subheader(f"🛡️ {data['name'].title()} (Status)")
-
-            col_stat, col_chart = st.columns([1, 1])
-
-            with col_stat:
-                st.markdown("### Statistik Dasar")
-                st.write(f"• **Type:** **{data['type']['name'].title()}**")
-                st.write(f"• **Kategori:** {damage_class}")
-                st.write(f"• **Power:** {data.get('power') or '—'}")
-                st.write(f"• **Accuracy:** {data.get('accuracy') or '—'}%")
-                st.write(f"• **Power Point:** {data.get('pp') or '—'}")
-            
-            with col_chart:
-                st.markdown("### Visualisasi Statistik")
-                chart_data = pd.DataFrame({
-                    'Statistik': ['Power', 'PP', 'Accuracy'],
-                    'Nilai': [
-                        data.get('power') or 0,
-                        data.get('pp') or 0,
-                        data.get('accuracy') or 0
-                    ]
-                })
-                st.bar_chart(
-                    chart_data.set_index('Statistik'), 
-                    height=250,
-                    color="#f63366"
-                )
-
-            st.subheader("Efek/Deskripsi")
-            effect_entries = data.get('effect_entries', [])
-            
-            description = next(
-                (
-                    entry['effect'] 
-                    for entry in effect_entries 
-                    if 'language' in entry and entry['language'].get('name') == 'en' and 'effect' in entry
-                ), 
-                "Tidak ada deskripsi tersedia."
-            ).replace('\n', ' ')
-            
-            st.info(description)
+            if not data:
+                st.error(f"{mode} '{query}' tidak ditemukan.")
+                return
+            _show_resource_detail(mode, data)
+        return
 
-        elif mode == "Item":
-            st.subheader(f"🎒 Item: {data['name'].title()}")
-            
-            col1, col2 = st.columns([1, 4])
-            with col1:
-                if data['sprites'].get('default'):
-                    st.image(data['sprites']['default'], caption=data['name'].title(), width=100)
-            with col2:
-                st.markdown("### Detail Dasar")
-                st.write(f"• **Kategori:** {data['category']['name'].title()}")
-                st.write(f"• **Harga:** {data.get('cost', 0)}₽")
-
-            st.subheader("Deskripsi & Efek")
-            
-            effect_entries = data.get('effect_entries', [])
-            
-            effect_text = next(
-                (
-                    entry['text'] 
-                    for entry in effect_entries 
-                    if 'language' in entry and entry['language'].get('name') == 'en' and 'text' in entry
-                ), 
-                "Tidak ada efek tersedia."
-            ).replace('\n', ' ')
-            
-            st.info(effect_text)
+    equals, ranges = _resource_filters(kind, table)
+    sortable = [c for c in COLUMNS[kind] if c != "effect"]
+    c_sort, c_order = st.columns([3, 1])
+    with c_sort:
+        sort_by = st.selectbox("Urutkan berdasarkan", ["(relevansi)"] + sortable, format_func=lambda c: TABLE_LABELS.get(c, c))
+    with c_order:
+        descending = st.checkbox("Menurun", value=sort_by in ("power", "accuracy", "pp", "cost", "pokemon_count"))
 
-        elif mode == "Ability":
-            st.subheader(f"💡 Ability: {data['name'].title()}")
+    rows = table.select(query, equals, ranges, sort_by=None if sort_by == "(relevansi)" else sort_by, descending=descending)
+    frame = pd.DataFrame({TABLE_LABELS[c]: table.columns[c][rows] for c in COLUMNS[kind]})
+    st.caption(f"{len(rows)} {mode.lower()} cocok dari {len(table)}.")
+    st.dataframe(frame, hide_index=True, use_container_width=True)
 
-            st.subheader("Efek Ability")
-            
-            effect_entries = data.get('effect_entries', [])
-            
-            description_en = next(
-                (
-                    entry['effect'] 
-                    for entry in effect_entries 
-                    if 'language' in entry and entry['language'].get('name') == 'en' and 'effect' in entry
-                ), 
-                "Tidak ada efek tersedia."
-            ).replace('\n', ' ')
-
-            # Penyesuaian terjemahan (ditingkatkan dari versi sebelumnya)
-            translated_desc = ""
-            desc_lower = description_en.lower()
-            
-            if "not multiplied by 1.5, but by 2" in desc_lower:
-                translated_desc = (
-                    "Pokémon dengan **Ability** ini memberikan *damage* **2 kali lipat (2×)** ketika "
-                    "menggunakan *Move* yang tipenya sama dengan Pokémon, alih-alih Bonus Serangan Tipe Sama (**STAB**) normal sebesar 1.5 kali lipat (1.5×)."
-                )
-            
-            if translated_desc:
-                st.markdown("#### Efek (Bahasa Indonesia yang Disesuaikan) 🇮🇩")
-                st.success(translated_desc)
-                st.markdown("---")
+    if len(rows):
+        selected = st.selectbox(f"Lihat detail {mode}", table.names[rows].tolist(), format_func=lambda n: n.replace('-', ' ').title())
+        if st.button("Tampilkan Detail"):
+            data = fetch(f"{API_BASE}/{kind}/{selected}")
+            if not data:
+                st.error(f"{mode} '{selected}' tidak ditemukan.")
+                return
+            _show_resource_detail(mode, data)
 
-            st.markdown("#### Efek Asli (English) 🇺🇸")
-            st.info(description_en)
+def _show_resource_detail(mode, data):
+    """Tampilan detail satu move/item/ability dari payload PokeAPI."""
+    if mode == "Move":
+        damage_class = data['damage_class']['name'].title()
+        
+        if damage_class == 'Physical':
+            st.subheader(f"⚔️ {data['name'].title()} (Fisik)")
+        elif damage_class == 'Special':
+            st.subheader(f"✨ {data['name'].title()} (Spesial)")
+        else: 
+            st.subheader(f"🛡️ {data['name'].title()} (Status)")
 
-            pokemon_list = data.get('pokemon', [])
-            if pokemon_list:
-                st.subheader(f"Pokémon dengan {data['name'].title()} ({len(pokemon_list)})")
+        col_stat, col_chart = st.columns([1, 1])
 
-                display_names = [p['pokemon']['name'].title() for p in pokemon_list[:10]]
-                
-                if len(pokemon_list) > 10:
-                    st.write(f"**{', '.join(display_names)}**, dan {len(pokemon_list) - 10} lainnya.")
-                else:
-                    st.write(f"**{', '.join(display_names)}**")
+        with col_stat:
+            st.markdown("### Statistik Dasar")
+            st.write(f"• **Type:** **{data['type']['name'].title()}**")
+            st.write(f"• **Kategori:** {damage_class}")
+            st.write(f"• **Power:** {data.get('power') or '—'}")
+            st.write(f"• **Accuracy:** {data.get('accuracy') or '—'}%")
+            st.write(f"• **Power Point:** {data.get('pp') or '—'}")
+        
+        with col_chart:
+            st.markdown("### Visualisasi Statistik")
+            chart_data = pd.DataFrame({
+                'Statistik': ['Power', 'PP', 'Accuracy'],
+                'Nilai': [
+                    data.get('power') or 0,
+                    data.get('pp') or 0,
+                    data.get('accuracy') or 0
+                ]
+            })
+            st.bar_chart(
+                chart_data.set_index('Statistik'), 
+                height=250,
+                color="#f63366"
+            )
+
+        st.subheader("Efek/Deskripsi")
+        effect_entries = data.get('effect_entries', [])
+        
+        description = next(
+            (
+                entry['effect'] 
+                for entry in effect_entries 
+                if 'language' in entry and entry['language'].get('name') == 'en' and 'effect' in entry
+            ), 
+            "Tidak ada deskripsi tersedia."
+        ).replace('\n', ' ')
+        
+        st.info(description)
+
+    elif mode == "Item":
+        st.subheader(f"🎒 Item: {data['name'].title()}")
+        
+        col1, col2 = st.columns([1, 4])
+        with col1:
+            if data['sprites'].get('default'):
+                st.image(data['sprites']['default'], caption=data['name'].title(), width=100)
+        with col2:
+            st.markdown("### Detail Dasar")
+            st.write(f"• **Kategori:** {data['category']['name'].title()}")
+            st.write(f"• **Harga:** {data.get('cost', 0)}₽")
+
+        st.subheader("Deskripsi & Efek")
+        
+        effect_entries = data.get('effect_entries', [])
+        
+        effect_text = next(
+            (
+                entry['text'] 
+                for entry in effect_entries 
+                if 'language' in entry and entry['language'].get('name') == 'en' and 'text' in entry
+            ), 
+            "Tidak ada efek tersedia."
+        ).replace('\n', ' ')
+        
+        st.info(effect_text)
+
+    elif mode == "Ability":
+        st.subheader(f"💡 Ability: {data['name'].title()}")
+
+        st.subheader("Efek Ability")
+        
+        effect_entries = data.get('effect_entries', [])
+        
+        description_en = next(
+            (
+                entry['effect'] 
+                for entry in effect_entries 
+                if 'language' in entry and entry['language'].get('name') == 'en' and 'effect' in entry
+            ), 
+            "Tidak ada efek tersedia."
+        ).replace('\n', ' ')
+
+        # Penyesuaian terjemahan (ditingkatkan dari versi sebelumnya)
+        translated_desc = ""
+        desc_lower = description_en.lower()
+        
+        if "not multiplied by 1.5, but by 2" in desc_lower:
+            translated_desc = (
+                "Pokémon dengan **Ability** ini memberikan *damage* **2 kali lipat (2×)** ketika "
+                "menggunakan *Move* yang tipenya sama dengan Pokémon, alih-alih Bonus Serangan Tipe Sama (**STAB**) normal sebesar 1.5 kali lipat (1.5×)."
+            )
+        
+        if translated_desc:
+            st.markdown("#### Efek (Bahasa Indonesia yang Disesuaikan) 🇮🇩")
+            st.success(translated_desc)
+            st.markdown("---")
+
+        st.markdown("#### Efek Asli (English) 🇺🇸")
+        st.info(description_en)
+
+        pokemon_list = data.get('pokemon', [])
+        if pokemon_list:
+            st.subheader(f"Pokémon dengan {data['name'].title()} ({len(pokemon_list)})")
+
+            display_names = [p['pokemon']['name'].title() for p in pokemon_list[:10]]
+            
+            if len(pokemon_list) > 10:
+                st.write(f"**{', '.join(display_names)}**, dan {len(pokemon_list) - 10} lainnya.")
             else:
-                st.info("Tidak ada Pokémon yang diketahui memiliki Ability ini.")
+                st.write(f"**{', '.join(display_names)}**")
+        else:
+            st.info("Tidak ada Pokémon yang diketahui memiliki Ability ini.")
 
 def show_catching_probability():
     st.title("🎯 Catching Probability Encyclopedia")
@@ -162,28 +259,15 @@ def show_catching_probability():
     
     col_ball, col_status = st.columns(2)
 
-    BALL_MULTIPLIERS = {
-        "Poké Ball (x1.0)": 1.0,
-        "Great Ball (x1.5)": 1.5,
-        "Ultra Ball (x2.0)": 2.0,
-        "Master Ball (x255)": 255.0, 
-        "Quick Ball (x5.0 - Turn 1)": 5.0, 
-        "Net Ball (x3.5 - Water/Bug)": 3.5, 
-    }
-    
-    STATUS_MULTIPLIERS = {
-        "None (x1.0)": 1.0,
-        "Paralyzed, Poisoned, Burned (x1.5)": 1.5,
-        "Asleep, Frozen (x2.5)": 2.5,
-    }
-    
     with col_ball:
-        ball_selection = st.selectbox("Jenis PokéBall (B)", list(BALL_MULTIPLIERS.keys()))
-        ball_multiplier = BALL_MULTIPLIERS[ball_selection]
+        ball_selection = st.selectbox("Jenis PokéBall (B)", BALL_NAMES,
+                                      format_func=lambda b: f"{b} (x{BALLS[b][0]:g})")
         
     with col_status:
-        status_selection = st.selectbox("Status Pokémon (S)", list(STATUS_MULTIPLIERS.keys()))
-        status_multiplier = STATUS_MULTIPLIERS[status_selection]
+        status_selection = st.selectbox("Status Pokémon (S)", STATUS_NAMES,
+                                        format_func=lambda s: f"{s} (x{STATUSES[s]:g})")
+
+    hp_fraction = current_hp / max_hp
         
     if st.button("Hitung Probabilitas Tangkapan", use_container_width=True):
         if not pokemon_query:
@@ -197,50 +281,126 @@ def show_catching_probability():
                 st.error(f"Pokémon '{pokemon_query}' tidak ditemukan di API.")
                 return
             
-            species_url = pokemon_detail['species']['url']
-            species_data = fetch(species_url)
+            species_data = fetch(pokemon_detail.species_url)
 
             if not species_data:
-                st.error(f"Gagal memuat data spesies untuk {pokemon_detail['name'].title()}.")
+                st.error(f"Gagal memuat data spesies untuk {pokemon_detail.name.title()}.")
                 return
                 
             base_catch_rate = species_data.get('capture_rate')
 
             if base_catch_rate is None:
-                st.error(f"Base Catch Rate untuk {pokemon_detail['name'].title()} tidak tersedia.")
+                st.error(f"Base Catch Rate untuk {pokemon_detail.name.title()} tidak tersedia.")
                 return
 
-            A = int(base_catch_rate) 
-            H = current_hp
-            M = max_hp
-            B = ball_multiplier
-            S = status_multiplier
-            
-            temp_a = ((3 * M - 2 * H) * A * B) / (3 * M)
-            a = temp_a * S
-            
-            a = min(255.0, a) 
-            catch_probability_simple = a / 255.0
+        A = int(base_catch_rate) 
+        type_idx = encode_type_combos([pokemon_detail.types])
+        ball_col = BALL_NAMES.index(ball_selection)
+        status_col = STATUS_NAMES.index(status_selection)
 
-            if a >= 255:
-                final_chance_percent = 100.0
-                st.success(f"🎉 **Tangkapan Dijamin Sukses!** (Catch Rate Modifikasi 'a' = {int(a)} ≥ 255)")
-            else:
-                final_chance_percent = catch_probability_simple * 100
-                
-                st.markdown(f"**Tingkat Tangkapan Modifikasi (a):** `{a:.2f}` (Maksimal 255)")
-                st.markdown(f"**Probabilitas Tangkapan (Sederhana):** `{final_chance_percent:.2f}%`")
-                
-                if final_chance_percent >= 50:
-                    st.success("Tingkat probabilitas yang tinggi!")
-                elif final_chance_percent >= 20:
-                    st.warning("Tingkat probabilitas sedang. Cobalah Ball yang lebih baik atau status!")
-                else:
-                    st.error("Tingkat probabilitas rendah. Coba kurangi HP atau gunakan Ball/Status yang lebih baik.")
+        # Satu pass: semua ball × status pada HP saat ini, dan kurva HP 1..100%.
+        hp_grid = np.linspace(0.01, 1.0, 100)
+        a = modified_catch_rate([A], [hp_fraction], ball_multipliers(type_idx), list(STATUSES.values()))[0, 0]
+        p_now = capture_probability(a)
+        curves = capture_table([A], type_idx, hp_grid)[0]
+
+        a_sel = a[ball_col, status_col]
+        final_chance_percent = p_now[ball_col, status_col] * 100
+
+        if a_sel >= 255:
+            st.success(f"🎉 **Tangkapan Dijamin Sukses!** (Catch Rate Modifikasi 'a' = {min(a_sel, 255):.0f} ≥ 255)")
+        else:
+            st.markdown(f"**Tingkat Tangkapan Modifikasi (a):** `{a_sel:.2f}` (Maksimal 255)")
+            st.markdown(f"**Probabilitas Tangkapan (4 shake check):** `{final_chance_percent:.2f}%`")
+            st.markdown(f"**Rata-rata Ball yang Dibutuhkan:** `{expected_balls(p_now[ball_col, status_col]):.1f}`")
             
-            st.markdown("### Detail Analisis")
-            st.write(f"• **Pokémon:** **{pokemon_detail['name'].title()}**")
-            st.write(f"• **Base Catch Rate (A):** `{A}` (Skala 1-255)")
-            st.write(f"• **Kondisi HP (H/M):** `{H}/{M}`")
-            st.write(f"• **PokéBall Multiplier (B):** `{B}` ({ball_selection})")
-            st.write(f"• **Status Multiplier (S):** `{S}` ({status_selection})")
\ No newline at end of file
+            if final_chance_percent >= 50:
+                st.success("Tingkat probabilitas yang tinggi!")
+            elif final_chance_percent >= 20:
+                st.warning("Tingkat probabilitas sedang. Cobalah Ball yang lebih baik atau status!")
+            else:
+                st.error("Tingkat probabilitas rendah. Coba kurangi HP atau gunakan Ball/Status yang lebih baik.")
+        
+        st.markdown("### Detail Analisis")
+        st.write(f"• **Pokémon:** **{pokemon_detail.name.title()}**")
+        st.write(f"• **Base Catch Rate (A):** `{A}` (Skala 1-255)")
+        st.write(f"• **Kondisi HP (H/M):** `{current_hp}/{max_hp}`")
+        st.write(f"• **PokéBall Multiplier (B):** `{ball_multipliers(type_idx)[0, ball_col]:g}` ({ball_selection})")
+        st.write(f"• **Status Multiplier (S):** `{STATUSES[status_selection]:g}` ({status_selection})")
+
+        tab_balls, tab_curve = st.tabs(["Perbandingan Ball", "Kurva Probabilitas vs HP"])
+        with tab_balls:
+            st.dataframe(pd.DataFrame({
+                "Ball": BALL_NAMES,
+                **{f"{s} (%)": np.round(p_now[:, k] * 100, 2) for k, s in enumerate(STATUS_NAMES)},
+                "Rata-rata Ball": np.round(expected_balls(p_now[:, status_col]), 1),
+            }), hide_index=True, use_container_width=True)
+        with tab_curve:
+            curve_frame = pd.DataFrame(curves[:, :, status_col] * 100, columns=BALL_NAMES,
+                                       index=pd.Index(np.round(hp_grid * 100).astype(int), name="HP (%)"))
+            st.line_chart(curve_frame, height=300)
+
+    st.markdown("---")
+    st.markdown("### 🏆 Ball Terbaik untuk Setiap Species")
+    st.caption("Dihitung untuk semua species sekaligus pada HP dan status di atas (tanpa Master Ball).")
+
+    if st.button("Hitung untuk Semua Species", use_container_width=True):
+        with st.spinner("Menghitung tabel tangkapan seluruh dex..."):
+            table = get_dex_table()
+            rates = get_capture_rates()
+            p = capture_table(rates, table.type_idx, [hp_fraction], [status_selection])[:, 0, :, 0]
+            best = best_ball(p)
+            best_p = np.take_along_axis(p, best[:, None], axis=1)[:, 0]
+
+        st.dataframe(pd.DataFrame({
+            "ID": table.ids,
+            "Pokémon": np.char.title(table.names),
+            "Catch Rate": rates,
+            "Ball Terbaik": np.array(BALL_NAMES)[best],
+            "Peluang (%)": np.round(best_p * 100, 2),
+            "Rata-rata Ball": np.round(expected_balls(best_p), 1),
+            "Peluang Poké Ball (%)": np.round(p[:, 0] * 100, 2),
+        }), hide_index=True, use_container_width=True)
+
+    st.markdown("---")
+    st.markdown("### 🎲 Simulasi Strategi Tangkap (Monte Carlo)")
+    st.caption("Strategi dimainkan berulang kali untuk Pokémon target di atas; aksi terakhir diulang sampai tertangkap.")
+
+    col_preset, col_trials = st.columns([3, 1])
+    with col_preset:
+        preset = st.selectbox("Strategi", list(PRESET_STRATEGIES) + ["Kustom"])
+    with col_trials:
+        trials = st.number_input("Jumlah trial", min_value=1_000, max_value=2_000_000, value=1_000_000, step=100_000)
+    if preset == "Kustom":
+        plan = st.multiselect("Urutan aksi per turn (sesuai urutan dipilih)", ACTIONS, default=["False Swipe", "Ultra Ball"])
+    else:
+        plan = PRESET_STRATEGIES[preset]
+        st.write(" → ".join(plan))
+
+    if st.button("Jalankan Simulasi", use_container_width=True):
+        if not pokemon_query or not plan:
+            st.error("Mohon masukkan Nama/ID Pokémon dan minimal satu aksi.")
+            return
+        pokemon_detail = get_pokemon_detail(pokemon_query.lower().strip())
+        species_data = fetch(pokemon_detail.species_url) if pokemon_detail else None
+        if not species_data or species_data.get('capture_rate') is None:
+            st.error(f"Data tangkap untuk '{pokemon_query}' tidak tersedia.")
+            return
+
+        with st.spinner(f"Menjalankan {trials:,} trial..."):
+            item_costs = get_item_costs(BALLS[b][2] for b in plan if b in BALLS)
+            costs = {b: item_costs[BALLS[b][2]] for b in plan if b in BALLS}
+            result = simulate_strategy(plan, species_data['capture_rate'], encode_type_combos([pokemon_detail.types])[0],
+                                       start_hp=hp_fraction, max_hp=max_hp, trials=int(trials), costs=costs)
+            summary = summarize(result)
+
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Tertangkap", f"{summary['capture_rate']:.1%}")
+        m2.metric("Turn (rata-rata / p90)", f"{summary['turns']['mean']:.1f} / {summary['turns']['p90']:.0f}")
+        m3.metric("Ball (rata-rata / p90)", f"{summary['balls']['mean']:.1f} / {summary['balls']['p90']:.0f}")
+        m4.metric("Biaya ₽ (rata-rata / p90)", f"{summary['cost']['mean']:,.0f} / {summary['cost']['p90']:,.0f}")
+
+        caught = result["caught"]
+        st.markdown("**Distribusi jumlah turn sampai tertangkap**")
+        turn_counts = np.bincount(result["turns"][caught])
+        st.bar_chart(pd.DataFrame({"Trial": turn_counts[1:]}, index=pd.Index(np.arange(1, len(turn_counts)), name="Turn")))
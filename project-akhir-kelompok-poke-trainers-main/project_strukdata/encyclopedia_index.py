@@ -0,0 +1,162 @@
+import os
+
+import numpy as np
+
+from search_index import SearchIndex
+
+INDEX_PATH = os.environ.get("POKEDEX_ENCYCLOPEDIA_PATH", "encyclopedia_index.npz")
+KINDS = ("move", "item", "ability")
+
+# Kolom per jenis resource; kolom angka memakai NaN untuk nilai kosong (mis. power move status).
+COLUMNS = {
+    "move": ("name", "type", "damage_class", "power", "accuracy", "pp", "priority", "effect"),
+    "item": ("name", "category", "cost", "effect"),
+    "ability": ("name", "generation", "pokemon_count", "effect"),
+}
+
+
+def _english(entries, field):
+    return next(
+        (e[field] for e in entries or [] if e.get('language', {}).get('name') == 'en' and field in e),
+        "",
+    ).replace('\n', ' ')
+
+
+def _number(value):
+    return np.nan if value is None else float(value)
+
+
+def move_row(data):
+    effect = _english(data.get('effect_entries'), 'short_effect')
+    if data.get('effect_chance') is not None:
+        effect = effect.replace("$effect_chance", str(data['effect_chance']))
+    return {
+        "name": data['name'],
+        "type": (data.get('type') or {}).get('name', ''),
+        "damage_class": (data.get('damage_class') or {}).get('name', ''),
+        "power": _number(data.get('power')),
+        "accuracy": _number(data.get('accuracy')),
+        "pp": _number(data.get('pp')),
+        "priority": _number(data.get('priority')),
+        "effect": effect,
+    }
+
+
+def item_row(data):
+    return {
+        "name": data['name'],
+        "category": (data.get('category') or {}).get('name', ''),
+        "cost": _number(data.get('cost')),
+        "effect": _english(data.get('effect_entries'), 'short_effect'),
+    }
+
+
+def ability_row(data):
+    return {
+        "name": data['name'],
+        "generation": (data.get('generation') or {}).get('name', ''),
+        "pokemon_count": float(len(data.get('pokemon', []))),
+        "effect": _english(data.get('effect_entries'), 'short_effect'),
+    }
+
+
+ROW_BUILDERS = {"move": move_row, "item": item_row, "ability": ability_row}
+
+
+class ResourceTable:
+    """Tabel kolumnar satu jenis resource (move/item/ability) plus indeks pencarian nama.
+
+    Filter dan sort berupa operasi mask/argsort NumPy atas seluruh kolom.
+    """
+
+    def __init__(self, columns):
+        self.columns = {}
+        for name, values in columns.items():
+            values = np.asarray(values)
+            self.columns[name] = values.astype(np.float32) if values.dtype.kind in "fiu" else values.astype(str)
+        self.names = self.columns["name"]
+        self.search_index = SearchIndex(self.names.tolist())
+        self._row_of = {name: i for i, name in enumerate(self.names.tolist())}
+
+    @classmethod
+    def from_rows(cls, kind, rows):
+        return cls({col: [row[col] for row in rows] for col in COLUMNS[kind]})
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._row_of
+
+    def row_of(self, name):
+        """Indeks baris untuk nama resource (slug), atau None."""
+        return self._row_of.get(name)
+
+    def distinct(self, column):
+        """Nilai unik (terurut) sebuah kolom teks, untuk pilihan filter."""
+        return sorted(v for v in np.unique(self.columns[column]).tolist() if v)
+
+    def select(self, query="", equals=None, ranges=None, sort_by=None, descending=False):
+        """Indeks baris yang cocok.
+
+        equals: {kolom: [nilai, ...]} (kosong = semua); ranges: {kolom: (min, max)}
+        (None = tanpa batas; baris NaN tidak lolos filter rentang). Tanpa `sort_by`,
+        hasil pencarian teks diurutkan menurut relevansi.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for column, values in (equals or {}).items():
+            if values:
+                mask &= np.isin(self.columns[column], list(values))
+        for column, (low, high) in (ranges or {}).items():
+            values = self.columns[column]
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+
+        if query:
+            ranked = np.array(
+                [self._row_of[n] for n in self.search_index.search(query, limit=len(self))], dtype=np.intp
+            )
+            rows = ranked[mask[ranked]] if len(ranked) else ranked
+        else:
+            rows = np.flatnonzero(mask)
+
+        if sort_by:
+            values = self.columns[sort_by][rows]
+            if values.dtype.kind == "f":
+                # NaN selalu di akhir, baik ascending maupun descending.
+                key = np.where(np.isnan(values), np.inf, -values if descending else values)
+                order = np.argsort(key, kind="stable")
+            else:
+                order = np.argsort(values, kind="stable")
+                if descending:
+                    order = order[::-1]
+            rows = rows[order]
+        return rows
+
+
+class EncyclopediaIndex:
+    """Tabel move, item, dan ability yang dibangun sekali lalu disimpan ke disk."""
+
+    def __init__(self, tables):
+        self.tables = tables
+
+    def save(self, path=INDEX_PATH):
+        arrays = {f"{kind}.{col}": values for kind, table in self.tables.items() for col, values in table.columns.items()}
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        """Memuat indeks dari disk, atau None jika file belum ada/rusak."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                tables = {
+                    kind: ResourceTable({col: data[f"{kind}.{col}"] for col in COLUMNS[kind]})
+                    for kind in KINDS
+                }
+        except (OSError, ValueError, KeyError):
+            return None
+        return cls(tables)
@@ -0,0 +1,94 @@
+import json
+import os
+import threading
+
+INDEX_PATH = os.environ.get("POKEDEX_EVOLUTION_INDEX_PATH", "evolution_index.json")
+ENCODING = 'utf-8'
+
+
+class EvolutionIndex:
+    """Graf evolusi: species -> chain ID, dan per chain: urutan anggota, stage, serta induknya.
+
+    Semua lookup (keluarga, stage, cek leluhur) berupa akses dict tanpa network.
+    Rantai bercabang (Eevee, Wurmple) disimpan sebagai pohon lewat pointer induk.
+    """
+
+    def __init__(self):
+        self.chains = {}
+        self._species = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, species_name):
+        return species_name in self._species
+
+    def add_chain(self, chain_data):
+        """Menambahkan satu respons /evolution-chain/{id} ke indeks; mengembalikan chain ID."""
+        chain_id = chain_data['id']
+        members = []
+
+        def walk(node, depth, parent):
+            name = node['species']['name']
+            members.append((name, depth, parent))
+            for evo in node.get('evolves_to', []):
+                walk(evo, depth + 1, name)
+
+        walk(chain_data['chain'], 0, None)
+        with self._lock:
+            self._register(chain_id, members)
+        return chain_id
+
+    def _register(self, chain_id, members):
+        self.chains[chain_id] = members
+        for name, depth, parent in members:
+            self._species[name] = (chain_id, depth, parent)
+
+    def chain_id_of(self, species_name):
+        entry = self._species.get(species_name)
+        return entry[0] if entry else None
+
+    def stage(self, species_name):
+        """Kedalaman evolusi: 0 = bentuk dasar, 1 = evolusi pertama, dst."""
+        entry = self._species.get(species_name)
+        return entry[1] if entry else 0
+
+    def family(self, species_name):
+        """Seluruh anggota rantai evolusi (urutan pre-order), atau [species_name] jika tidak dikenal."""
+        entry = self._species.get(species_name)
+        if not entry:
+            return [species_name]
+        return [name for name, _, _ in self.chains[entry[0]]]
+
+    def chain_members(self, chain_id):
+        return [name for name, _, _ in self.chains.get(chain_id, [])]
+
+    def is_ancestor(self, ancestor, species_name):
+        """True jika `ancestor` adalah pra-evolusi (langsung/tidak langsung) dari `species_name`."""
+        entry = self._species.get(species_name)
+        while entry and entry[2]:
+            if entry[2] == ancestor:
+                return True
+            entry = self._species.get(entry[2])
+        return False
+
+    def save(self, path=INDEX_PATH):
+        with self._lock:
+            payload = {str(cid): members for cid, members in self.chains.items()}
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding=ENCODING) as f:
+                json.dump(payload, f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        """Memuat indeks dari disk; indeks kosong jika file belum ada/rusak."""
+        index = cls()
+        if not os.path.exists(path):
+            return index
+        try:
+            with open(path, 'r', encoding=ENCODING) as f:
+                payload = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return index
+        for cid, members in payload.items():
+            index._register(int(cid), [tuple(m) for m in members])
+        return index
@@ -0,0 +1,71 @@
+import os
+
+import numpy as np
+
+GENERATION_COUNT = 9
+INDEX_PATH = os.environ.get("POKEDEX_GENERATION_INDEX_PATH", "generation_index.npz")
+
+# Rentang ID nasional per generasi; hanya dipakai jika indeks belum bisa dibangun.
+FALLBACK_RANGES = {
+    1: (1, 151),
+    2: (152, 251),
+    3: (252, 386),
+    4: (387, 493),
+    5: (494, 649),
+    6: (650, 721),
+    7: (722, 809),
+    8: (810, 905),
+    9: (906, 1025),
+}
+
+
+class GenerationIndex:
+    """Indeks generasi -> array ID species terurut, plus tabel ID -> generasi untuk cek keanggotaan O(1)."""
+
+    def __init__(self, ids_by_gen):
+        self._ids = {gen: np.unique(np.asarray(ids, dtype=np.int32)) for gen, ids in sorted(ids_by_gen.items())}
+        max_id = max((int(ids[-1]) for ids in self._ids.values() if len(ids)), default=0)
+        self._gen_of = np.zeros(max_id + 1, dtype=np.uint8)
+        for gen, ids in self._ids.items():
+            self._gen_of[ids] = gen
+        self._all = np.flatnonzero(self._gen_of).astype(np.int32)
+
+    @classmethod
+    def from_ranges(cls, ranges=FALLBACK_RANGES):
+        return cls({gen: np.arange(start, end + 1) for gen, (start, end) in ranges.items()})
+
+    @property
+    def generations(self):
+        return list(self._ids)
+
+    def ids(self, gen=None):
+        """Array ID terurut untuk satu generasi, atau semua generasi jika gen=None."""
+        if gen is None:
+            return self._all
+        return self._ids.get(gen, np.empty(0, dtype=np.int32))
+
+    def generation_of(self, pokemon_id):
+        """Nomor generasi sebuah ID species (0 jika tidak dikenal)."""
+        return int(self._gen_of[pokemon_id]) if 0 <= pokemon_id < len(self._gen_of) else 0
+
+    def contains_many(self, pokemon_ids, generations):
+        """Mask boolean: apakah tiap ID berasal dari salah satu `generations`."""
+        ids = np.asarray(pokemon_ids, dtype=np.int64)
+        in_range = (ids >= 0) & (ids < len(self._gen_of))
+        gens = np.zeros(len(ids), dtype=np.uint8)
+        gens[in_range] = self._gen_of[ids[in_range]]
+        return np.isin(gens, list(generations))
+
+    def save(self, path=INDEX_PATH):
+        np.savez_compressed(path, **{f"gen{gen}": ids for gen, ids in self._ids.items()})
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        """Memuat indeks dari disk, atau None jika file belum ada/rusak."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                return cls({int(key[3:]): data[key] for key in data.files})
+        except (OSError, ValueError):
+            return None
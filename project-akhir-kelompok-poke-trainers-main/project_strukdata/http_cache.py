@@ -0,0 +1,252 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from pokeapi_store import parse_api_url
+
+CACHE_PATH = os.environ.get("POKEDEX_HTTP_CACHE_PATH", "http_cache.db")
+MAX_BYTES = int(os.environ.get("POKEDEX_HTTP_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+ENCODING = 'utf-8'
+
+DEFAULT_TTL = 24 * 3600
+
+# Waktu akses (untuk LRU) dikumpulkan di memori lalu ditulis per batch,
+# sehingga cache hit tidak menjadi transaksi tulis.
+ACCESS_FLUSH_SIZE = 256
+ACCESS_FLUSH_INTERVAL = 30
+
+# TTL (detik) per resource PokeAPI. Data game hampir tidak pernah berubah,
+# jadi resource statis disimpan lama; daftar/indeks lebih cepat kedaluwarsa.
+RESOURCE_TTLS = {
+    "pokemon": 7 * 24 * 3600,
+    "pokemon-species": 7 * 24 * 3600,
+    "type": 30 * 24 * 3600,
+    "evolution-chain": 30 * 24 * 3600,
+    "move": 30 * 24 * 3600,
+    "item": 30 * 24 * 3600,
+    "ability": 30 * 24 * 3600,
+    "generation": 7 * 24 * 3600,
+    "_list": 24 * 3600,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_access ON responses (last_access);
+"""
+
+_local = threading.local()
+_write_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "revalidated": 0, "stores": 0, "evictions": 0}
+_stats_lock = threading.Lock()
+_pending_access = {}
+_last_access_flush = time.time()
+_total_bytes = None     # total ukuran entri (berjalan); dihitung sekali dengan SUM lalu diperbarui per store
+
+
+def _count(key, n=1):
+    with _stats_lock:
+        _stats[key] += n
+
+
+def get_stats():
+    """Mengembalikan salinan counter hit/miss/eviction cache sejak proses dimulai."""
+    with _stats_lock:
+        stats = dict(_stats)
+    conn = _get_connection()
+    entries, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+    stats["entries"] = entries
+    stats["bytes"] = total
+    return stats
+
+
+def _get_connection():
+    """Koneksi SQLite per-thread ke file cache."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(CACHE_PATH, timeout=10, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        _local.conn = conn
+    return conn
+
+
+def ttl_for_url(url):
+    """Menentukan TTL berdasarkan jenis resource pada URL."""
+    parsed = parse_api_url(url)
+    if not parsed:
+        return DEFAULT_TTL
+    resource, key, _, _ = parsed
+    if not key:
+        return RESOURCE_TTLS["_list"]
+    return RESOURCE_TTLS.get(resource, DEFAULT_TTL)
+
+
+def lookup(url):
+    """Mencari entri cache untuk URL.
+
+    Mengembalikan tuple (data, fresh, validators) atau None jika tidak ada.
+    `validators` berisi header kondisional untuk revalidasi.
+    """
+    try:
+        conn = _get_connection()
+        row = conn.execute(
+            "SELECT body, etag, last_modified, expires_at FROM responses WHERE url = ?", (url,)
+        ).fetchone()
+    except sqlite3.Error as e:
+        # Cache terkunci/read-only/rusak: anggap miss dan lanjut ke network.
+        print(f"HTTP Cache Error: {e}")
+        return None
+    if not row:
+        _count("misses")
+        return None
+    body, etag, last_modified, expires_at = row
+    now = time.time()
+    _touch(url, now)
+    validators = {}
+    if etag:
+        validators["If-None-Match"] = etag
+    if last_modified:
+        validators["If-Modified-Since"] = last_modified
+    try:
+        data = json.loads(zlib.decompress(body).decode(ENCODING))
+    except (zlib.error, ValueError) as e:
+        # Body rusak (tulisan terpotong, file korup): buang barisnya dan anggap miss.
+        print(f"HTTP Cache Error: {e}")
+        _discard(url)
+        _count("misses")
+        return None
+    fresh = expires_at > now
+    _count("hits" if fresh else "misses")
+    return data, fresh, validators
+
+
+def _discard(url):
+    """Menghapus satu entri; total ukuran dihitung ulang pada store berikutnya."""
+    global _total_bytes
+    try:
+        conn = _get_connection()
+        with _write_lock:
+            _pending_access.pop(url, None)
+            conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            conn.commit()
+            _total_bytes = None
+    except sqlite3.Error as e:
+        print(f"HTTP Cache Error: {e}")
+
+
+def _touch(url, now):
+    """Mencatat akses; ditulis ke DB per batch (ACCESS_FLUSH_SIZE / ACCESS_FLUSH_INTERVAL)."""
+    with _write_lock:
+        _pending_access[url] = now
+        if len(_pending_access) < ACCESS_FLUSH_SIZE and now - _last_access_flush < ACCESS_FLUSH_INTERVAL:
+            return
+        try:
+            conn = _get_connection()
+            _flush_access(conn)
+            conn.commit()
+        except sqlite3.Error as e:
+            print(f"HTTP Cache Error: {e}")
+
+
+def _flush_access(conn):
+    """Menulis waktu akses yang tertunda; dipanggil dengan _write_lock dipegang."""
+    global _last_access_flush
+    if _pending_access:
+        conn.executemany(
+            "UPDATE responses SET last_access = ? WHERE url = ?",
+            [(ts, url) for url, ts in _pending_access.items()],
+        )
+        _pending_access.clear()
+    _last_access_flush = time.time()
+
+
+def refresh(url):
+    """Memperpanjang masa berlaku entri setelah server menjawab 304 Not Modified."""
+    now = time.time()
+    try:
+        conn = _get_connection()
+        with _write_lock:
+            conn.execute(
+                "UPDATE responses SET expires_at = ?, last_access = ? WHERE url = ?",
+                (now + ttl_for_url(url), now, url),
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"HTTP Cache Error: {e}")
+        return
+    _count("revalidated")
+
+
+def store(url, data, etag=None, last_modified=None):
+    """Menyimpan respons JSON ke cache lalu menegakkan batas ukuran (LRU)."""
+    body = zlib.compress(json.dumps(data, separators=(',', ':')).encode(ENCODING))
+    if len(body) > MAX_BYTES:
+        return
+    global _total_bytes
+    now = time.time()
+    try:
+        conn = _get_connection()
+        with _write_lock:
+            if _total_bytes is None:
+                _total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            old = conn.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, body, etag, last_modified, now + ttl_for_url(url), len(body), now),
+            )
+            _total_bytes += len(body) - (old[0] if old else 0)
+            if _total_bytes > MAX_BYTES:
+                _evict(conn)
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"HTTP Cache Error: {e}")
+        _total_bytes = None
+        conn = getattr(_local, "conn", None)
+        if conn is not None and conn.in_transaction:
+            conn.rollback()
+        return
+    _count("stores")
+
+
+def _evict(conn):
+    """Menghapus entri yang paling lama tidak diakses sampai total ukuran <= MAX_BYTES.
+
+    Hanya dipanggil saat total berjalan melewati batas; total dihitung ulang dari DB
+    dulu karena proses lain bisa ikut menulis ke file cache yang sama.
+    """
+    global _total_bytes
+    _flush_access(conn)
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+    removed = []
+    if total > MAX_BYTES:
+        for url, size in conn.execute("SELECT url, size FROM responses ORDER BY last_access"):
+            if total <= MAX_BYTES:
+                break
+            removed.append((url,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE url = ?", removed)
+        _count("evictions", len(removed))
+    _total_bytes = total
+
+
+def clear():
+    """Mengosongkan seluruh cache."""
+    global _total_bytes
+    conn = _get_connection()
+    with _write_lock:
+        conn.execute("DELETE FROM responses")
+        conn.commit()
+        _pending_access.clear()
+        _total_bytes = 0
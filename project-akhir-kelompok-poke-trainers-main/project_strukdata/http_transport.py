@@ -0,0 +1,145 @@
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_TIMEOUT = 8
+CONNECT_TIMEOUT = 3
+DEADLINE = 20
+POOL_SIZE = 16
+MAX_CONCURRENCY_PER_HOST = 8
+MAX_RETRIES = 4
+MAX_CONNECT_RETRIES = 1     # host tak terjangkau (offline/DNS): gagal cepat
+BACKOFF_BASE = 0.25
+BACKOFF_MAX = 8.0
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# Batas atas bucket histogram latensi (milidetik); bucket terakhir = tak hingga.
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float("inf"))
+
+
+class TransportError(Exception):
+    """Request gagal setelah seluruh percobaan ulang habis."""
+
+
+_session = None
+_session_lock = threading.Lock()
+_host_semaphores = {}
+_histograms = {}
+_stats_lock = threading.Lock()
+
+
+def get_session():
+    """Session bersama dengan connection pooling (keep-alive) dan gzip."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({
+                    "Accept": "application/json",
+                    "Accept-Encoding": "gzip, deflate",
+                    "User-Agent": "pokedex-streamlit",
+                })
+                _session = session
+    return _session
+
+
+def _host_semaphore(host):
+    """Semaphore per host untuk membatasi jumlah request paralel."""
+    with _session_lock:
+        sem = _host_semaphores.get(host)
+        if sem is None:
+            sem = threading.BoundedSemaphore(MAX_CONCURRENCY_PER_HOST)
+            _host_semaphores[host] = sem
+        return sem
+
+
+def _record_latency(host, elapsed_ms):
+    with _stats_lock:
+        hist = _histograms.setdefault(host, [0] * len(LATENCY_BUCKETS_MS))
+        for i, upper in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= upper:
+                hist[i] += 1
+                break
+
+
+def get_latency_histogram():
+    """Histogram latensi per host: {host: {"<=10ms": n, ..., ">5000ms": n}}."""
+    labels = [f"<={int(b)}ms" for b in LATENCY_BUCKETS_MS[:-1]] + [f">{int(LATENCY_BUCKETS_MS[-2])}ms"]
+    with _stats_lock:
+        return {host: dict(zip(labels, counts)) for host, counts in _histograms.items()}
+
+
+def reset_latency_histogram():
+    with _stats_lock:
+        _histograms.clear()
+
+
+def _backoff_delay(attempt, retry_after=None):
+    """Full-jitter exponential backoff; menghormati header Retry-After bila ada."""
+    if retry_after:
+        try:
+            return min(float(retry_after), BACKOFF_MAX)
+        except ValueError:
+            pass
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def get(url, headers=None, timeout=DEFAULT_TIMEOUT, max_retries=MAX_RETRIES, deadline=DEADLINE):
+    """GET dengan pooling, batas konkurensi per host, dan retry untuk 5xx/429.
+
+    Error koneksi (host tak terjangkau) hanya diulang MAX_CONNECT_RETRIES kali,
+    dan seluruh percobaan termasuk backoff dibatasi `deadline` detik.
+    Mengembalikan objek Response (termasuk 304/404). Melempar TransportError
+    jika semua percobaan gagal karena error jaringan atau status retryable.
+    """
+    host = urlsplit(url).netloc
+    session = get_session()
+    last_error = None
+    connect_failures = 0
+    give_up_at = time.monotonic() + deadline
+    attempt = 0
+
+    for attempt in range(max_retries + 1):
+        remaining = give_up_at - time.monotonic()
+        if remaining <= 0:
+            break
+        retry_after = None
+        with _host_semaphore(host):
+            start = time.perf_counter()
+            try:
+                response = session.get(
+                    url, headers=headers, timeout=(min(CONNECT_TIMEOUT, remaining), min(timeout, remaining))
+                )
+            except requests.ConnectionError as e:
+                last_error = e
+                response = None
+                connect_failures += 1
+            except requests.RequestException as e:
+                last_error = e
+                response = None
+            finally:
+                _record_latency(host, (time.perf_counter() - start) * 1000)
+
+        if response is not None:
+            if response.status_code not in RETRY_STATUS:
+                return response
+            last_error = f"HTTP {response.status_code}"
+            retry_after = response.headers.get("Retry-After")
+        elif connect_failures > MAX_CONNECT_RETRIES:
+            break
+
+        if attempt < max_retries:
+            delay = _backoff_delay(attempt, retry_after)
+            if time.monotonic() + delay >= give_up_at:
+                break
+            time.sleep(delay)
+
+    raise TransportError(f"GET {url} gagal setelah {attempt + 1} percobaan: {last_error}")
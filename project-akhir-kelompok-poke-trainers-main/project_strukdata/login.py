@@ -80,12 +80,9 @@ def show_login_page(login_success_callback=handle_login_success):
             elif len(reg_password) < 6:
                 st.error("Password minimal 6 karakter.")
             else:
-                if register_user(reg_email, reg_password, reg_username):
-                    user_data = authenticate_user(reg_email, reg_password)
-                    if user_data:
-                        st.success(f"Akun {reg_username} berhasil dibuat! Anda sekarang login.")
-                        login_success_callback(user_data, reg_email)
-                    else:
-                         st.error("Pendaftaran berhasil, tetapi gagal login otomatis.")
+                user_data = register_user(reg_email, reg_password, reg_username)
+                if user_data:
+                    st.success(f"Akun {reg_username} berhasil dibuat! Anda sekarang login.")
+                    login_success_callback(user_data, reg_email)
                 else:
-                    st.error("Email ini sudah terdaftar. Coba login.")
+                    st.error("Email atau username ini sudah terdaftar (username tidak membedakan huruf besar/kecil). Coba login.")
@@ -0,0 +1,32 @@
+# Nature -> (stat naik, stat turun); nature netral bernilai (None, None).
+NATURES = {
+    "hardy": (None, None), "lonely": ("attack", "defense"), "brave": ("attack", "speed"),
+    "adamant": ("attack", "special-attack"), "naughty": ("attack", "special-defense"),
+    "bold": ("defense", "attack"), "docile": (None, None), "relaxed": ("defense", "speed"),
+    "impish": ("defense", "special-attack"), "lax": ("defense", "special-defense"),
+    "timid": ("speed", "attack"), "hasty": ("speed", "defense"), "serious": (None, None),
+    "jolly": ("speed", "special-attack"), "naive": ("speed", "special-defense"),
+    "modest": ("special-attack", "attack"), "mild": ("special-attack", "defense"),
+    "quiet": ("special-attack", "speed"), "bashful": (None, None), "rash": ("special-attack", "special-defense"),
+    "calm": ("special-defense", "attack"), "gentle": ("special-defense", "defense"),
+    "sassy": ("special-defense", "speed"), "careful": ("special-defense", "special-attack"), "quirky": (None, None),
+}
+
+STAT_LABELS = {
+    "hp": "HP", "attack": "Atk", "defense": "Def",
+    "special-attack": "Sp. Atk", "special-defense": "Sp. Def", "speed": "Spe",
+}
+
+
+def normalize_nature(nature):
+    """"Adamant " -> "adamant"; None jika bukan nama nature yang dikenal."""
+    key = (nature or "").strip().lower()
+    return key if key in NATURES else None
+
+
+def describe_nature(nature):
+    """"jolly" -> "Jolly (+Spe, -Sp. Atk)"."""
+    up, down = NATURES.get(normalize_nature(nature), (None, None))
+    if not up:
+        return f"{nature.title()} (Netral)"
+    return f"{nature.title()} (+{STAT_LABELS[up]}, -{STAT_LABELS[down]})"
@@ -0,0 +1,77 @@
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import bcrypt
+
+ENCODING = 'utf-8'
+BCRYPT_ROUNDS = int(os.environ.get("POKEDEX_BCRYPT_ROUNDS", 12))
+# Jumlah proses hashing; 0 = hashing langsung di thread pemanggil.
+HASH_WORKERS = int(os.environ.get("POKEDEX_HASH_WORKERS", min(4, os.cpu_count() or 1)))
+
+_COST_PATTERN = re.compile(r"^\$2[abxy]?\$(\d{2})\$")
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _hash(password_bytes, rounds):
+    return bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=rounds))
+
+
+def _check(password_bytes, hashed_bytes):
+    return bcrypt.checkpw(password_bytes, hashed_bytes)
+
+
+def _get_pool():
+    """Process pool terbatas untuk bcrypt, agar sesi lain tidak ikut tertahan."""
+    global _pool
+    if _pool is None and HASH_WORKERS > 0:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    max_workers=HASH_WORKERS, mp_context=multiprocessing.get_context("spawn")
+                )
+    return _pool
+
+
+def _run(fn, *args):
+    global _pool
+    pool = _get_pool()
+    if pool is None:
+        return fn(*args)
+    try:
+        return pool.submit(fn, *args).result()
+    except BrokenProcessPool:
+        with _pool_lock:
+            _pool = None
+        return fn(*args)
+
+
+def hash_password(password, rounds=None):
+    """Membuat hash bcrypt dengan work factor yang dikonfigurasi."""
+    return _run(_hash, password.encode(ENCODING), rounds or BCRYPT_ROUNDS).decode(ENCODING)
+
+
+def verify_password(password, stored_hash):
+    """Memeriksa password terhadap hash bcrypt yang tersimpan."""
+    if not stored_hash:
+        return False
+    try:
+        return _run(_check, password.encode(ENCODING), stored_hash.encode(ENCODING))
+    except ValueError:
+        return False
+
+
+def get_cost(stored_hash):
+    """Work factor (rounds) dari sebuah hash bcrypt, atau None jika formatnya tidak dikenal."""
+    m = _COST_PATTERN.match(stored_hash or "")
+    return int(m.group(1)) if m else None
+
+
+def needs_rehash(stored_hash):
+    """True jika hash dibuat dengan work factor yang berbeda dari konfigurasi saat ini."""
+    return get_cost(stored_hash) != BCRYPT_ROUNDS
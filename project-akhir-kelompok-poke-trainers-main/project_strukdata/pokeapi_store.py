@@ -0,0 +1,187 @@
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import zlib
+
+STORE_PATH = os.environ.get("POKEDEX_STORE_PATH", "pokeapi_mirror.db")
+ENCODING = 'utf-8'
+
+# Resource PokeAPI yang di-mirror ke store lokal.
+MIRRORED_RESOURCES = (
+    "pokemon",
+    "pokemon-species",
+    "type",
+    "evolution-chain",
+    "move",
+    "item",
+    "ability",
+    "generation",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    resource TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    name TEXT,
+    body BLOB NOT NULL,
+    PRIMARY KEY (resource, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_resources_name ON resources (resource, name);
+"""
+
+_URL_PATTERN = re.compile(r"/api/v2/([a-z0-9-]+)/?([^/?]*)/?([a-z-]*)/?(?:\?(.*))?$")
+
+_local = threading.local()
+
+
+def _connect(path=None, readonly=True):
+    """Membuka koneksi SQLite ke store (read-only secara default)."""
+    path = path or STORE_PATH
+    if readonly:
+        return sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+    conn = sqlite3.connect(path)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _get_connection():
+    """Koneksi read-only per-thread agar aman dipakai dari thread pool."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _connect()
+        _local.conn = conn
+    return conn
+
+
+def is_available(path=None):
+    """True jika file store sudah ada di disk."""
+    return os.path.exists(path or STORE_PATH)
+
+
+def _pack(data):
+    return zlib.compress(json.dumps(data, separators=(',', ':')).encode(ENCODING), 9)
+
+
+def _unpack(blob):
+    return json.loads(zlib.decompress(blob).decode(ENCODING))
+
+
+def parse_api_url(url):
+    """Memecah URL PokeAPI menjadi (resource, key, sub_resource, query)."""
+    m = _URL_PATTERN.search(url or "")
+    if not m:
+        return None
+    resource, key, sub, query = m.groups()
+    return resource, key.lower(), sub, query or ""
+
+
+def get_resource(resource, key):
+    """Mengambil satu resource dari store berdasarkan ID atau nama."""
+    conn = _get_connection()
+    if str(key).isdigit():
+        row = conn.execute(
+            "SELECT body FROM resources WHERE resource = ? AND id = ?", (resource, int(key))
+        ).fetchone()
+    else:
+        row = conn.execute(
+            "SELECT body FROM resources WHERE resource = ? AND name = ?", (resource, str(key).lower())
+        ).fetchone()
+    return _unpack(row[0]) if row else None
+
+
+def list_resource(resource, limit=None, offset=0):
+    """Membangun respons daftar ala `/{resource}?limit=..` dari isi store."""
+    conn = _get_connection()
+    total = conn.execute("SELECT COUNT(*) FROM resources WHERE resource = ?", (resource,)).fetchone()[0]
+    rows = conn.execute(
+        "SELECT id, name FROM resources WHERE resource = ? ORDER BY id LIMIT ? OFFSET ?",
+        (resource, -1 if limit is None else int(limit), int(offset)),
+    ).fetchall()
+    return {
+        "count": total,
+        "next": None,
+        "previous": None,
+        "results": [
+            {"name": name, "url": f"https://pokeapi.co/api/v2/{resource}/{rid}/"} for rid, name in rows
+        ],
+    }
+
+
+def fetch_from_store(url):
+    """Melayani URL PokeAPI sepenuhnya dari store lokal, tanpa network."""
+    parsed = parse_api_url(url)
+    if not parsed or not is_available():
+        return None
+    resource, key, sub, query = parsed
+    if resource not in MIRRORED_RESOURCES or sub:
+        return None
+    try:
+        if not key:
+            params = dict(p.split('=', 1) for p in query.split('&') if '=' in p)
+            return list_resource(resource, params.get("limit"), params.get("offset", 0))
+        return get_resource(resource, key)
+    except (sqlite3.Error, ValueError, zlib.error):
+        return None
+
+
+def _iter_dump_files(dump_dir, resource):
+    """Mencari file JSON untuk satu resource di dalam direktori dump.
+
+    Mendukung layout repo `api-data` (`api/v2/<resource>/<id>/index.json`)
+    maupun layout datar (`<resource>/<id>.json`).
+    """
+    for base in (os.path.join(dump_dir, "api", "v2", resource), os.path.join(dump_dir, resource)):
+        if not os.path.isdir(base):
+            continue
+        for entry in os.scandir(base):
+            if entry.is_dir():
+                path = os.path.join(entry.path, "index.json")
+                if os.path.isfile(path):
+                    yield path
+            elif entry.name.endswith(".json") and entry.name != "index.json":
+                yield entry.path
+        return
+
+
+def ingest_dump(dump_dir, store_path=None, resources=MIRRORED_RESOURCES, batch_size=500):
+    """Mengimpor resource PokeAPI dari direktori dump ke store SQLite.
+
+    Mengembalikan dict jumlah record yang diimpor per resource.
+    """
+    conn = _connect(store_path, readonly=False)
+    counts = {}
+    try:
+        for resource in resources:
+            rows = []
+            counts[resource] = 0
+            for path in _iter_dump_files(dump_dir, resource):
+                with open(path, 'r', encoding=ENCODING) as f:
+                    data = json.load(f)
+                if not isinstance(data, dict) or "id" not in data:
+                    continue
+                name = data.get("name")
+                rows.append((resource, int(data["id"]), name.lower() if name else None, _pack(data)))
+                if len(rows) >= batch_size:
+                    conn.executemany("INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?)", rows)
+                    counts[resource] += len(rows)
+                    rows = []
+            if rows:
+                conn.executemany("INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?)", rows)
+                counts[resource] += len(rows)
+            conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    return counts
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python pokeapi_store.py <dump_dir> [store_path]")
+        sys.exit(1)
+    result = ingest_dump(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    for res, n in result.items():
+        print(f"{res}: {n}")
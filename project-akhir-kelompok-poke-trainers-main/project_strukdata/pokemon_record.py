@@ -0,0 +1,56 @@
+STAT_NAMES = ("hp", "attack", "defense", "special-attack", "special-defense", "speed")
+
+
+class PokemonRecord:
+    """Proyeksi ringkas dari payload /pokemon: hanya field yang dipakai halaman.
+
+    Payload penuh (moves, game_indices, dst.) tidak disimpan; ambil lewat
+    `components.get_pokemon_full` bila benar-benar dibutuhkan.
+    """
+
+    __slots__ = ("id", "name", "types", "abilities", "stats", "artwork", "sprite", "species_url")
+
+    def __init__(self, id, name, types, abilities, stats, artwork, sprite, species_url):
+        self.id = id
+        self.name = name
+        self.types = types
+        self.abilities = abilities
+        self.stats = stats
+        self.artwork = artwork
+        self.sprite = sprite
+        self.species_url = species_url
+
+    @classmethod
+    def from_api(cls, data):
+        """Membuat record dari JSON /pokemon PokeAPI."""
+        sprites = data.get('sprites') or {}
+        base_stats = {s['stat']['name']: s['base_stat'] for s in data.get('stats', [])}
+        return cls(
+            id=data['id'],
+            name=data['name'],
+            types=tuple(t['type']['name'] for t in sorted(data.get('types', []), key=lambda t: t.get('slot', 0))),
+            abilities=tuple(a['ability']['name'] for a in data.get('abilities', [])),
+            stats=tuple(base_stats.get(s, 0) for s in STAT_NAMES),
+            artwork=sprites.get('other', {}).get('official-artwork', {}).get('front_default'),
+            sprite=sprites.get('front_default'),
+            species_url=(data.get('species') or {}).get('url'),
+        )
+
+    @property
+    def image(self):
+        """Artwork resmi, atau sprite default sebagai cadangan."""
+        return self.artwork or self.sprite
+
+    @property
+    def stat_dict(self):
+        return dict(zip(STAT_NAMES, self.stats))
+
+    def __getstate__(self):
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __setstate__(self, state):
+        for slot, value in zip(self.__slots__, state):
+            setattr(self, slot, value)
+
+    def __repr__(self):
+        return f"PokemonRecord(#{self.id} {self.name})"
@@ -0,0 +1,77 @@
+import re
+from bisect import bisect_left
+from collections import defaultdict
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]")
+
+
+def normalize(text):
+    """Huruf kecil tanpa spasi/tanda baca: "Mr. Mime" dan "mr-mime" -> "mrmime"."""
+    return _NON_ALNUM.sub("", (text or "").lower())
+
+
+def _trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """Indeks pencarian nama di memori: prefix (array terurut) + inverted index trigram.
+
+    Dibangun sekali dari daftar nama; pencarian tidak menyentuh network.
+    """
+
+    def __init__(self, names, min_similarity=0.3):
+        self.names = list(dict.fromkeys(names))
+        self.min_similarity = min_similarity
+        self._keys = [normalize(n) for n in self.names]
+        order = sorted(range(len(self.names)), key=lambda i: self._keys[i])
+        self._sorted_keys = [self._keys[i] for i in order]
+        self._sorted_ids = order
+        self._gram_counts = []
+        self._postings = defaultdict(list)
+        for idx, key in enumerate(self._keys):
+            grams = _trigrams(key)
+            self._gram_counts.append(len(grams))
+            for g in grams:
+                self._postings[g].append(idx)
+
+    def __len__(self):
+        return len(self.names)
+
+    def exact(self, query):
+        """Nama yang sama persis setelah normalisasi, atau None."""
+        key = normalize(query)
+        pos = bisect_left(self._sorted_keys, key)
+        if pos < len(self._sorted_keys) and self._sorted_keys[pos] == key:
+            return self.names[self._sorted_ids[pos]]
+        return None
+
+    def search(self, query, limit=10):
+        """Daftar nama terurut relevansi: exact > prefix > mirip (toleran typo)."""
+        key = normalize(query)
+        if not key:
+            return []
+        scores = {}
+
+        pos = bisect_left(self._sorted_keys, key)
+        while pos < len(self._sorted_keys) and self._sorted_keys[pos].startswith(key):
+            idx = self._sorted_ids[pos]
+            # Prefix selalu di atas hasil fuzzy; nama lebih pendek lebih relevan.
+            scores[idx] = 2.0 + (1.0 if self._keys[idx] == key else 1.0 / len(self._keys[idx]))
+            pos += 1
+
+        query_grams = _trigrams(key)
+        overlap = defaultdict(int)
+        for g in query_grams:
+            for idx in self._postings.get(g, ()):
+                overlap[idx] += 1
+        for idx, shared in overlap.items():
+            if idx in scores:
+                continue
+            similarity = 2.0 * shared / (len(query_grams) + self._gram_counts[idx])
+            if similarity >= self.min_similarity:
+                scores[idx] = similarity
+
+        ranked = sorted(scores, key=lambda i: (-scores[i], self._keys[i]))
+        return [self.names[i] for i in ranked[:limit]]
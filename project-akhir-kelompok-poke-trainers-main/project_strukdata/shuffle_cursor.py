@@ -0,0 +1,86 @@
+import random
+
+
+class FeistelPermutation:
+    """Permutasi acak (ber-seed) atas [0, n) yang bisa diakses per indeks dalam O(1).
+
+    Memakai jaringan Feistel pada domain 2^bits >= n dengan cycle-walking,
+    sehingga tidak perlu membangun/mengacak list berisi n elemen.
+    """
+
+    def __init__(self, n, seed, rounds=4):
+        self.n = n
+        bits = max(2, (max(n, 1) - 1).bit_length())
+        bits += bits % 2
+        self._half = bits // 2
+        self._mask = (1 << self._half) - 1
+        rng = random.Random(seed)
+        self._keys = [rng.getrandbits(32) for _ in range(rounds)]
+
+    def _round(self, x, key):
+        x = ((x ^ key) * 0x9E3779B1) & 0xFFFFFFFF
+        x ^= x >> 15
+        return x & self._mask
+
+    def _encrypt(self, x):
+        left, right = x >> self._half, x & self._mask
+        for key in self._keys:
+            left, right = right, left ^ self._round(right, key)
+        return (left << self._half) | right
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.n:
+            raise IndexError(i)
+        x = self._encrypt(i)
+        while x >= self.n:
+            x = self._encrypt(x)
+        return x
+
+
+class ShuffledBatchCursor:
+    """Cursor batch acak atas sebuah urutan ID (range, list, atau array).
+
+    `next_batch` dan `page` berjalan dalam O(batch_size); tidak ada
+    pemindaian ID yang sudah ditampilkan.
+    """
+
+    def __init__(self, ids, batch_size=12, seed=None):
+        self.ids = ids
+        self.batch_size = batch_size
+        self.position = 0
+        self.reseed(seed)
+
+    @property
+    def total(self):
+        return len(self.ids)
+
+    @property
+    def exhausted(self):
+        return self.position >= self.total
+
+    def reseed(self, seed=None):
+        """Mengacak ulang urutan dan kembali ke awal."""
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self._perm = FeistelPermutation(len(self.ids), self.seed)
+        self.position = 0
+
+    def _slice(self, start, stop):
+        return [int(self.ids[self._perm[i]]) for i in range(start, min(stop, self.total))]
+
+    def page(self, k):
+        """ID pada halaman ke-k (0-based) tanpa menggeser cursor."""
+        start = k * self.batch_size
+        return self._slice(start, start + self.batch_size)
+
+    def next_batch(self):
+        """Batch berikutnya, lalu cursor maju."""
+        batch = self._slice(self.position, self.position + self.batch_size)
+        self.position += len(batch)
+        return batch
+
+    def seek_page(self, k):
+        """Lompat langsung ke halaman k (untuk infinite scroll)."""
+        self.position = min(k * self.batch_size, self.total)
@@ -0,0 +1,87 @@
+import numpy as np
+
+from natures import NATURES, normalize_nature
+from pokemon_record import STAT_NAMES
+
+MAX_IV = 31
+MAX_EV = 252
+LEVELS = (50, 100)
+
+# Spread Speed untuk tabel speed tier: nama -> (IV, EV, multiplier nature).
+SPEED_SPREADS = {
+    "Max+ (252 EV, +Spe)": (MAX_IV, MAX_EV, 1.1),
+    "Max Netral (252 EV)": (MAX_IV, MAX_EV, 1.0),
+    "Tanpa Investasi (0 EV)": (MAX_IV, 0, 1.0),
+    "Min- (0 IV, 0 EV, -Spe)": (0, 0, 0.9),
+}
+SPREAD_NAMES = tuple(SPEED_SPREADS)
+_SPEED = STAT_NAMES.index("speed")
+
+
+def nature_multipliers(nature):
+    """Multiplier nature per stat berbentuk (6,): 1.1 untuk stat naik, 0.9 untuk stat turun."""
+    mult = np.ones(len(STAT_NAMES))
+    up, down = NATURES.get(normalize_nature(nature), (None, None))
+    if up:
+        mult[STAT_NAMES.index(up)] = 1.1
+        mult[STAT_NAMES.index(down)] = 0.9
+    return mult
+
+
+def spread_array(values, default=0):
+    """{"attack": 252, ...} -> array (6,) sesuai STAT_NAMES."""
+    return np.array([values.get(s, default) for s in STAT_NAMES], dtype=np.int64)
+
+
+def compute_stats(base, level=50, ivs=MAX_IV, evs=0, nature_mult=1.0):
+    """Stat akhir generasi modern untuk banyak species sekaligus.
+
+    base: (S, 6) base stat; ivs/evs/nature_mult: skalar, (6,), atau (S, 6).
+    HP = floor((2B + IV + EV/4) * L / 100) + L + 10 (Shedinja tetap 1);
+    stat lain = floor((floor((2B + IV + EV/4) * L / 100) + 5) * nature).
+    """
+    base = np.asarray(base, dtype=np.int64)
+    ivs = np.broadcast_to(np.asarray(ivs, dtype=np.int64), base.shape)
+    evs = np.broadcast_to(np.asarray(evs, dtype=np.int64), base.shape)
+    # Nature dihitung dalam persepuluhan agar pembulatan ke bawah sama persis dengan game.
+    nature_tenths = np.broadcast_to(np.rint(np.asarray(nature_mult, dtype=np.float64) * 10).astype(np.int64), base.shape)
+
+    core = (2 * base + ivs + evs // 4) * level // 100
+    stats = (core + 5) * nature_tenths // 10
+    hp = core[..., 0] + level + 10
+    stats[..., 0] = np.where(base[..., 0] == 1, 1, hp)
+    return stats
+
+
+class SpeedTiers:
+    """Tabel speed seluruh dex pada satu level untuk setiap spread di SPEED_SPREADS.
+
+    Kolom sudah diurutkan sehingga "berapa banyak yang lebih lambat dari X"
+    dijawab dengan binary search.
+    """
+
+    def __init__(self, names, base_stats, level=50):
+        self.names = np.asarray(names, dtype=str)
+        self.level = level
+        base_speed = np.asarray(base_stats, dtype=np.int64)[:, _SPEED]
+        self.speeds = np.stack([
+            compute_stats(np.repeat(base_speed[:, None], len(STAT_NAMES), axis=1), level, iv, ev, nature)[:, _SPEED]
+            for iv, ev, nature in SPEED_SPREADS.values()
+        ], axis=1)                                                        # (S, n_spread)
+        self._sorted = np.sort(self.speeds, axis=0)
+
+    def speed_of(self, base_speed, iv=MAX_IV, ev=MAX_EV, nature_mult=1.1):
+        base = np.full((1, len(STAT_NAMES)), base_speed)
+        return int(compute_stats(base, self.level, iv, ev, nature_mult)[0, _SPEED])
+
+    def outspeed_counts(self, speed, spread=SPREAD_NAMES[0]):
+        """(lebih lambat, sama cepat, lebih cepat) dibanding seluruh dex pada spread lawan."""
+        column = self._sorted[:, SPREAD_NAMES.index(spread)]
+        slower = int(np.searchsorted(column, speed, side="left"))
+        not_faster = int(np.searchsorted(column, speed, side="right"))
+        return slower, not_faster - slower, len(column) - not_faster
+
+    def compare(self, speed, spread=SPREAD_NAMES[0]):
+        """Kecepatan seluruh dex pada spread lawan, dan -1/0/1 (lebih lambat/sama/lebih cepat dari `speed`)."""
+        speeds = self.speeds[:, SPREAD_NAMES.index(spread)]
+        return speeds, np.sign(speeds - speed)
@@ -0,0 +1,85 @@
+import json
+import os
+from collections import defaultdict
+
+import numpy as np
+
+from type_chart import ATTACKING_TYPES, defensive_multipliers, encode_type_combos
+
+RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "synergy_rules.json")
+ENCODING = 'utf-8'
+
+
+class SynergyRuleSet:
+    """Kumpulan aturan sinergi berbasis data dengan indeks atribut -> aturan.
+
+    Setiap aturan punya daftar kondisi `all`; tiap kondisi cocok jika ada anggota
+    tim yang memiliki salah satu nilai (species/ability/move/type) yang disebut.
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+        self._by_attribute = defaultdict(set)
+        for i, rule in enumerate(rules):
+            for condition in rule["all"]:
+                for kind, values in condition.items():
+                    for value in values:
+                        self._by_attribute[(kind, value)].add(i)
+
+    @classmethod
+    def load(cls, path=RULES_PATH):
+        with open(path, 'r', encoding=ENCODING) as f:
+            return cls(json.load(f))
+
+    @property
+    def uses_moves(self):
+        return any(kind == "move" for kind, _ in self._by_attribute)
+
+    def evaluate(self, team_attributes):
+        """Aturan yang terpenuhi oleh atribut tim (set pasangan (jenis, nilai)).
+
+        Hanya aturan yang disebut oleh salah satu atribut tim yang diperiksa,
+        sehingga biaya sebanding dengan ukuran tim, bukan jumlah aturan.
+        """
+        candidates = set()
+        for attribute in team_attributes:
+            candidates |= self._by_attribute.get(attribute, set())
+        fired = []
+        for i in sorted(candidates):
+            rule = self.rules[i]
+            if all(
+                any((kind, value) in team_attributes for kind, values in cond.items() for value in values)
+                for cond in rule["all"]
+            ):
+                fired.append(rule)
+        return fired
+
+
+def team_attributes(details, moves_by_name=None):
+    """Indeks atribut tim sekali jalan: {("species", nama), ("ability", x), ("type", t), ("move", m)}."""
+    attributes = set()
+    for detail in details:
+        attributes.add(("species", detail.name))
+        attributes.update(("ability", a) for a in detail.abilities)
+        attributes.update(("type", t) for t in detail.types)
+        for move in (moves_by_name or {}).get(detail.name, ()):
+            attributes.add(("move", move))
+    return attributes
+
+
+def coverage_heatmap(matrix, details):
+    """Heatmap cakupan tim dalam satu operasi vektor.
+
+    Mengembalikan (defensive (T, 18), offensive (T, 18)): multiplier damage yang
+    diterima tiap anggota dari 18 tipe, dan multiplier STAB terbaik tiap anggota
+    ke 18 tipe tunggal.
+    """
+    n_attack = len(ATTACKING_TYPES)
+    idx = encode_type_combos([d.types for d in details])
+    defensive = defensive_multipliers(matrix, idx)
+
+    offense = np.zeros((matrix.shape[0] + 1, n_attack), dtype=matrix.dtype)
+    offense[:n_attack] = matrix[:n_attack, :n_attack]
+    stab = np.where(idx < n_attack, idx, matrix.shape[0])   # slot kosong/Stellar -> baris nol
+    offensive = offense[stab].max(1)
+    return defensive, offensive
@@ -0,0 +1,158 @@
+import numpy as np
+
+from type_chart import ATTACKING_TYPES, TYPE_INDEX
+
+TEAM_SIZE = 6
+N_ATTACK = len(ATTACKING_TYPES)
+
+DEFAULT_WEIGHTS = {
+    "defensive": 1.0,
+    "offensive": 1.0,
+    "stats": 1.0,
+    "balance": 0.3,
+    "speed": 0.3,
+    "theme_type": 0.0,
+}
+
+# Kata kunci tema -> penyesuaian bobot skor.
+THEME_KEYWORDS = {
+    ("offense", "offensive", "agresif", "serang", "sweeper"): {"offensive": 1.6, "speed": 0.6, "defensive": 0.7},
+    ("defense", "defensive", "stall", "bertahan", "tank"): {"defensive": 1.6, "offensive": 0.7, "speed": 0.1},
+    ("trick room",): {"speed": -0.6},
+    ("balance", "balanced", "seimbang"): {"balance": 0.6},
+}
+
+
+def theme_weights(theme):
+    """Bobot skor dan tipe favorit berdasarkan teks tema (mis. "Hyper Offense", "tim api")."""
+    weights = dict(DEFAULT_WEIGHTS)
+    text = (theme or "").lower()
+    for keywords, overrides in THEME_KEYWORDS.items():
+        if any(k in text for k in keywords):
+            weights.update(overrides)
+    favored = [t for t in ATTACKING_TYPES if t in text]
+    if favored:
+        weights["theme_type"] = 0.5
+    return weights, favored
+
+
+def score_teams(type_idx, stats, matrix, weights=DEFAULT_WEIGHTS, favored_types=()):
+    """Skor sekumpulan tim sekaligus.
+
+    type_idx: (B, T, 2) indeks tipe; stats: (B, T, 6) base stat.
+    Mengembalikan (total (B,), dict komponen -> (B,)).
+    """
+    t1, t2 = type_idx[..., 0], type_idx[..., 1]
+    n_members = type_idx.shape[1]
+
+    # Defensif: berapa tipe penyerang yang mengenai lebih banyak anggota secara super efektif
+    # daripada yang ditahan.
+    attack = matrix[:N_ATTACK]
+    taken = np.moveaxis(attack[:, t1] * attack[:, t2], 0, -1)          # (B, T, 18)
+    exposure = np.clip((taken > 1).sum(1) - (taken < 1).sum(1), 0, 3)   # (B, 18)
+    defensive = 1.0 - exposure.mean(1) / 3.0
+
+    # Ofensif (STAB): multiplier terbaik yang bisa diberikan tim ke tiap tipe tunggal.
+    offense = np.zeros((matrix.shape[0] + 1, N_ATTACK), dtype=matrix.dtype)
+    offense[:N_ATTACK] = matrix[:N_ATTACK, :N_ATTACK]
+    stab = type_idx.reshape(type_idx.shape[0], -1)                     # (B, 2T)
+    stab = np.where(stab < N_ATTACK, stab, matrix.shape[0])            # slot kosong/Stellar -> baris nol
+    best = offense[stab].max(1)                                        # (B, 18)
+    offensive = 0.7 * (best >= 2).mean(1) + 0.3 * (best >= 1).mean(1)
+
+    # Statistik: rata-rata BST, keseimbangan fisik/spesial, dan kecepatan.
+    stats = stats.astype(np.float32)
+    bst = stats.sum(-1).mean(1) / 600.0
+    physical = (stats[..., 1] >= stats[..., 3]).sum(1)
+    balance = 1.0 - np.abs(2 * physical - n_members) / n_members
+    speed = stats[..., 5].mean(1) / 150.0
+
+    components = {
+        "defensive": defensive,
+        "offensive": offensive,
+        "stats": bst,
+        "balance": balance,
+        "speed": speed,
+    }
+    if favored_types:
+        favored_idx = [TYPE_INDEX[t] for t in favored_types]
+        components["theme_type"] = np.isin(type_idx, favored_idx).any(-1).mean(1)
+
+    total = sum(weights.get(name, 0.0) * value for name, value in components.items())
+    return total, components
+
+
+def optimize_team(cand_types, cand_stats, fixed_types, fixed_stats, matrix,
+                  allowed=None, groups=None, fixed_groups=(), theme="",
+                  team_size=TEAM_SIZE, max_passes=4):
+    """Melengkapi tim dengan greedy lalu local search (swap) atas semua kandidat.
+
+    cand_types (N, 2), cand_stats (N, 6): kandidat dari dex.
+    fixed_types/fixed_stats: anggota yang sudah dimiliki (tidak diganti).
+    allowed (N,) bool: kandidat yang boleh dipilih (mis. bukan garis evolusi terlarang).
+    groups (N,) int: ID rantai evolusi; satu tim tidak boleh memuat dua ID yang sama.
+
+    Mengembalikan (indeks kandidat terpilih, skor total, breakdown komponen).
+    """
+    weights, favored = theme_weights(theme)
+    n = len(cand_types)
+    allowed = np.ones(n, dtype=bool) if allowed is None else allowed.copy()
+    groups = np.arange(n) if groups is None else np.asarray(groups)
+    fixed_types = np.asarray(fixed_types, dtype=np.intp).reshape(-1, 2)
+    fixed_stats = np.asarray(fixed_stats, dtype=np.float32).reshape(-1, cand_stats.shape[1])
+    allowed &= ~np.isin(groups, list(fixed_groups))
+
+    def evaluate(chosen, slot, candidates):
+        """Skor tim `chosen` dengan posisi `slot` diganti tiap kandidat (slot=None: ditambahkan)."""
+        base = list(chosen)
+        if slot is None:
+            base.append(0)
+            slot = len(base) - 1
+        picks = np.repeat(np.array(base, dtype=np.intp)[None, :], len(candidates), axis=0)
+        picks[:, slot] = candidates
+        types = np.concatenate([np.broadcast_to(fixed_types, (len(candidates),) + fixed_types.shape),
+                                cand_types[picks]], axis=1)
+        stats = np.concatenate([np.broadcast_to(fixed_stats, (len(candidates),) + fixed_stats.shape),
+                                cand_stats[picks]], axis=1)
+        return score_teams(types, stats, matrix, weights, favored)[0]
+
+    def open_candidates(chosen, skip_slot=None):
+        mask = allowed.copy()
+        taken = [c for i, c in enumerate(chosen) if i != skip_slot]
+        mask[taken] = False
+        mask &= ~np.isin(groups, groups[taken])
+        return np.flatnonzero(mask)
+
+    chosen = []
+    for _ in range(max(0, team_size - len(fixed_types))):
+        candidates = open_candidates(chosen)
+        if not len(candidates):
+            break
+        chosen.append(int(candidates[np.argmax(evaluate(chosen, None, candidates))]))
+
+    for _ in range(max_passes):
+        improved = False
+        current = _score_chosen(chosen, fixed_types, fixed_stats, cand_types, cand_stats, matrix, weights, favored)[0]
+        for slot in range(len(chosen)):
+            candidates = open_candidates(chosen, skip_slot=slot)
+            if not len(candidates):
+                continue
+            scores = evaluate(chosen, slot, candidates)
+            i = int(np.argmax(scores))
+            if scores[i] > current + 1e-6:
+                chosen[slot] = int(candidates[i])
+                current = float(scores[i])
+                improved = True
+        if not improved:
+            break
+
+    total, components = _score_chosen(chosen, fixed_types, fixed_stats, cand_types, cand_stats, matrix, weights, favored)
+    return chosen, total, components
+
+
+def _score_chosen(chosen, fixed_types, fixed_stats, cand_types, cand_stats, matrix, weights, favored):
+    idx = np.array(chosen, dtype=np.intp)
+    types = np.concatenate([fixed_types, cand_types[idx]])[None]
+    stats = np.concatenate([fixed_stats, cand_stats[idx].astype(np.float32)])[None]
+    total, components = score_teams(types, stats, matrix, weights, favored)
+    return float(total[0]), {name: float(value[0]) for name, value in components.items()}
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modul aplikasi berupa file datar di direktori induk (tanpa package).
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,35 @@
+import time
+
+import numpy as np
+
+from capture_sim import simulate_strategy, summarize
+from catch_engine import BALLS, STATUSES, capture_probability
+from type_chart import encode_type_combos
+
+TYPE_IDX = encode_type_combos([("normal",)])[0]
+
+
+def _p(capture_rate, ball, status="None"):
+    a = capture_rate * (1.0 / 3.0) * BALLS[ball][0] * STATUSES[status]   # HP penuh: (3M - 2M) / 3M
+    return float(capture_probability(np.float64(a)))
+
+
+def test_single_ball_plan_matches_geometric_and_is_fast():
+    start = time.perf_counter()
+    result = simulate_strategy(["Great Ball"], 120, TYPE_IDX, trials=1_000_000, seed=0)
+    elapsed = time.perf_counter() - start
+    assert elapsed < 1.0
+
+    p = _p(120, "Great Ball")
+    summary = summarize(result)
+    np.testing.assert_allclose(summary["capture_rate"], 1.0 - (1.0 - p) ** 50, atol=1e-5)
+    np.testing.assert_allclose(summary["balls"]["mean"], 1.0 / p, rtol=0.01)
+    np.testing.assert_allclose(result["balls"][result["caught"]].mean(), summary["balls"]["mean"])
+
+
+def test_missed_status_move_is_retried():
+    # Thunder Wave 90%: trial yang meleset mengulang move sebelum melempar, jadi semua
+    # lemparan terjadi saat paralyzed dan jumlah ball mengikuti geometrik 1/p_paralyzed.
+    result = simulate_strategy(["Thunder Wave", "Ultra Ball"], 45, TYPE_IDX, trials=200_000, seed=1)
+    p = _p(45, "Ultra Ball", "Paralyzed, Poisoned, Burned")
+    np.testing.assert_allclose(summarize(result)["balls"]["mean"], 1.0 / p, rtol=0.02)
@@ -0,0 +1,24 @@
+import numpy as np
+
+from catch_engine import capture_probability, critical_chance, shake_probability
+
+
+def test_critical_chance_matches_reference():
+    # Referensi Gen V+: a = 255, > 600 tertangkap -> floor(255 * 2.5 / 6) = 106.
+    assert critical_chance(255.0, 601) == 106 / 256
+    # a = 100, > 150 tertangkap -> floor(100 * 1.0 / 6) = 16.
+    assert critical_chance(100.0, 151) == 16 / 256
+    # a = 45, > 30 tertangkap -> floor(45 * 0.5 / 6) = 3.
+    assert critical_chance(45.0, 31) == 3 / 256
+
+
+def test_no_critical_below_first_threshold():
+    assert critical_chance(255.0, 30) == 0.0
+
+
+def test_capture_probability_combines_critical_and_shakes():
+    a = np.array([45.0])
+    shake = shake_probability(a)
+    crit = 18 / 256  # floor(45 * 2.5 / 6)
+    expected = crit * shake + (1 - crit) * shake ** 4
+    np.testing.assert_allclose(capture_probability(a, 601), expected)
@@ -0,0 +1,37 @@
+import threading
+
+import pytest
+
+import http_cache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, "CACHE_PATH", str(tmp_path / "http_cache.db"))
+    monkeypatch.setattr(http_cache, "_local", threading.local())
+    monkeypatch.setattr(http_cache, "_total_bytes", None)
+    http_cache._pending_access.clear()
+    return http_cache
+
+
+def test_store_and_lookup_roundtrip(cache):
+    url = "https://pokeapi.co/api/v2/pokemon/1"
+    cache.store(url, {"name": "bulbasaur"}, etag='"abc"')
+    data, fresh, validators = cache.lookup(url)
+    assert data == {"name": "bulbasaur"}
+    assert fresh
+    assert validators == {"If-None-Match": '"abc"'}
+
+
+def test_corrupt_row_is_discarded_as_miss(cache):
+    url = "https://pokeapi.co/api/v2/pokemon/1"
+    cache.store(url, {"name": "bulbasaur"})
+    conn = cache._get_connection()
+    conn.execute("UPDATE responses SET body = ? WHERE url = ?", (b"bukan zlib", url))
+    conn.commit()
+
+    assert cache.lookup(url) is None
+    assert conn.execute("SELECT COUNT(*) FROM responses WHERE url = ?", (url,)).fetchone()[0] == 0
+    # Store berikutnya tetap berjalan (total ukuran dihitung ulang).
+    cache.store(url, {"name": "bulbasaur"})
+    assert cache.lookup(url)[0] == {"name": "bulbasaur"}
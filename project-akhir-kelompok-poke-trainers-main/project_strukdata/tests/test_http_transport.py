@@ -0,0 +1,93 @@
+import socket
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import http_transport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """/status/<kode>: selalu kode itu; /flaky/<kode>/<n>: kode itu n kali lalu 200; /slow/<detik>."""
+
+    hits = Counter()
+    hits_lock = threading.Lock()
+
+    def do_GET(self):
+        with self.hits_lock:
+            self.hits[self.path] += 1
+            count = self.hits[self.path]
+        parts = self.path.strip("/").split("/")
+        status = 200
+        if parts[0] == "status":
+            status = int(parts[1])
+        elif parts[0] == "flaky" and count <= int(parts[2]):
+            status = int(parts[1])
+        elif parts[0] == "slow":
+            time.sleep(float(parts[1]))
+        body = b"{}"
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fast_backoff(monkeypatch):
+    monkeypatch.setattr(http_transport, "BACKOFF_BASE", 0.001)
+    _Handler.hits.clear()
+
+
+@pytest.mark.parametrize("status", [503, 429])
+def test_retries_retryable_status_until_success(server, status):
+    path = f"/flaky/{status}/2"
+    response = http_transport.get(server + path)
+    assert response.status_code == 200
+    assert _Handler.hits[path] == 3
+
+
+def test_gives_up_after_max_retries(server):
+    with pytest.raises(http_transport.TransportError, match="gagal setelah 3 percobaan"):
+        http_transport.get(server + "/status/500", max_retries=2)
+    assert _Handler.hits["/status/500"] == 3
+
+
+def test_404_is_not_retried(server):
+    response = http_transport.get(server + "/status/404")
+    assert response.status_code == 404
+    assert _Handler.hits["/status/404"] == 1
+
+
+def test_connection_refused_fails_fast():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]    # port ditutup lagi: koneksi akan ditolak
+    start = time.monotonic()
+    with pytest.raises(http_transport.TransportError,
+                       match=f"gagal setelah {http_transport.MAX_CONNECT_RETRIES + 1} percobaan"):
+        http_transport.get(f"http://127.0.0.1:{port}/")
+    assert time.monotonic() - start < 2.0
+
+
+def test_deadline_bounds_total_time(server):
+    start = time.monotonic()
+    with pytest.raises(http_transport.TransportError):
+        http_transport.get(server + "/slow/2", deadline=0.5)
+    assert time.monotonic() - start < 1.5
@@ -0,0 +1,84 @@
+import threading
+
+from write_behind import WriteBehindQueue
+
+
+class BlockingStore:
+    """Store palsu: update_many bisa ditahan untuk mensimulasikan commit yang lambat."""
+
+    def __init__(self, users):
+        self.users = {email: dict(record) for email, record in users.items()}
+        self.release = threading.Event()
+        self.writing = threading.Event()
+        self.release.set()
+
+    def get(self, email):
+        record = self.users.get(email)
+        return {k: list(v) if isinstance(v, list) else v for k, v in record.items()} if record else None
+
+    def update_many(self, changes):
+        self.writing.set()
+        self.release.wait(5)
+        for email, fields in changes.items():
+            self.users.setdefault(email, {}).update(fields)
+
+
+def _queue(store):
+    return WriteBehindQueue(store, flush_interval=3600)
+
+
+def test_inflight_batch_stays_visible_until_commit():
+    store = BlockingStore({"a@x.com": {"saved_deck": []}})
+    queue = _queue(store)
+    queue.submit("a@x.com", {"saved_deck": ["Pikachu"]})
+
+    store.release.clear()
+    flusher = threading.Thread(target=queue.flush)
+    flusher.start()
+    assert store.writing.wait(5)
+
+    # Commit masih tertahan: pembacaan tetap melihat perubahan yang sedang ditulis.
+    assert queue.pending_for("a@x.com") == {"saved_deck": ["Pikachu"]}
+    assert queue.read("a@x.com", store.get)["saved_deck"] == ["Pikachu"]
+
+    store.release.set()
+    flusher.join(5)
+    assert queue.pending_for("a@x.com") == {}
+    assert queue.read("a@x.com", store.get)["saved_deck"] == ["Pikachu"]
+    queue.close()
+
+
+def test_deck_append_during_flush_is_not_lost():
+    store = BlockingStore({"a@x.com": {"saved_deck": []}})
+    queue = _queue(store)
+    queue.submit("a@x.com", {"saved_deck": ["Pikachu"]})
+
+    store.release.clear()
+    flusher = threading.Thread(target=queue.flush)
+    flusher.start()
+    assert store.writing.wait(5)
+
+    # Read-modify-write seperti data_manager.save_user_profile saat batch masih in-flight.
+    deck = queue.read("a@x.com", store.get)["saved_deck"]
+    queue.submit("a@x.com", {"saved_deck": deck + ["Eevee"]})
+
+    store.release.set()
+    flusher.join(5)
+    queue.close()
+    assert store.users["a@x.com"]["saved_deck"] == ["Pikachu", "Eevee"]
+
+
+def test_failed_flush_requeues_without_overwriting_newer_changes():
+    store = BlockingStore({})
+    queue = _queue(store)
+    queue.submit("a@x.com", {"saved_deck": ["Pikachu"], "search_history": ["x"]})
+
+    original = store.update_many
+    store.update_many = lambda changes: (_ for _ in ()).throw(RuntimeError("locked"))
+    assert queue.flush() is False
+    queue.submit("a@x.com", {"saved_deck": ["Eevee"]})
+    assert queue.pending_for("a@x.com") == {"saved_deck": ["Eevee"], "search_history": ["x"]}
+
+    store.update_many = original
+    queue.close()
+    assert store.users["a@x.com"] == {"saved_deck": ["Eevee"], "search_history": ["x"]}
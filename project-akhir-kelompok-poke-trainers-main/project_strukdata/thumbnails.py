@@ -0,0 +1,122 @@
+import base64
+import io
+import os
+import threading
+from collections import OrderedDict
+
+from PIL import Image
+
+import http_transport
+
+# Thumbnail disimpan di bawah static/ agar bisa dilayani Streamlit (enableStaticServing).
+# Streamlit melayani static/ di samping script utama, bukan di direktori kerja.
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+THUMB_DIR = os.environ.get("POKEDEX_THUMB_DIR", os.path.join(STATIC_DIR, "thumbnails"))
+THUMB_SIZES = (220, 50)
+WEBP_QUALITY = 80
+MIME_TYPES = {"webp": "image/webp", "png": "image/png"}
+# Tanpa static serving hanya thumbnail kecil (ikon) yang di-inline sebagai data URI;
+# yang lebih besar memakai URL asli agar payload HTML tiap rerun tidak membengkak.
+DATA_URI_MAX_BYTES = 8 * 1024
+DATA_URI_CACHE_SIZE = 512
+
+_data_uris = OrderedDict()
+_id_locks = {}
+_locks_lock = threading.Lock()
+
+
+def _lock_for(pokemon_id):
+    with _locks_lock:
+        return _id_locks.setdefault(pokemon_id, threading.Lock())
+
+
+def _existing_variant(pokemon_id, size):
+    for ext in MIME_TYPES:
+        path = os.path.join(THUMB_DIR, f"{pokemon_id}-{size}.{ext}")
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _save_atomic(image, path, fmt, **params):
+    tmp_path = f"{path}.tmp"
+    image.save(tmp_path, format=fmt, **params)
+    os.replace(tmp_path, path)
+
+
+def render_variants(pokemon_id, raw):
+    """Membuat semua ukuran thumbnail dari bytes artwork asli (WebP, PNG jika WebP tidak didukung)."""
+    with Image.open(io.BytesIO(raw)) as source:
+        image = source.convert("RGBA")
+    os.makedirs(THUMB_DIR, exist_ok=True)
+    for size in THUMB_SIZES:
+        thumb = image.copy()
+        thumb.thumbnail((size, size), Image.LANCZOS)
+        base = os.path.join(THUMB_DIR, f"{pokemon_id}-{size}")
+        try:
+            _save_atomic(thumb, f"{base}.webp", "WEBP", quality=WEBP_QUALITY, method=6)
+        except (OSError, KeyError):
+            _save_atomic(thumb, f"{base}.png", "PNG", optimize=True)
+
+
+def has_thumbnail(pokemon_id, size):
+    """True jika thumbnail ukuran `size` sudah ada di disk."""
+    return _existing_variant(pokemon_id, size) is not None
+
+
+def ensure_thumbnail(pokemon_id, source_url, size):
+    """Path thumbnail lokal; artwork diunduh sekali dan semua ukuran dibuat sekaligus.
+
+    Mengembalikan None jika artwork gagal diambil atau diproses.
+    """
+    path = _existing_variant(pokemon_id, size)
+    if path:
+        return path
+    with _lock_for(pokemon_id):
+        path = _existing_variant(pokemon_id, size)
+        if path:
+            return path
+        try:
+            r = http_transport.get(source_url, headers={"Accept": "image/*"})
+            if r.status_code != 200:
+                return None
+            render_variants(pokemon_id, r.content)
+        except (http_transport.TransportError, OSError) as e:
+            print(f"Thumbnail Error: {e}")
+            return None
+    return _existing_variant(pokemon_id, size)
+
+
+def thumbnail_src(pokemon_id, source_url, size, static_serving=False):
+    """URL gambar untuk ukuran tampilan `size`.
+
+    Dengan static serving: path `app/static/...`. Tanpa itu: data URI (LRU di
+    memori) hanya untuk file <= DATA_URI_MAX_BYTES, selebihnya URL asli. Jika
+    thumbnail gagal dibuat, URL asli dikembalikan (cek dengan `has_thumbnail`).
+    """
+    if not source_url:
+        return source_url
+    path = ensure_thumbnail(pokemon_id, source_url, size)
+    if path is None:
+        return source_url
+
+    relative = os.path.relpath(path, STATIC_DIR)
+    if static_serving and not relative.startswith(os.pardir):
+        return "app/static/" + relative.replace(os.sep, "/")
+
+    key = (pokemon_id, size)
+    with _locks_lock:
+        uri = _data_uris.get(key)
+        if uri is not None:
+            _data_uris.move_to_end(key)
+            return uri
+    if os.path.getsize(path) > DATA_URI_MAX_BYTES:
+        return source_url
+    with open(path, 'rb') as f:
+        encoded = base64.b64encode(f.read()).decode('ascii')
+    uri = f"data:{MIME_TYPES[path.rsplit('.', 1)[1]]};base64,{encoded}"
+    with _locks_lock:
+        _data_uris[key] = uri
+        if len(_data_uris) > DATA_URI_CACHE_SIZE:
+            _data_uris.popitem(last=False)
+    return uri
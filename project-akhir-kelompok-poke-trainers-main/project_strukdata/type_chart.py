@@ -0,0 +1,71 @@
+import numpy as np
+
+# 18 tipe utama (urutan ID PokeAPI) ditambah Stellar dan "unknown".
+ATTACKING_TYPES = (
+    "normal", "fighting", "flying", "poison", "ground", "rock",
+    "bug", "ghost", "steel", "fire", "water", "grass",
+    "electric", "psychic", "ice", "dragon", "dark", "fairy",
+)
+TYPE_NAMES = ATTACKING_TYPES + ("stellar", "unknown")
+TYPE_INDEX = {name: i for i, name in enumerate(TYPE_NAMES)}
+
+# Kolom tambahan bernilai 1.0 untuk Pokémon bertipe tunggal.
+_NO_TYPE = len(TYPE_NAMES)
+
+
+def build_type_matrix(relations_by_type):
+    """Membangun matriks efektivitas M[penyerang, bertahan] dari damage_relations PokeAPI.
+
+    `relations_by_type` memetakan nama tipe -> dict `damage_relations`.
+    Matriks memiliki satu kolom ekstra (semua 1.0) untuk slot tipe kosong.
+    """
+    matrix = np.ones((len(TYPE_NAMES), len(TYPE_NAMES) + 1), dtype=np.float32)
+    for defender, rel in relations_by_type.items():
+        d = TYPE_INDEX.get(defender)
+        if d is None or not rel:
+            continue
+        for key, value in (("double_damage_from", 2.0), ("half_damage_from", 0.5), ("no_damage_from", 0.0)):
+            for attacker in rel.get(key, []):
+                a = TYPE_INDEX.get(attacker['name'])
+                if a is not None:
+                    matrix[a, d] = value
+    return matrix
+
+
+def encode_type_combos(type_combos):
+    """Mengubah daftar kombinasi tipe (1-2 nama) menjadi array indeks berbentuk (n, 2)."""
+    idx = np.full((len(type_combos), 2), _NO_TYPE, dtype=np.intp)
+    for row, combo in enumerate(type_combos):
+        for col, name in enumerate(list(combo)[:2]):
+            idx[row, col] = TYPE_INDEX.get(name, TYPE_INDEX["unknown"])
+    return idx
+
+
+def defensive_multipliers(matrix, type_combos):
+    """Multiplier damage yang diterima tiap kombinasi tipe dari 18 tipe penyerang.
+
+    Mengembalikan array (n_combo, 18); bisa menerima array indeks hasil
+    `encode_type_combos` agar encoding tidak diulang.
+    """
+    idx = type_combos if isinstance(type_combos, np.ndarray) else encode_type_combos(type_combos)
+    attack = matrix[:len(ATTACKING_TYPES)]
+    return (attack[:, idx[:, 0]] * attack[:, idx[:, 1]]).T
+
+
+def offensive_multipliers(matrix, attacking_types, type_combos):
+    """Multiplier damage dari setiap tipe penyerang ke setiap kombinasi tipe: (n_attack, n_combo)."""
+    attackers = np.array([TYPE_INDEX[t] for t in attacking_types], dtype=np.intp)
+    idx = type_combos if isinstance(type_combos, np.ndarray) else encode_type_combos(type_combos)
+    return matrix[attackers][:, idx[:, 0]] * matrix[attackers][:, idx[:, 1]]
+
+
+def summarize_matchups(multipliers):
+    """Memecah baris multiplier menjadi dict weaknesses/resistances/immunities per kombinasi."""
+    summaries = []
+    for row in np.atleast_2d(multipliers):
+        summaries.append({
+            "weaknesses": {ATTACKING_TYPES[i]: float(row[i]) for i in np.flatnonzero(row > 1)},
+            "resistances": {ATTACKING_TYPES[i]: float(row[i]) for i in np.flatnonzero((row < 1) & (row > 0))},
+            "immunities": [ATTACKING_TYPES[i] for i in np.flatnonzero(row == 0)],
+        })
+    return summaries
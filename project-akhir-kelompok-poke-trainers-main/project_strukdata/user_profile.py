@@ -1,6 +1,6 @@
 import streamlit as st
 from data_manager import save_user_profile, get_user_data
-from components import pokemon_card_html, get_pokemon_detail
+from components import pokemon_grid_html, get_pokemon_details_bulk
 import time
 
 def logout_user():
@@ -81,16 +81,14 @@ def show_user_account():
     st.header("🛡️ Tim Pokémon Tersimpan (Saved Teams)")
     
     if st.session_state.saved_teams:
+        all_team_members = [name for team in st.session_state.saved_teams.values() for name in team]
+        details_by_name = dict(zip(all_team_members, get_pokemon_details_bulk(all_team_members)))
+
         for team_name, team_list in st.session_state.saved_teams.items():
             st.subheader(f"Tim: {team_name}")
             
-            cols = st.columns(len(team_list))
-            
-            for i, pokemon_name in enumerate(team_list):
-                detail = get_pokemon_detail(pokemon_name.lower().strip())
-                if detail:
-                    with cols[i]:
-                        st.markdown(pokemon_card_html(detail, include_id=False), unsafe_allow_html=True)
+            team_details = [details_by_name.get(pokemon_name) for pokemon_name in team_list]
+            st.markdown(pokemon_grid_html(team_details, include_id=False), unsafe_allow_html=True)
                         
             st.button("Hapus Tim", key=f"del_team_{team_name}", on_click=delete_team, args=(team_name,), type="secondary")
             st.markdown("---")
@@ -0,0 +1,250 @@
+import json
+import os
+import sqlite3
+import threading
+
+ENCODING = 'utf-8'
+
+# Kolom yang disimpan sebagai JSON di backend SQLite.
+JSON_FIELDS = ("profile", "saved_deck", "saved_teams", "search_history")
+USER_FIELDS = ("username", "password") + JSON_FIELDS
+
+# Kebijakan durabilitas: kapan data dipaksa (fsync) ke disk.
+#   "off"    - serahkan ke OS (tercepat, bisa hilang saat crash OS)
+#   "normal" - fsync pada checkpoint WAL (default)
+#   "full"   - fsync di setiap commit
+DURABILITY_LEVELS = {"off": "OFF", "normal": "NORMAL", "full": "FULL"}
+
+
+class JsonUserStore:
+    """Backend lama: seluruh pengguna dalam satu file JSON."""
+
+    def __init__(self, path, durability="normal"):
+        self.path = path
+        self.durability = durability
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding=ENCODING) as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            return {}
+
+    def _save(self, users):
+        with open(self.path, 'w', encoding=ENCODING) as f:
+            json.dump(users, f, indent=4)
+            if self.durability == "full":
+                f.flush()
+                os.fsync(f.fileno())
+
+    def get(self, email):
+        return self._load().get(email)
+
+    def create(self, email, record):
+        with self._lock:
+            users = self._load()
+            if email in users:
+                return False
+            users[email] = record
+            self._save(users)
+            return True
+
+    def update(self, email, fields):
+        with self._lock:
+            users = self._load()
+            if email not in users:
+                return False
+            users[email].update(fields)
+            self._save(users)
+            return True
+
+    def update_many(self, changes):
+        """Menerapkan perubahan banyak pengguna dengan satu kali tulis file."""
+        with self._lock:
+            users = self._load()
+            for email, fields in changes.items():
+                if email in users:
+                    users[email].update(fields)
+            self._save(users)
+
+    def find_email_by_username(self, username):
+        for email, user_data in self._load().items():
+            if user_data.get("username", "").lower() == username.lower():
+                return email
+        return None
+
+    def all_users(self):
+        return self._load().items()
+
+    def username_conflicts(self):
+        """Backend JSON tidak menegakkan username unik, jadi tidak ada konflik migrasi."""
+        return []
+
+
+class SqliteUserStore:
+    """Backend default: satu baris per pengguna dengan indeks username (lowercase) unik."""
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS users (
+        email TEXT PRIMARY KEY,
+        username TEXT NOT NULL,
+        username_lower TEXT UNIQUE,
+        password TEXT NOT NULL,
+        profile TEXT NOT NULL DEFAULT '{}',
+        saved_deck TEXT NOT NULL DEFAULT '[]',
+        saved_teams TEXT NOT NULL DEFAULT '{}',
+        search_history TEXT NOT NULL DEFAULT '[]'
+    );
+    CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    );
+    """
+
+    def __init__(self, path, legacy_json_path=None, durability="normal"):
+        self.path = path
+        self.synchronous = DURABILITY_LEVELS.get(durability, "NORMAL")
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.executescript(self._SCHEMA)
+        if legacy_json_path:
+            self.migrate_from_json(legacy_json_path)
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={self.synchronous}")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _to_row(email, record):
+        return (
+            email,
+            record.get("username", ""),
+            record.get("username", "").lower() or None,
+            record.get("password", ""),
+            json.dumps(record.get("profile", {})),
+            json.dumps(record.get("saved_deck", [])),
+            json.dumps(record.get("saved_teams", {})),
+            json.dumps(record.get("search_history", [])),
+        )
+
+    @staticmethod
+    def _from_row(row):
+        record = {"username": row[0], "password": row[1]}
+        for field, value in zip(JSON_FIELDS, row[2:]):
+            record[field] = json.loads(value)
+        return record
+
+    def get(self, email):
+        row = self._connection().execute(
+            f"SELECT {', '.join(USER_FIELDS)} FROM users WHERE email = ?", (email,)
+        ).fetchone()
+        return self._from_row(row) if row else None
+
+    def create(self, email, record):
+        """Menambah pengguna baru; False jika email atau username sudah dipakai."""
+        conn = self._connection()
+        try:
+            with conn:
+                conn.execute("INSERT INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?)", self._to_row(email, record))
+        except sqlite3.IntegrityError:
+            return False
+        return True
+
+    @staticmethod
+    def _assignments(fields):
+        assignments, values = [], []
+        for field, value in fields.items():
+            if field not in USER_FIELDS:
+                continue
+            assignments.append(f"{field} = ?")
+            values.append(json.dumps(value) if field in JSON_FIELDS else value)
+            if field == "username":
+                assignments.append("username_lower = ?")
+                values.append(value.lower() or None)
+        return assignments, values
+
+    def update(self, email, fields):
+        """Memperbarui hanya kolom yang diberikan dalam satu transaksi atomik."""
+        assignments, values = self._assignments(fields)
+        if not assignments:
+            return self.get(email) is not None
+        conn = self._connection()
+        try:
+            with conn:
+                cur = conn.execute(
+                    f"UPDATE users SET {', '.join(assignments)} WHERE email = ?", (*values, email)
+                )
+        except sqlite3.IntegrityError:
+            return False
+        return cur.rowcount == 1
+
+    def update_many(self, changes):
+        """Menerapkan perubahan banyak pengguna dalam satu transaksi (satu fsync)."""
+        conn = self._connection()
+        with conn:
+            for email, fields in changes.items():
+                assignments, values = self._assignments(fields)
+                if assignments:
+                    conn.execute(f"UPDATE users SET {', '.join(assignments)} WHERE email = ?", (*values, email))
+
+    def find_email_by_username(self, username):
+        row = self._connection().execute(
+            "SELECT email FROM users WHERE username_lower = ?", (username.lower(),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def all_users(self):
+        rows = self._connection().execute(f"SELECT email, {', '.join(USER_FIELDS)} FROM users")
+        return ((row[0], self._from_row(row[1:])) for row in rows)
+
+    def migrate_from_json(self, json_path):
+        """Migrasi satu kali dari users.json; ditandai di tabel meta agar tidak diulang.
+
+        Akun yang username-nya bentrok (beda huruf besar/kecil) tetap dimigrasikan
+        tanpa indeks username, dicatat di tabel meta, dan bisa dilihat lewat
+        `username_conflicts()`.
+        """
+        conn = self._connection()
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'migrated_from_json'").fetchone():
+            return 0
+        migrated = 0
+        conflicts = []
+        with conn:
+            for email, record in JsonUserStore(json_path).all_users():
+                if conn.execute("SELECT 1 FROM users WHERE email = ?", (email,)).fetchone():
+                    continue
+                row = self._to_row(email, record)
+                try:
+                    conn.execute("INSERT INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row)
+                except sqlite3.IntegrityError:
+                    # Username ganda (beda huruf besar/kecil): simpan tanpa indeks username.
+                    print(f"User store: username '{record.get('username')}' ganda, login hanya via email untuk {email}.")
+                    conn.execute("INSERT INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row[:2] + (None,) + row[3:])
+                    conflicts.append({"email": email, "username": record.get("username", "")})
+                migrated += 1
+            conn.execute("INSERT INTO meta VALUES ('migrated_from_json', ?)", (json_path,))
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('username_conflicts', ?)", (json.dumps(conflicts),))
+        return migrated
+
+    def username_conflicts(self):
+        """Akun hasil migrasi dengan username ganda: [{"email": ..., "username": ...}].
+
+        Akun ini hanya bisa login via email sampai username-nya diganti.
+        """
+        row = self._connection().execute("SELECT value FROM meta WHERE key = 'username_conflicts'").fetchone()
+        return json.loads(row[0]) if row else []
+
+
+def create_user_store(backend, sqlite_path, json_path, durability="normal"):
+    """Factory backend penyimpanan pengguna: "sqlite" (default) atau "json"."""
+    if backend == "json":
+        return JsonUserStore(json_path, durability=durability)
+    return SqliteUserStore(sqlite_path, legacy_json_path=json_path, durability=durability)
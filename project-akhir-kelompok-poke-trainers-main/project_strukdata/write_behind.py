@@ -0,0 +1,107 @@
+import atexit
+import threading
+
+
+class WriteBehindQueue:
+    """Antrian write-behind untuk perubahan data pengguna.
+
+    Perubahan untuk email yang sama digabung (field terakhir menang) dan
+    ditulis ke store dalam satu transaksi oleh thread latar belakang, baik
+    setiap `flush_interval` detik atau saat jumlah pengguna tertunda mencapai
+    `max_batch`. Antrian dikosongkan saat proses berhenti.
+    """
+
+    def __init__(self, store, flush_interval=1.0, max_batch=64):
+        self.store = store
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._pending = {}
+        self._inflight = {}     # batch yang sedang ditulis; tetap terlihat sampai commit selesai
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="pokedex-write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, email, fields):
+        """Menjadwalkan perubahan field untuk satu pengguna."""
+        # Cek `_closed` dan enqueue dalam satu lock: perubahan yang masuk antrian
+        # selalu terlihat oleh flush terakhir di `close`.
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._pending.setdefault(email, {}).update(fields)
+                full = len(self._pending) >= self.max_batch
+        if closed:
+            self.store.update_many({email: dict(fields)})
+            return
+        if full:
+            self._wakeup.set()
+
+    def _unwritten(self, email):
+        return {**self._inflight.get(email, {}), **self._pending.get(email, {})}
+
+    def pending_for(self, email):
+        """Salinan perubahan yang belum tercommit (tertunda + sedang ditulis) untuk email ini."""
+        with self._lock:
+            return self._unwritten(email)
+
+    def read(self, email, load):
+        """`load(email)` digabung dengan perubahan yang belum tercommit (read-your-writes).
+
+        Dijalankan di bawah lock antrian sehingga tidak ada celah antara commit
+        batch dan pembacaan store yang membuat hasilnya basi.
+        """
+        with self._lock:
+            data = load(email)
+            if data is not None:
+                data.update(self._unwritten(email))
+            return data
+
+    def flush(self):
+        """Menulis semua perubahan tertunda ke store sekarang juga; False jika penulisan gagal."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                self._inflight = batch
+            if not batch:
+                return True
+            try:
+                self.store.update_many(batch)
+            except Exception as e:
+                print(f"Write-behind Error: {e}")
+                with self._lock:
+                    # Kembalikan ke antrian tanpa menimpa perubahan yang lebih baru.
+                    for email, fields in batch.items():
+                        self._pending[email] = {**fields, **self._pending.get(email, {})}
+                    self._inflight = {}
+                return False
+            with self._lock:
+                self._inflight = {}
+            return True
+
+    def _run(self):
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def close(self):
+        """Menghentikan thread dan mengosongkan antrian (dipanggil saat shutdown).
+
+        Flush terakhir dicoba ulang sekali; jika tetap gagal, email yang datanya
+        hilang dicetak agar bisa ditelusuri.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wakeup.set()
+        self._thread.join(timeout=5)
+        if self.flush() or self.flush():
+            return
+        with self._lock:
+            lost = sorted(self._pending)
+        print(f"Write-behind Error: perubahan untuk {len(lost)} pengguna tidak tersimpan: {', '.join(lost)}")